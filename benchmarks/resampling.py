@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+"""
+Compares the NumPy polyphase resampler used by ``AudioData.get_raw_data`` against ``audioop.ratecv``.
+
+Run with ``python benchmarks/resampling.py [SECONDS]``; reports the time taken to convert SECONDS (default 600) of 16-bit noise from common capture rates to 16 kHz, and how much of a tone above the output Nyquist frequency leaks through as aliasing.
+"""
+
+import audioop
+import sys
+import timeit
+
+import numpy as np
+
+from speech_recognition.resampling import resample_raw
+
+RATE_PAIRS = [(44100, 16000), (48000, 16000), (22050, 16000), (8000, 16000)]
+
+
+def rms(raw_data):
+    samples = np.frombuffer(raw_data, dtype="<i2").astype(np.float64)
+    return np.sqrt(np.mean(samples ** 2))
+
+
+def main(seconds):
+    rng = np.random.default_rng(0)
+    print(f"{'conversion':>16} {'polyphase':>10} {'ratecv':>10} {'alias (polyphase / ratecv)':>28}")
+    for from_rate, to_rate in RATE_PAIRS:
+        noise = (rng.standard_normal(from_rate * seconds) * 3000).astype("<i2").tobytes()
+        polyphase = min(timeit.repeat(lambda: resample_raw(noise, 2, from_rate, to_rate), number=1, repeat=3))
+        ratecv = min(timeit.repeat(lambda: audioop.ratecv(noise, 2, 1, from_rate, to_rate, None), number=1, repeat=3))
+
+        alias = ""
+        if to_rate < from_rate:
+            # a tone between the output and input Nyquist frequencies should be filtered out entirely
+            frequency = to_rate / 2 + (from_rate - to_rate) / 6
+            tone = (10000 * np.sin(2 * np.pi * frequency * np.arange(from_rate) / from_rate)).astype("<i2").tobytes()
+            alias = "{:.1f} / {:.1f}".format(
+                rms(resample_raw(tone, 2, from_rate, to_rate)),
+                rms(audioop.ratecv(tone, 2, 1, from_rate, to_rate, None)[0]),
+            )
+        print(f"{from_rate:>7} -> {to_rate:<6} {polyphase:>9.3f}s {ratecv:>9.3f}s {alias:>28}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 600)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+"""
+Compares the NumPy and librosa silence detection of ``AudioData.split(max_bytes, silence_aware=True)``.
+
+Run with ``python benchmarks/split.py [HOURS]``; reports the time taken and peak memory used to split HOURS (default 2) of synthetic 16 kHz 16-bit speech (bursts of tones separated by pauses) into chunks of various sizes, and how far apart the cut points of the two backends are. The librosa column is skipped if librosa isn't installed.
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import speech_recognition as sr
+
+SAMPLE_RATE = 16000
+MAX_BYTES = [24 * 1024 * 1024, 4 * 1024 * 1024, 1024 * 1024]
+
+
+def synthetic_speech(hours):
+    """Returns ``hours`` of bursts of 0.5 to 4 seconds of tones at varying levels, separated by 0.2 to 1.5 seconds of faint noise, built a burst at a time to keep memory down."""
+    rng = np.random.default_rng(0)
+    total_samples = int(hours * 3600 * SAMPLE_RATE)
+    pcm = np.empty(total_samples, dtype="<i2")
+    position = 0
+    while position < total_samples:
+        burst = np.arange(int(rng.uniform(0.5, 4) * SAMPLE_RATE))
+        tone = rng.uniform(1000, 20000) * np.sin(2 * np.pi * rng.uniform(100, 400) * burst / SAMPLE_RATE)
+        pause = rng.standard_normal(int(rng.uniform(0.2, 1.5) * SAMPLE_RATE)) * 5
+        for part in (tone, pause):
+            part = part[:total_samples - position]
+            pcm[position:position + len(part)] = part
+            position += len(part)
+    return sr.AudioData(pcm.tobytes(), SAMPLE_RATE, 2)
+
+
+def measure(audio, max_bytes, silence_backend):
+    tracemalloc.start()
+    start = time.perf_counter()
+    chunks = audio.split(max_bytes, silence_aware=True, silence_backend=silence_backend)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    cuts = np.cumsum([len(chunk.frame_data) // audio.sample_width for chunk in chunks])
+    return elapsed, peak, cuts
+
+
+def main(hours):
+    try:
+        from librosa.effects import split  # noqa: F401
+    except Exception as exc:
+        print("librosa unavailable, only timing the NumPy backend: {}".format(exc))
+        backends = ["numpy"]
+    else:
+        backends = ["numpy", "librosa"]
+
+    audio = synthetic_speech(hours)
+    print(f"{'max_bytes':>10} {'chunks':>7} " + " ".join(f"{backend + ' time':>13} {backend + ' peak':>13}" for backend in backends) + (f" {'cut difference':>15}" if len(backends) > 1 else ""))
+    for max_bytes in MAX_BYTES:
+        results = [measure(audio, max_bytes, backend) for backend in backends]
+        row = f"{max_bytes:>10} {len(results[0][2]):>7} " + " ".join(f"{elapsed:>12.2f}s {peak / 2 ** 20:>11.1f}MB" for elapsed, peak, _ in results)
+        if len(results) > 1 and len(results[0][2]) == len(results[1][2]):
+            difference = np.abs(results[0][2] - results[1][2]).mean() / SAMPLE_RATE * 1000
+            row += f" {difference:>13.1f}ms"
+        elif len(results) > 1:
+            row += f" {'different count':>15}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 2)
@@ -5,31 +5,39 @@
 from __future__ import annotations
 
 import aifc
+import asyncio
 import audioop
 import base64
 import collections
+import dataclasses
 import hashlib
 import hmac
 import io
+import itertools
 import json
 import math
 import os
 from pathlib import Path
+import queue
 import subprocess
 import sys
 import tempfile
 import threading
 import time
+import traceback
 import uuid
 import wave
 from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
-from .audio import AudioData, get_flac_converter
+from . import clients, flac, transport, wavfile
+from .audio import AudioData, get_flac_converter, stream_wav_data
 from .exceptions import (
     RequestError,
+    SetupError,
     TranscriptionFailed,
     TranscriptionNotReady,
     UnknownValueError,
@@ -66,7 +74,7 @@ class Microphone(AudioSource):
 
     Higher ``sample_rate`` values result in better audio quality, but also more bandwidth (and therefore, slower recognition). Additionally, some CPUs, such as those in older Raspberry Pi models, can't keep up if this value is too high.
 
-    Higher ``chunk_size`` values help avoid triggering on rapidly changing ambient noise, but also makes detection less sensitive. This value, generally, should be left at its default.
+    Higher ``chunk_size`` values help avoid triggering on rapidly changing ambient noise, but also makes detection less sensitive. This value, generally, should be left at its default. To detect the ends of phrases more precisely without making smaller reads from the device, set ``recognizer_instance.frame_duration`` instead.
     """
     def __init__(self, device_index=None, sample_rate=None, chunk_size=1024):
         assert device_index is None or isinstance(device_index, int), "Device index must be None or an integer"
@@ -209,16 +217,28 @@ class AudioFile(AudioSource):
 
     Note that functions that read from the audio (such as ``recognizer_instance.record`` or ``recognizer_instance.listen``) will move ahead in the stream. For example, if you execute ``recognizer_instance.record(audiofile_instance, duration=10)`` twice, the first time it will return the first 10 seconds of audio, and the second time it will return the 10 seconds of audio right after that. This is always reset to the beginning when entering an ``AudioFile`` context.
 
-    WAV files must be in PCM/LPCM format; WAVE_FORMAT_EXTENSIBLE and compressed WAV are not supported and may result in undefined behaviour.
+    WAV files must be in PCM/LPCM format; compressed WAV is not supported and may result in undefined behaviour. WAVE_FORMAT_EXTENSIBLE is only supported for files given as paths.
+
+    WAV files given as paths are memory-mapped with ``speech_recognition.wavfile.MappedWavReader``, so reading them returns views of the file instead of copies of it.
 
     Both AIFF and AIFF-C (compressed AIFF) formats are supported.
 
     FLAC files must be in native FLAC format; OGG-FLAC is not supported and may result in undefined behaviour.
+
+    If the ``flac`` extra (``soundfile``) is installed, FLAC files are decoded in-process, incrementally as the audio is read, so long recordings are never held in memory all at once. Otherwise, the whole file is decoded up front by the ``flac`` command line tool.
+
+    Stereo audio is converted to mono by adding the two channels together, unless ``channel`` is given, in which case only that channel (0 for left, 1 for right) is used. If NumPy is installed, byte order conversion, 24-bit samples, and channel conversion are all handled in a single vectorized pass over the audio read.
+
+    The audio is read in chunks of ``chunk_size`` frames. Larger chunks mean less overhead per chunk; to keep detecting the ends of phrases precisely with large chunks, set ``recognizer_instance.frame_duration``.
     """
 
-    def __init__(self, filename_or_fileobject):
+    def __init__(self, filename_or_fileobject, channel=None, chunk_size=4096):
         assert isinstance(filename_or_fileobject, (type(""), type(u""))) or hasattr(filename_or_fileobject, "read"), "Given audio file must be a filename string or a file-like object"
+        assert channel is None or channel in (0, 1), "Channel must be ``None``, 0, or 1"
+        assert isinstance(chunk_size, int) and chunk_size > 0, "Chunk size must be a positive integer"
         self.filename_or_fileobject = filename_or_fileobject
+        self.channel = channel
+        self.chunk_size = chunk_size
         self.stream = None
         self.DURATION = None
 
@@ -230,44 +250,31 @@ class AudioFile(AudioSource):
 
     def __enter__(self):
         assert self.stream is None, "This audio source is already inside a context manager"
+        # failed attempts to read the file in one format move ahead in file-like objects, so we need to go back before trying the next one
+        position = None if isinstance(self.filename_or_fileobject, str) else flac.tell(self.filename_or_fileobject)
+        # PCM WAV files on the filesystem are memory-mapped, so that reading them doesn't copy any frames
+        self.audio_reader = wavfile.open_reader(self.filename_or_fileobject) if isinstance(self.filename_or_fileobject, str) else None
         try:
             # attempt to read the file as WAV
-            self.audio_reader = wave.open(self.filename_or_fileobject, "rb")
+            if self.audio_reader is None: self.audio_reader = wave.open(self.filename_or_fileobject, "rb")
             self.little_endian = True  # RIFF WAV is a little-endian format (most ``audioop`` operations assume that the frames are stored in little-endian form)
         except (wave.Error, EOFError):
             try:
                 # attempt to read the file as AIFF
+                if position is not None: self.filename_or_fileobject.seek(position)
                 self.audio_reader = aifc.open(self.filename_or_fileobject, "rb")
                 self.little_endian = False  # AIFF is a big-endian format
             except (aifc.Error, EOFError):
-                # attempt to read the file as FLAC
-                if hasattr(self.filename_or_fileobject, "read"):
-                    flac_data = self.filename_or_fileobject.read()
-                else:
-                    with open(self.filename_or_fileobject, "rb") as f: flac_data = f.read()
-
-                # run the FLAC converter with the FLAC data to get the AIFF data
-                flac_converter = get_flac_converter()
-                if os.name == "nt":  # on Windows, specify that the process is to be started without showing a console window
-                    startup_info = subprocess.STARTUPINFO()
-                    startup_info.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # specify that the wShowWindow field of `startup_info` contains a value
-                    startup_info.wShowWindow = subprocess.SW_HIDE  # specify that the console window should be hidden
+                # attempt to read the file as FLAC, decoding it in-process as it is read if possible
+                if position is not None: self.filename_or_fileobject.seek(position)
+                self.audio_reader = flac.open_reader(self.filename_or_fileobject)
+                if self.audio_reader is not None:
+                    self.little_endian = True  # the in-process decoder produces little-endian samples
                 else:
-                    startup_info = None  # default startupinfo
-                process = subprocess.Popen([
-                    flac_converter,
-                    "--stdout", "--totally-silent",  # put the resulting AIFF file in stdout, and make sure it's not mixed with any program output
-                    "--decode", "--force-aiff-format",  # decode the FLAC file into an AIFF file
-                    "-",  # the input FLAC file contents will be given in stdin
-                ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, startupinfo=startup_info)
-                aiff_data, _ = process.communicate(flac_data)
-                aiff_file = io.BytesIO(aiff_data)
-                try:
-                    self.audio_reader = aifc.open(aiff_file, "rb")
-                except (aifc.Error, EOFError):
-                    raise ValueError("Audio file could not be read as PCM WAV, AIFF/AIFF-C, or Native FLAC; check if file is corrupted or in another format")
-                self.little_endian = False  # AIFF is a big-endian format
+                    self.audio_reader = self._decode_flac_with_subprocess()
+                    self.little_endian = False  # AIFF is a big-endian format
         assert 1 <= self.audio_reader.getnchannels() <= 2, "Audio must be mono or stereo"
+        assert self.channel is None or self.channel < self.audio_reader.getnchannels(), "Channel {} does not exist in mono audio".format(self.channel)
         self.SAMPLE_WIDTH = self.audio_reader.getsampwidth()
 
         # 24-bit audio needs some special handling for old Python versions (workaround for https://bugs.python.org/issue12866)
@@ -279,12 +286,33 @@ class AudioFile(AudioSource):
                 self.SAMPLE_WIDTH = 4  # the ``AudioFile`` instance should present itself as a 32-bit stream now, since we'll be converting into 32-bit on the fly when reading
 
         self.SAMPLE_RATE = self.audio_reader.getframerate()
-        self.CHUNK = 4096
+        self.CHUNK = self.chunk_size
         self.FRAME_COUNT = self.audio_reader.getnframes()
         self.DURATION = self.FRAME_COUNT / float(self.SAMPLE_RATE)
-        self.stream = AudioFile.AudioFileStream(self.audio_reader, self.little_endian, samples_24_bit_pretending_to_be_32_bit)
+        self.stream = AudioFile.AudioFileStream(self.audio_reader, self.little_endian, samples_24_bit_pretending_to_be_32_bit, self.channel)
         return self
 
+    def _decode_flac_with_subprocess(self):
+        if hasattr(self.filename_or_fileobject, "read"):
+            flac_data = self.filename_or_fileobject.read()
+        else:
+            with open(self.filename_or_fileobject, "rb") as f: flac_data = f.read()
+
+        # run the FLAC converter with the FLAC data to get the AIFF data
+        flac_converter = get_flac_converter()
+        process = subprocess.Popen([
+            flac_converter,
+            "--stdout", "--totally-silent",  # put the resulting AIFF file in stdout, and make sure it's not mixed with any program output
+            "--decode", "--force-aiff-format",  # decode the FLAC file into an AIFF file
+            "-",  # the input FLAC file contents will be given in stdin
+        ], stdin=subprocess.PIPE, stdout=subprocess.PIPE, startupinfo=flac.startup_info())
+        aiff_data, _ = process.communicate(flac_data)
+        aiff_file = io.BytesIO(aiff_data)
+        try:
+            return aifc.open(aiff_file, "rb")
+        except (aifc.Error, EOFError):
+            raise ValueError("Audio file could not be read as PCM WAV, AIFF/AIFF-C, or Native FLAC; check if file is corrupted or in another format")
+
     def __exit__(self, exc_type, exc_value, traceback):
         if not hasattr(self.filename_or_fileobject, "read"):  # only close the file if it was opened by this class in the first place (if the file was originally given as a path)
             self.audio_reader.close()
@@ -292,16 +320,34 @@ class AudioFile(AudioSource):
         self.DURATION = None
 
     class AudioFileStream(object):
-        def __init__(self, audio_reader, little_endian, samples_24_bit_pretending_to_be_32_bit):
+        def __init__(self, audio_reader, little_endian, samples_24_bit_pretending_to_be_32_bit, channel=None):
             self.audio_reader = audio_reader  # an audio file object (e.g., a `wave.Wave_read` instance)
             self.little_endian = little_endian  # whether the audio data is little-endian (when working with big-endian things, we'll have to convert it to little-endian before we process it)
             self.samples_24_bit_pretending_to_be_32_bit = samples_24_bit_pretending_to_be_32_bit  # this is true if the audio is 24-bit audio, but 24-bit audio isn't supported, so we have to pretend that this is 32-bit audio and convert it on the fly
+            self.channel = channel  # the channel to use from stereo audio, or ``None`` to add both channels together
+            try:
+                import numpy
+            except ImportError:
+                numpy = None
+            self._np = numpy
+
+        def tell(self):
+            """Returns the current position in the audio, in frames."""
+            return self.audio_reader.tell()
+
+        def seek(self, frame):
+            """Moves to the frame ``frame`` of the audio, or to the end if it's past the end."""
+            self.audio_reader.setpos(min(max(0, frame), self.audio_reader.getnframes()))
 
         def read(self, size=-1):
             buffer = self.audio_reader.readframes(self.audio_reader.getnframes() if size == -1 else size)
-            if not isinstance(buffer, bytes): buffer = b""  # workaround for https://bugs.python.org/issue24608
+            if not isinstance(buffer, (bytes, memoryview)): buffer = b""  # workaround for https://bugs.python.org/issue24608 (memory-mapped WAV files give ``memoryview`` frames)
 
             sample_width = self.audio_reader.getsampwidth()
+            channels = self.audio_reader.getnchannels()
+            if self._np is not None and sample_width > 1 and (not self.little_endian or channels != 1 or self.samples_24_bit_pretending_to_be_32_bit):
+                return self._convert_with_numpy(buffer, sample_width, channels)
+
             if not self.little_endian:  # big endian format, convert to little endian on the fly
                 if hasattr(audioop, "byteswap"):  # ``audioop.byteswap`` was only added in Python 3.4 (incidentally, that also means that we don't need to worry about 24-bit audio being unsupported, since Python 3.4+ always has that functionality)
                     buffer = audioop.byteswap(buffer, sample_width)
@@ -312,12 +358,50 @@ class AudioFile(AudioSource):
             if self.samples_24_bit_pretending_to_be_32_bit:  # we need to convert samples from 24-bit to 32-bit before we can process them with ``audioop`` functions
                 buffer = b"".join(b"\x00" + buffer[i:i + sample_width] for i in range(0, len(buffer), sample_width))  # since we're in little endian, we prepend a zero byte to each 24-bit sample to get a 32-bit sample
                 sample_width = 4  # make sure we thread the buffer as 32-bit audio now, after converting it from 24-bit audio
-            if self.audio_reader.getnchannels() != 1:  # stereo audio
-                buffer = audioop.tomono(buffer, sample_width, 1, 1)  # convert stereo audio data to mono
+            if channels != 1:  # stereo audio
+                left_factor, right_factor = (1, 1) if self.channel is None else (1 - self.channel, self.channel)
+                buffer = audioop.tomono(buffer, sample_width, left_factor, right_factor)  # convert stereo audio data to mono
             return buffer
 
+        def _convert_with_numpy(self, buffer, sample_width, channels):
+            # does the same conversions as ``read``, on the whole buffer at once
+            np = self._np
+            byte_order = "<" if self.little_endian else ">"
+            if sample_width == 3:
+                # view every 24-bit sample as the upper three bytes of a 32-bit one (the lowest byte belongs to a neighbouring sample, or to the padding byte at either end), so that shifting it down sign-extends it
+                padded = np.zeros(len(buffer) + 1, dtype=np.uint8)
+                data_start = 1 if self.little_endian else 0
+                padded[data_start:data_start + len(buffer)] = np.frombuffer(buffer, dtype=np.uint8)
+                samples = np.ndarray((len(buffer) // 3,), dtype=byte_order + "i4", buffer=padded, strides=(3,)) >> 8
+            else:
+                samples = np.frombuffer(buffer, dtype="{}i{}".format(byte_order, sample_width))
+            samples = samples.reshape(-1, channels)
+
+            if channels == 1 or self.channel is not None:
+                mono = samples[:, self.channel or 0]
+            else:  # add the channels together, clipping the result, like ``audioop.tomono(buffer, sample_width, 1, 1)``
+                limit = 1 << (8 * sample_width - 1)
+                mono = samples[:, 0].astype(np.int64 if sample_width == 4 else np.int32)
+                mono += samples[:, 1]
+                np.clip(mono, -limit, limit - 1, out=mono)
+
+            if sample_width != 3:
+                return mono.astype("<i{}".format(sample_width)).tobytes()
+            widened = mono.astype("<i4")
+            if self.samples_24_bit_pretending_to_be_32_bit:
+                widened <<= 8
+                return widened.tobytes()
+            widened = widened.view(np.uint8).reshape(-1, 4)
+            packed = np.empty((len(widened), 3), dtype=np.uint8)
+            for byte in range(3):  # copying column by column is several times faster than copying the strided view at once
+                packed[:, byte] = widened[:, byte]
+            return packed.tobytes()
+
 
 class Recognizer(AudioSource):
+    # engines that do the recognition on this machine, which ``recognize_batch`` runs in separate processes since they're CPU-bound
+    LOCAL_ENGINES = frozenset({"sphinx", "vosk", "whisper", "faster_whisper", "tensorflow"})
+
     def __init__(self):
         """
         Creates a new ``Recognizer`` instance, which represents a collection of speech recognition functionality.
@@ -331,16 +415,32 @@ class Recognizer(AudioSource):
 
         self.phrase_threshold = 0.3  # minimum seconds of speaking audio before we consider the speaking audio a phrase - values below this are ignored (for filtering out clicks and pops)
         self.non_speaking_duration = 0.5  # seconds of non-speaking audio to keep on both sides of the recording
+        self.voice_activity_detector = None  # a ``speech_recognition.vad.VoiceActivityDetector`` that decides which audio is speech, or ``None`` to compare the energy of the audio against ``energy_threshold``
+        self.frame_duration = None  # seconds of audio to detect speaking and pauses in at a time while listening, or ``None`` to use each buffer read from the source (``source.CHUNK`` frames)
+        self._frame_reader = None  # audio read ahead of the last phrase from a source other than an ``AudioFile``, see ``_FrameReader``
+        self.http_transport = None  # a ``speech_recognition.transport.HTTPTransport`` that the ``recognize_*`` methods send requests through, or ``None`` to use one shared by all recognizers
+        self.async_transport = None  # a ``speech_recognition.transport.AsyncHTTPTransport`` that the ``recognize_*_async`` methods send requests through, or ``None`` to use one shared by all recognizers
+        self.google_cloud_client = None  # a ``google.cloud.speech.SpeechClient`` that ``recognize_google_cloud`` and ``recognize_google_cloud_streaming`` send requests through, or ``None`` to use one shared by all recognizers
+        self.client_registry = None  # a ``speech_recognition.clients.ClientRegistry`` that the recognizers calling vendor SDKs get their clients from, or ``None`` to use one shared by all recognizers
 
     def record(self, source, duration=None, offset=None):
         """
         Records up to ``duration`` seconds of audio from ``source`` (an ``AudioSource`` instance) starting at ``offset`` (or at the beginning if not specified) into an ``AudioData`` instance, which it returns.
 
         If ``duration`` is not specified, then it will record until there is no more audio input.
+
+        ``AudioFile`` sources skip straight to ``offset`` and read all of the audio to record at once, so recording a short section from the end of a long file doesn't read everything before it. For other sources, the audio before ``offset`` is read and discarded, and ``offset`` and ``duration`` are rounded down to a whole number of ``source.CHUNK``-frame buffers.
         """
         assert isinstance(source, AudioSource), "Source must be an audio source"
         assert source.stream is not None, "Audio source must be entered before recording, see documentation for ``AudioSource``; are you using ``source`` outside of a ``with`` statement?"
 
+        if isinstance(source, AudioFile):  # its stream seeks by frame, and the length of the audio is known
+            if offset: source.stream.seek(source.stream.tell() + int(offset * source.SAMPLE_RATE))
+            frame_count = source.FRAME_COUNT - source.stream.tell()
+            if duration: frame_count = min(frame_count, int(duration * source.SAMPLE_RATE))
+            frame_data = source.stream.read(frame_count) if frame_count > 0 else b""
+            return AudioData(bytes(frame_data), source.SAMPLE_RATE, source.SAMPLE_WIDTH)  # copy frames out of memory-mapped files, so that the file isn't kept open by the result
+
         frames = io.BytesIO()
         seconds_per_buffer = (source.CHUNK + 0.0) / source.SAMPLE_RATE
         elapsed_time = 0
@@ -385,6 +485,9 @@ class Recognizer(AudioSource):
             elapsed_time += seconds_per_buffer
             if elapsed_time > duration: break
             buffer = source.stream.read(source.CHUNK)  # type: ignore[attr-defined]
+            if self.voice_activity_detector is not None:
+                self.voice_activity_detector.adjust_for_ambient_noise(buffer, source.SAMPLE_WIDTH, source.SAMPLE_RATE)  # type: ignore[attr-defined]
+                continue
             energy = audioop.rms(buffer, source.SAMPLE_WIDTH)  # type: ignore[attr-defined]  # energy of the audio signal
 
             # dynamically adjust the energy threshold using asymmetric weighted average
@@ -445,7 +548,12 @@ class Recognizer(AudioSource):
         """
         Records a single phrase from ``source`` (an ``AudioSource`` instance) into an ``AudioData`` instance, which it returns.
 
-        If the ``stream`` keyword argument is ``True``, the ``listen()`` method will yield ``AudioData`` instances representing chunks of audio data as they are detected. The first yielded ``AudioData`` instance represents the first buffer of the phrase, and the last yielded ``AudioData`` instance represents the last buffer of the phrase. If ``stream`` is ``False``, the method will return a single ``AudioData`` instance representing the entire phrase.
+        If the ``stream`` keyword argument is ``True``, the ``listen()`` method will yield ``AudioData`` instances representing chunks of audio data as they are detected. The first yielded ``AudioData`` instance represents the first buffer of the phrase, and the last yielded ``AudioData`` instance represents the last buffer of the phrase. If ``stream`` is ``False``, the method will return a single ``AudioData`` instance representing the entire phrase. The chunks can be passed straight to ``recognizer_instance.recognize_wit``, ``recognizer_instance.recognize_azure`` or ``recognizer_instance.recognize_houndify``, which upload them as they're yielded:
+
+        .. code:: python
+
+            with sr.Microphone() as source:
+                print(recognizer.recognize_azure(recognizer.listen(source, stream=True), key=AZURE_SPEECH_KEY))
 
         This is done by waiting until the audio has an energy above ``recognizer_instance.energy_threshold`` (the user has started speaking), and then recording until it encounters ``recognizer_instance.pause_threshold`` seconds of non-speaking or there is no more audio input. The ending silence is not included.
 
@@ -459,8 +567,8 @@ class Recognizer(AudioSource):
         """
         result = self._listen(source, timeout, phrase_time_limit, snowboy_configuration, stream)
         if not stream:
-            for a in result:
-                return a
+            (audio_data,) = result  # runs the generator to completion, so that audio read past the end of the phrase is given back
+            return audio_data
         return result
 
     def _listen(self, source, timeout=None, phrase_time_limit=None, snowboy_configuration=None, stream=False):
@@ -472,7 +580,25 @@ class Recognizer(AudioSource):
             for hot_word_file in snowboy_configuration[1]:
                 assert os.path.isfile(hot_word_file), "``snowboy_configuration[1]`` must be a list of Snowboy hot word configuration files"
 
-        seconds_per_buffer = float(source.CHUNK) / source.SAMPLE_RATE
+        # buffers are read from the source ``source.CHUNK`` frames at a time, but detection runs on frames of ``frame_duration`` seconds
+        if self.frame_duration is None or snowboy_configuration is not None:  # Snowboy reads from the source directly, so nothing can be buffered
+            frame_size = source.CHUNK
+        else:
+            assert self.frame_duration > 0, "``frame_duration`` must be a positive number of seconds"
+            frame_size = max(1, int(self.frame_duration * source.SAMPLE_RATE))
+        reader = self._frame_reader
+        if reader is None or reader.stream is not source.stream or reader.frame_size != frame_size:
+            reader = _FrameReader(source, frame_size)
+        self._frame_reader = None
+        try:
+            yield from self._listen_for_phrase(source, reader, timeout, phrase_time_limit, snowboy_configuration, stream)
+        finally:
+            # give back the audio that was read but not used, so that it's at the start of the next phrase
+            if reader.unread(): self._frame_reader = reader
+
+    def _listen_for_phrase(self, source, reader, timeout, phrase_time_limit, snowboy_configuration, stream):
+        detector = self.voice_activity_detector
+        seconds_per_buffer = float(reader.frame_size) / source.SAMPLE_RATE
         pause_buffer_count = int(math.ceil(self.pause_threshold / seconds_per_buffer))  # number of buffers of non-speaking audio during a phrase, before the phrase should be considered complete
         phrase_buffer_count = int(math.ceil(self.phrase_threshold / seconds_per_buffer))  # minimum number of buffers of speaking audio before we consider the speaking audio a phrase
         non_speaking_buffer_count = int(math.ceil(self.non_speaking_duration / seconds_per_buffer))  # maximum number of buffers of non-speaking audio to retain before and after a phrase
@@ -491,13 +617,16 @@ class Recognizer(AudioSource):
                     if timeout and elapsed_time > timeout:
                         raise WaitTimeoutError("listening timed out while waiting for phrase to start")
 
-                    buffer = source.stream.read(source.CHUNK)
+                    buffer = reader.read()
                     if len(buffer) == 0: break  # reached end of the stream
                     frames.append(buffer)
                     if len(frames) > non_speaking_buffer_count:  # ensure we only keep the needed amount of non-speaking buffers
                         frames.popleft()
 
                     # detect whether speaking has started on audio input
+                    if detector is not None:
+                        if detector.is_speech(buffer, source.SAMPLE_WIDTH, source.SAMPLE_RATE, False): break
+                        continue
                     energy = audioop.rms(buffer, source.SAMPLE_WIDTH)  # energy of the audio signal
                     if energy > self.energy_threshold: break
 
@@ -529,14 +658,18 @@ class Recognizer(AudioSource):
                 if phrase_time_limit and elapsed_time - phrase_start_time > phrase_time_limit:
                     break
 
-                buffer = source.stream.read(source.CHUNK)
+                buffer = reader.read()
                 if len(buffer) == 0: break  # reached end of the stream
                 frames.append(buffer)
                 phrase_count += 1
 
                 # check if speaking has stopped for longer than the pause threshold on the audio input
-                energy = audioop.rms(buffer, source.SAMPLE_WIDTH)  # unit energy of the audio signal within the buffer
-                if energy > self.energy_threshold:
+                if detector is not None:
+                    speaking = detector.is_speech(buffer, source.SAMPLE_WIDTH, source.SAMPLE_RATE, True)
+                else:
+                    energy = audioop.rms(buffer, source.SAMPLE_WIDTH)  # unit energy of the audio signal within the buffer
+                    speaking = energy > self.energy_threshold
+                if speaking:
                     pause_count = 0
                 else:
                     pause_count += 1
@@ -544,7 +677,7 @@ class Recognizer(AudioSource):
                     break
 
                 # dynamically adjust the energy threshold using asymmetric weighted average
-                if self.dynamic_energy_threshold:
+                if detector is None and self.dynamic_energy_threshold:
                     damping = self.dynamic_energy_adjustment_damping ** seconds_per_buffer  # account for different chunk sizes and rates
                     target_energy = energy * self.dynamic_energy_ratio
                     self.energy_threshold = self.energy_threshold * damping + target_energy * (1 - damping)
@@ -569,42 +702,149 @@ class Recognizer(AudioSource):
             # yield the entire phrase as a single AudioData instance
             yield AudioData(frame_data, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
 
-    def listen_in_background(self, source, callback, phrase_time_limit=None):
+    def segment(self, audio_data: AudioData, frame_duration: float | None = None) -> list[tuple[float, float]]:
+        """
+        Finds all the phrases in ``audio_data`` (an ``AudioData`` instance), and returns their start and end times in seconds, as a list of ``(start, end)`` tuples. Each phrase can then be extracted with ``audio_data.get_segment(start * 1000, end * 1000)``.
+
+        The phrases are the ones that ``recognizer_instance.listen`` would return when called repeatedly on the same audio, using the same ``energy_threshold``, ``dynamic_energy_threshold``, ``pause_threshold``, ``phrase_threshold``, and ``non_speaking_duration`` settings. However, the energy of the whole audio is computed up front (with NumPy, if installed) rather than buffer by buffer, which makes this much faster for long recordings. The energy threshold adapts to the audio as it would while listening, but ``recognizer_instance.energy_threshold`` itself is left unchanged.
+
+        If ``recognizer_instance.voice_activity_detector`` is set, it is consulted for every frame instead, as when listening.
+
+        Speech and pauses are detected in frames of ``frame_duration`` seconds. If not specified, this is ``recognizer_instance.frame_duration``, or, if that is ``None``, 4096 samples (the default chunk size of ``AudioFile``).
+        """
+        assert isinstance(audio_data, AudioData), "``audio_data`` must be audio data"
+        assert self.pause_threshold >= self.non_speaking_duration >= 0
+        if frame_duration is None: frame_duration = self.frame_duration
+        frame_size = 4096 if frame_duration is None else max(1, int(frame_duration * audio_data.sample_rate))
+
+        seconds_per_buffer = float(frame_size) / audio_data.sample_rate
+        pause_buffer_count = int(math.ceil(self.pause_threshold / seconds_per_buffer))  # number of buffers of non-speaking audio during a phrase, before the phrase should be considered complete
+        phrase_buffer_count = int(math.ceil(self.phrase_threshold / seconds_per_buffer))  # minimum number of buffers of speaking audio before we consider the speaking audio a phrase
+        non_speaking_buffer_count = int(math.ceil(self.non_speaking_duration / seconds_per_buffer))  # maximum number of buffers of non-speaking audio to retain before and after a phrase
+        damping = self.dynamic_energy_adjustment_damping ** seconds_per_buffer  # account for different chunk sizes and rates
+        sample_count = len(audio_data.frame_data) // audio_data.sample_width
+        frame_count = -(-sample_count // frame_size)  # ceiling division
+        detector = self.voice_activity_detector
+        if detector is None:
+            energies = _frame_energies(audio_data, frame_size)
+        else:
+            raw_data = memoryview(audio_data.get_raw_data())
+            frame_bytes = frame_size * audio_data.sample_width
+        energy_threshold = self.energy_threshold
+
+        def is_speech(index, in_phrase):
+            if detector is not None:
+                return detector.is_speech(raw_data[index * frame_bytes:(index + 1) * frame_bytes], audio_data.sample_width, audio_data.sample_rate, in_phrase)
+            return energies[index] > energy_threshold
+
+        def adjust_energy_threshold(index):
+            nonlocal energy_threshold
+            if detector is None and self.dynamic_energy_threshold:
+                energy_threshold = energy_threshold * damping + energies[index] * self.dynamic_energy_ratio * (1 - damping)
+
+        # the same logic as ``_listen_for_phrase``, but over frames of the audio rather than buffers read from a stream
+        phrases = []
+        index = 0
+        while index < frame_count:
+            # skip audio until the phrase starts
+            waiting_start = index
+            while index < frame_count and not is_speech(index, False):
+                adjust_energy_threshold(index)
+                index += 1
+            if index == frame_count: break  # reached the end of the audio without another phrase
+            phrase_start = max(waiting_start, index + 1 - non_speaking_buffer_count)  # keep up to ``non_speaking_buffer_count`` buffers, including the one that started the phrase
+            index += 1
+
+            # find where the phrase ends
+            pause_count, phrase_count = 0, 0
+            while index < frame_count:
+                speaking = is_speech(index, True)
+                index += 1
+                phrase_count += 1
+                if speaking:
+                    pause_count = 0
+                else:
+                    pause_count += 1
+                if pause_count > pause_buffer_count: break  # end of the phrase
+                adjust_energy_threshold(index - 1)
+            if phrase_count - pause_count >= phrase_buffer_count or index == frame_count:  # phrases that run to the end of the audio are always kept
+                phrase_end = index - max(0, pause_count - non_speaking_buffer_count)  # remove extra non-speaking buffers at the end
+                phrases.append((phrase_start * seconds_per_buffer, min(phrase_end * frame_size, sample_count) / float(audio_data.sample_rate)))
+        return phrases
+
+    def listen_in_background(self, source, callback, phrase_time_limit=None, workers=1, max_queue_size=10, overflow="drop_oldest"):
         """
         Spawns a thread to repeatedly record phrases from ``source`` (an ``AudioSource`` instance) into an ``AudioData`` instance and call ``callback`` with that ``AudioData`` instance as soon as each phrase are detected.
 
-        Returns a function object that, when called, requests that the background listener thread stop. The background thread is a daemon and will not stop the program from exiting if there are no other non-daemon threads. The function accepts one parameter, ``wait_for_stop``: if truthy, the function will wait for the background listener to stop before returning, otherwise it will return immediately and the background listener thread might still be running for a second or two afterwards. Additionally, if you are using a truthy value for ``wait_for_stop``, you must call the function from the same thread you originally called ``listen_in_background`` from.
+        Returns a ``BackgroundListener`` object that, when called, requests that the background listener threads stop. The background threads are daemons and will not stop the program from exiting if there are no other non-daemon threads. The function accepts one parameter, ``wait_for_stop``: if truthy, the function will wait for the background listener to stop before returning, otherwise it will return immediately and the background listener threads might still be running for a second or two afterwards. Additionally, if you are using a truthy value for ``wait_for_stop``, you must call the function from the same thread you originally called ``listen_in_background`` from.
 
         Phrase recognition uses the exact same mechanism as ``recognizer_instance.listen(source)``. The ``phrase_time_limit`` parameter works in the same way as the ``phrase_time_limit`` parameter for ``recognizer_instance.listen(source)``, as well.
 
         The ``callback`` parameter is a function that should accept two parameters - the ``recognizer_instance``, and an ``AudioData`` instance representing the captured audio. Note that ``callback`` function will be called from a non-main thread.
+
+        Capturing audio and calling ``callback`` happen on separate threads, so a slow ``callback`` (such as one that performs speech recognition) doesn't stop audio from being captured. Captured phrases wait in a queue of up to ``max_queue_size`` phrases (unlimited if ``None``) until one of ``workers`` worker threads calls ``callback`` with them; with more than one worker, ``callback`` may be called concurrently, and phrases may finish out of order. When the queue is full, ``overflow`` decides what happens to a new phrase: ``"drop_oldest"`` drops the oldest phrase in the queue to make room for it, ``"drop_newest"`` drops the new phrase, and ``"block"`` waits until there's room, which stops audio from being captured in the meantime. The returned ``BackgroundListener`` counts the phrases that were captured and dropped, and how many are waiting in the queue.
         """
         assert isinstance(source, AudioSource), "Source must be an audio source"
-        running = [True]
+        return BackgroundListener(self, source, callback, phrase_time_limit, workers, max_queue_size, overflow)
 
-        def threaded_listen():
-            with source as s:
-                while running[0]:
-                    try:  # listen for 1 second, then check again if the stop function has been called
-                        audio = self.listen(s, 1, phrase_time_limit)
-                    except WaitTimeoutError:  # listening timed out, just try again
-                        pass
-                    else:
-                        if running[0]: callback(self, audio)
+    def recognize_batch(self, audio_datas, engine, max_workers=None, executor=None, **options):
+        """
+        Performs speech recognition on each ``AudioData`` instance in ``audio_datas`` (any iterable, including generators) with the ``engine`` recognizer, several at a time. ``engine`` is the name of a ``recognizer_instance.recognize_*`` method without its prefix, such as ``"google"`` for ``recognizer_instance.recognize_google``, and ``options`` are passed to it along with each ``AudioData`` instance.
+
+        Returns an iterator over the results, in the same order as ``audio_datas``. Results are available as soon as they (and the ones before them) are ready, and ``audio_datas`` is read as the iterator is consumed, a few items ahead of the results, so that a long batch doesn't have to fit in memory. If the recognition of an item raises an exception, such as ``speech_recognition.UnknownValueError`` or ``speech_recognition.RequestError``, the exception instance takes the place of its result, and the rest of the batch carries on.
+
+        Web APIs are called from a thread pool. The engines in ``Recognizer.LOCAL_ENGINES`` (such as ``"sphinx"``, ``"vosk"`` and ``"whisper"``) are CPU-bound, so they run in a process pool instead, with a new ``Recognizer`` instance in each process; their ``options`` and results must be picklable. At most ``max_workers`` recognitions run at the same time, defaulting to the defaults of ``concurrent.futures.ThreadPoolExecutor`` and ``concurrent.futures.ProcessPoolExecutor``.
+
+        The pool is shut down when the iterator is exhausted or closed. To reuse a pool across batches instead (for example, to keep the models that local engines load in each process), pass a ``concurrent.futures.Executor`` as ``executor``; it is used as is, and left running.
+        """
+        assert isinstance(engine, str) and callable(getattr(self, "recognize_" + engine, None)), "``engine`` must be the name of a recognizer, such as ``\"google\"``"
+        assert max_workers is None or (isinstance(max_workers, int) and max_workers > 0), "``max_workers`` must be a positive integer or ``None``"
+        in_processes = engine in self.LOCAL_ENGINES
+        if max_workers is None:
+            cpu_count = os.cpu_count() or 1
+            ahead = 2 * (cpu_count if in_processes else min(32, cpu_count + 4))  # the ``concurrent.futures`` defaults
+        else:
+            ahead = 2 * max_workers  # keep every worker busy, with the next items ready to go
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers) if in_processes else ThreadPoolExecutor(max_workers)
+
+        def submit(audio_data):
+            if in_processes:
+                return executor.submit(_recognize_in_process, engine, audio_data, options)
+            return executor.submit(getattr(self, "recognize_" + engine), audio_data, **options)
+        return _batch_results(audio_datas, submit, ahead, executor if own_executor else None)
+
+    def transcribe_long(self, audio_data, engine, max_bytes=24 * 1024 * 1024, silence_aware=True, max_workers=None, executor=None, retries=2, retry_delay=1.0, separator=" ", **options):
+        """
+        Transcribes ``audio_data`` (an ``AudioData`` instance) of any length with the ``engine`` recognizer, by splitting it into chunks of at most ``max_bytes`` bytes as WAV data (see ``audiodata_instance.split``), recognizing the chunks concurrently, and stitching the results together in order. ``engine``, ``max_workers``, ``executor`` and ``options`` are used as in ``recognizer_instance.recognize_batch``, so a long recording takes about as long as its slowest chunk rather than the sum of them all.
+
+        If ``silence_aware`` is true (the default), the chunks are cut at silences where possible, so that words aren't cut in half; this requires ``numpy``.
 
-        def stopper(wait_for_stop=True):
-            running[0] = False
-            if wait_for_stop:
-                listener_thread.join()  # block until the background thread is done, which can take around 1 second
+        Chunks whose recognition fails are recognized again, up to ``retries`` more times, after waiting ``retry_delay`` seconds, twice as long after each attempt. Failures that would happen again aren't retried: ``speech_recognition.UnknownValueError`` (a chunk without speech, which is left out of the result), ``speech_recognition.SetupError``, and ``AssertionError``, ``TypeError`` and ``ValueError`` (such as from invalid ``options``).
 
-        listener_thread = threading.Thread(target=threaded_listen)
-        listener_thread.daemon = True
-        listener_thread.start()
-        return stopper
+        If the engine returns text, returns the texts of the chunks joined by ``separator``. If it returns dictionaries with a ``"text"`` key, such as ``recognizer_instance.recognize_whisper`` with ``show_dict=True``, returns one such dictionary, with the texts joined, and the ``"segments"`` and ``"words"`` lists concatenated, with their ``start`` and ``end`` times (in seconds) shifted to be relative to the start of ``audio_data`` rather than of each chunk. Otherwise, returns a list of ``(offset, result)`` tuples, with the offset of each recognized chunk from the start of ``audio_data`` in seconds.
+
+        Raises a ``speech_recognition.UnknownValueError`` exception if no chunk contains recognizable speech. Otherwise, raises the exception of the first chunk that still couldn't be recognized after the retries, such as a ``speech_recognition.RequestError`` exception.
+        """
+        assert isinstance(audio_data, AudioData), "``audio_data`` must be audio data"
+        assert isinstance(retries, int) and retries >= 0, "``retries`` must be a non-negative integer"
+        chunks = audio_data.split(max_bytes, silence_aware=silence_aware)
+        offsets = list(itertools.accumulate((len(chunk.frame_data) / (chunk.sample_rate * chunk.sample_width) for chunk in chunks[:-1]), initial=0.0))
+
+        results = list(self.recognize_batch(chunks, engine, max_workers=max_workers, executor=executor, **options))
+        for attempt in range(retries):
+            failed = [i for i, result in enumerate(results) if isinstance(result, Exception) and not isinstance(result, _PERMANENT_ERRORS)]
+            if not failed: break
+            time.sleep(retry_delay * 2 ** attempt)
+            retried = self.recognize_batch([chunks[i] for i in failed], engine, max_workers=max_workers, executor=executor, **options)
+            for i, result in zip(failed, retried):
+                results[i] = result
+        return _stitch_results(results, offsets, separator)
 
     def recognize_wit(self, audio_data, key, show_all=False):
         """
-        Performs speech recognition on ``audio_data`` (an ``AudioData`` instance), using the Wit.ai API.
+        Performs speech recognition on ``audio_data`` (an ``AudioData`` instance, or an iterable of ``AudioData`` chunks to stream; see below), using the Wit.ai API.
 
         The Wit.ai API key is specified by ``key``. Unfortunately, these are not available without `signing up for an account <https://wit.ai/>`__ and creating an app. You will need to add at least one intent to the app before you can see the API key, though the actual intent settings don't matter.
 
@@ -612,36 +852,54 @@ class Recognizer(AudioSource):
 
         The recognition language is configured in the Wit.ai app settings.
 
+        If ``audio_data`` is an iterable of consecutive ``AudioData`` chunks, such as the generator returned by ``recognizer_instance.listen(source, stream=True)``, each chunk is uploaded as soon as it is produced, so the audio is sent while the user is still speaking, and only the last chunk is left to send once they stop. Since a streamed request can't be sent again, it's sent over a new connection rather than one kept open from an earlier request.
+
         Returns the most likely transcription if ``show_all`` is false (the default). Otherwise, returns the `raw API response <https://wit.ai/docs/http/20141022#get-intent-via-text-link>`__ as a JSON dictionary.
 
         Raises a ``speech_recognition.UnknownValueError`` exception if the speech is unintelligible. Raises a ``speech_recognition.RequestError`` exception if the speech recognition operation failed, if the key isn't valid, or if there is no internet connection.
         """
+        request = self._wit_request(audio_data, key)
+        try:
+            response = transport.get_transport(self).send(request, self.operation_timeout)
+        except HTTPError as e:
+            raise RequestError("recognition request failed: {}".format(e.reason))
+        except URLError as e:
+            raise RequestError("recognition connection failed: {}".format(e.reason))
+        response_text = response.decode("utf-8")
+        return self._wit_result(json.loads(response_text), show_all)
+
+    async def recognize_wit_async(self, audio_data, key, show_all=False):
+        """
+        Coroutine version of ``recognizer_instance.recognize_wit``, which takes the same parameters (except that ``audio_data`` can't be an iterable of chunks) and returns the same results. The request is sent through ``recognizer_instance.async_transport``, and the audio is converted in the event loop's default executor, so that neither blocks the event loop.
+        """
         assert isinstance(audio_data, AudioData), "Data must be audio data"
+        request = await asyncio.get_running_loop().run_in_executor(None, self._wit_request, audio_data, key)
+        response_text = await transport.obtain_response_text(self, request, self.operation_timeout)
+        return self._wit_result(json.loads(response_text), show_all)
+
+    @staticmethod
+    def _wit_request(audio_data, key):
         assert isinstance(key, str), "``key`` must be a string"
 
-        wav_data = audio_data.get_wav_data(
-            convert_rate=None if audio_data.sample_rate >= 8000 else 8000,  # audio samples must be at least 8 kHz
+        wav_data = _wav_request_body(
+            audio_data,
+            lambda sample_rate: None if sample_rate >= 8000 else 8000,  # audio samples must be at least 8 kHz
             convert_width=2  # audio samples should be 16-bit
         )
         url = "https://api.wit.ai/speech?v=20170307"
-        request = Request(url, data=wav_data, headers={"Authorization": "Bearer {}".format(key), "Content-Type": "audio/wav"})
-        try:
-            response = urlopen(request, timeout=self.operation_timeout)
-        except HTTPError as e:
-            raise RequestError("recognition request failed: {}".format(e.reason))
-        except URLError as e:
-            raise RequestError("recognition connection failed: {}".format(e.reason))
-        response_text = response.read().decode("utf-8")
-        result = json.loads(response_text)
+        headers = {"Authorization": "Bearer {}".format(key), "Content-Type": "audio/wav"}
+        if not isinstance(wav_data, bytes): headers["Transfer-Encoding"] = "chunked"
+        return Request(url, data=wav_data, headers=headers)
 
-        # return results
+    @staticmethod
+    def _wit_result(result, show_all):
         if show_all: return result
         if "_text" not in result or result["_text"] is None: raise UnknownValueError()
         return result["_text"]
 
     def recognize_azure(self, audio_data, key, language="en-US", profanity="masked", location="westus", show_all=False):
         """
-        Performs speech recognition on ``audio_data`` (an ``AudioData`` instance), using the Microsoft Azure Speech API.
+        Performs speech recognition on ``audio_data`` (an ``AudioData`` instance, or an iterable of ``AudioData`` chunks to stream; see below), using the Microsoft Azure Speech API.
 
         The Microsoft Azure Speech API key is specified by ``key``. Unfortunately, these are not available without `signing up for an account <https://azure.microsoft.com/en-ca/pricing/details/cognitive-services/speech-api/>`__ with Microsoft Azure.
 
@@ -649,52 +907,70 @@ class Recognizer(AudioSource):
 
         The recognition language is determined by ``language``, a BCP-47 language tag like ``"en-US"`` (US English) or ``"fr-FR"`` (International French), defaulting to US English. A list of supported language values can be found in the `Azure Speech service language support documentation <https://learn.microsoft.com/en-us/azure/ai-services/speech-service/language-support>`__ under "Speech to text".
 
+        If ``audio_data`` is an iterable of consecutive ``AudioData`` chunks, such as the generator returned by ``recognizer_instance.listen(source, stream=True)``, each chunk is uploaded as soon as it is produced, so the audio is sent while the user is still speaking, and only the last chunk is left to send once they stop. Since a streamed request can't be sent again, it's sent over a new connection rather than one kept open from an earlier request.
+
         Returns the most likely transcription if ``show_all`` is false (the default). Otherwise, returns the `raw API response <https://learn.microsoft.com/en-us/azure/ai-services/speech-service/rest-speech-to-text-short>`__ as a JSON dictionary.
 
         Raises a ``speech_recognition.UnknownValueError`` exception if the speech is unintelligible. Raises a ``speech_recognition.RequestError`` exception if the speech recognition operation failed, if the key isn't valid, or if there is no internet connection.
         """
-        assert isinstance(audio_data, AudioData), "Data must be audio data"
         assert isinstance(key, str), "``key`` must be a string"
         # assert isinstance(result_format, str), "``format`` must be a string" # simple|detailed
         assert isinstance(language, str), "``language`` must be a string"
 
-        result_format = 'detailed'
-        access_token, expire_time = getattr(self, "azure_cached_access_token", None), getattr(self, "azure_cached_access_token_expiry", None)
-        allow_caching = True
+        access_token = azure_token_cache.get(key, location, self._azure_token_fetcher(key, location))
+
+        request = self._azure_request(audio_data, access_token, language, profanity, location)
         try:
-            from time import (
-                monotonic,  # we need monotonic time to avoid being affected by system clock changes, but this is only available in Python 3.3+
-            )
-        except ImportError:
-            expire_time = None  # monotonic time not available, don't cache access tokens
-            allow_caching = False  # don't allow caching, since monotonic time isn't available
-        if expire_time is None or monotonic() > expire_time:  # caching not enabled, first credential request, or the access token from the previous one expired
-            # get an access token using OAuth
-            credential_url = "https://" + location + ".api.cognitive.microsoft.com/sts/v1.0/issueToken"
+            response = transport.get_transport(self).send(request, self.operation_timeout)
+        except HTTPError as e:
+            raise RequestError("recognition request failed: {}".format(e.reason))
+        except URLError as e:
+            raise RequestError("recognition connection failed: {}".format(e.reason))
+        response_text = response.decode("utf-8")
+        return self._azure_result(json.loads(response_text), show_all)
+
+    async def recognize_azure_async(self, audio_data, key, language="en-US", profanity="masked", location="westus", show_all=False):
+        """
+        Coroutine version of ``recognizer_instance.recognize_azure``, which takes the same parameters (except that ``audio_data`` can't be an iterable of chunks) and returns the same results. The request is sent through ``recognizer_instance.async_transport``, and the audio is converted in the event loop's default executor, so that neither blocks the event loop.
+        """
+        assert isinstance(audio_data, AudioData), "Data must be audio data"
+        assert isinstance(key, str), "``key`` must be a string"
+        assert isinstance(language, str), "``language`` must be a string"
+
+        access_token = azure_token_cache.peek(key, location, self._azure_token_fetcher(key, location))
+        if access_token is None:  # wait for the token in the executor, so that concurrent recognitions share one credential request with other threads
+            access_token = await asyncio.get_running_loop().run_in_executor(None, azure_token_cache.get, key, location, self._azure_token_fetcher(key, location))
+
+        request = await asyncio.get_running_loop().run_in_executor(None, self._azure_request, audio_data, access_token, language, profanity, location)
+        response_text = await transport.obtain_response_text(self, request, self.operation_timeout)
+        return self._azure_result(json.loads(response_text), show_all)
+
+    def _azure_token_fetcher(self, key, location):
+        """Returns a function that requests a new access token for ``key`` at ``location`` using OAuth."""
+        credential_url = "https://" + location + ".api.cognitive.microsoft.com/sts/v1.0/issueToken"
+        http_transport = transport.get_transport(self)
+
+        def fetch_token():
             credential_request = Request(credential_url, data=b"", headers={
                 "Content-type": "application/x-www-form-urlencoded",
                 "Content-Length": "0",
                 "Ocp-Apim-Subscription-Key": key,
             })
-
-            if allow_caching:
-                start_time = monotonic()
-
             try:
-                credential_response = urlopen(credential_request, timeout=60)  # credential response can take longer, use longer timeout instead of default one
+                credential_response = http_transport.send(credential_request, 60)  # credential response can take longer, use longer timeout instead of default one
             except HTTPError as e:
                 raise RequestError("credential request failed: {}".format(e.reason))
             except URLError as e:
                 raise RequestError("credential connection failed: {}".format(e.reason))
-            access_token = credential_response.read().decode("utf-8")
+            return credential_response.decode("utf-8")
+        return fetch_token
 
-            if allow_caching:
-                # save the token for the duration it is valid for
-                self.azure_cached_access_token = access_token
-                self.azure_cached_access_token_expiry = start_time + 600  # according to https://docs.microsoft.com/en-us/azure/cognitive-services/Speech-Service/rest-apis#authentication, the token expires in exactly 10 minutes
-
-        wav_data = audio_data.get_wav_data(
-            convert_rate=16000,  # audio samples must be 8kHz or 16 kHz
+    @staticmethod
+    def _azure_request(audio_data, access_token, language, profanity, location):
+        result_format = 'detailed'
+        wav_data = _wav_request_body(
+            audio_data,
+            lambda sample_rate: 16000,  # audio samples must be 8kHz or 16 kHz
             convert_width=2  # audio samples should be 16-bit
         )
 
@@ -704,31 +980,14 @@ class Recognizer(AudioSource):
             "profanity": profanity
         }))
 
-        if sys.version_info >= (3, 6):  # chunked-transfer requests are only supported in the standard library as of Python 3.6+, use it if possible
-            request = Request(url, data=io.BytesIO(wav_data), headers={
-                "Authorization": "Bearer {}".format(access_token),
-                "Content-type": "audio/wav; codec=\"audio/pcm\"; samplerate=16000",
-                "Transfer-Encoding": "chunked",
-            })
-        else:  # fall back on manually formatting the POST body as a chunked request
-            ascii_hex_data_length = "{:X}".format(len(wav_data)).encode("utf-8")
-            chunked_transfer_encoding_data = ascii_hex_data_length + b"\r\n" + wav_data + b"\r\n0\r\n\r\n"
-            request = Request(url, data=chunked_transfer_encoding_data, headers={
-                "Authorization": "Bearer {}".format(access_token),
-                "Content-type": "audio/wav; codec=\"audio/pcm\"; samplerate=16000",
-                "Transfer-Encoding": "chunked",
-            })
-
-        try:
-            response = urlopen(request, timeout=self.operation_timeout)
-        except HTTPError as e:
-            raise RequestError("recognition request failed: {}".format(e.reason))
-        except URLError as e:
-            raise RequestError("recognition connection failed: {}".format(e.reason))
-        response_text = response.read().decode("utf-8")
-        result = json.loads(response_text)
+        return Request(url, data=io.BytesIO(wav_data) if isinstance(wav_data, bytes) else wav_data, headers={
+            "Authorization": "Bearer {}".format(access_token),
+            "Content-type": "audio/wav; codec=\"audio/pcm\"; samplerate=16000",
+            "Transfer-Encoding": "chunked",
+        })
 
-        # return results
+    @staticmethod
+    def _azure_result(result, show_all):
         if show_all:
             return result
         if "RecognitionStatus" not in result or result["RecognitionStatus"] != "Success" or "NBest" not in result:
@@ -751,14 +1010,7 @@ class Recognizer(AudioSource):
         assert secret_access_key is None or isinstance(secret_access_key, str), "``secret_access_key`` must be a string"
         assert region is None or isinstance(region, str), "``region`` must be a string"
 
-        try:
-            import boto3
-        except ImportError:
-            raise RequestError("missing boto3 module: ensure that boto3 is set up correctly.")
-
-        client = boto3.client('lex-runtime', aws_access_key_id=access_key_id,
-                              aws_secret_access_key=secret_access_key,
-                              region_name=region)
+        client = self._aws_client('lex-runtime', access_key_id, secret_access_key, region)
 
         raw_data = audio_data.get_raw_data(
             convert_rate=16000, convert_width=2
@@ -769,9 +1021,25 @@ class Recognizer(AudioSource):
 
         return response["inputTranscript"]
 
+    def _aws_client(self, service_name, access_key_id, secret_access_key, region):
+        """Returns the ``boto3`` client for ``service_name`` with the given credentials and region from ``self.client_registry``, creating it if needed. Credentials that aren't given are found by ``boto3`` when the client is created.
+
+        Each client is created from a session of its own, since ``boto3``'s default session isn't thread-safe, and the registry may create clients for different services or regions at the same time."""
+        try:
+            import boto3
+            from botocore.config import Config
+        except ImportError:
+            raise RequestError("missing boto3 module: ensure that boto3 is set up correctly.")
+        registry = clients.get_registry(self)
+
+        def create():
+            config = None if registry.max_connections is None else Config(max_pool_connections=registry.max_connections)
+            return boto3.session.Session().client(service_name, aws_access_key_id=access_key_id, aws_secret_access_key=secret_access_key, region_name=region, config=config)
+        return registry.get("aws-" + service_name, create, credentials=(access_key_id, secret_access_key), region=region)
+
     def recognize_houndify(self, audio_data, client_id, client_key, show_all=False):
         """
-        Performs speech recognition on ``audio_data`` (an ``AudioData`` instance), using the Houndify API.
+        Performs speech recognition on ``audio_data`` (an ``AudioData`` instance, or an iterable of ``AudioData`` chunks to stream; see below), using the Houndify API.
 
         The Houndify client ID and client key are specified by ``client_id`` and ``client_key``, respectively. Unfortunately, these are not available without `signing up for an account <https://www.houndify.com/signup>`__. Once logged into the `dashboard <https://www.houndify.com/dashboard>`__, you will want to select "Register a new client", and fill in the form as necessary. When at the "Enable Domains" page, enable the "Speech To Text Only" domain, and then select "Save & Continue".
 
@@ -779,16 +1047,39 @@ class Recognizer(AudioSource):
 
         Currently, only English is supported as a recognition language.
 
+        If ``audio_data`` is an iterable of consecutive ``AudioData`` chunks, such as the generator returned by ``recognizer_instance.listen(source, stream=True)``, each chunk is uploaded as soon as it is produced, so the audio is sent while the user is still speaking, and only the last chunk is left to send once they stop. Since a streamed request can't be sent again, it's sent over a new connection rather than one kept open from an earlier request.
+
         Returns the most likely transcription if ``show_all`` is false (the default). Otherwise, returns the raw API response as a JSON dictionary.
 
         Raises a ``speech_recognition.UnknownValueError`` exception if the speech is unintelligible. Raises a ``speech_recognition.RequestError`` exception if the speech recognition operation failed, if the key isn't valid, or if there is no internet connection.
         """
+        request = self._houndify_request(audio_data, client_id, client_key)
+        try:
+            response = transport.get_transport(self).send(request, self.operation_timeout)
+        except HTTPError as e:
+            raise RequestError("recognition request failed: {}".format(e.reason))
+        except URLError as e:
+            raise RequestError("recognition connection failed: {}".format(e.reason))
+        response_text = response.decode("utf-8")
+        return self._houndify_result(json.loads(response_text), show_all)
+
+    async def recognize_houndify_async(self, audio_data, client_id, client_key, show_all=False):
+        """
+        Coroutine version of ``recognizer_instance.recognize_houndify``, which takes the same parameters (except that ``audio_data`` can't be an iterable of chunks) and returns the same results. The request is sent through ``recognizer_instance.async_transport``, and the audio is converted in the event loop's default executor, so that neither blocks the event loop.
+        """
         assert isinstance(audio_data, AudioData), "Data must be audio data"
+        request = await asyncio.get_running_loop().run_in_executor(None, self._houndify_request, audio_data, client_id, client_key)
+        response_text = await transport.obtain_response_text(self, request, self.operation_timeout)
+        return self._houndify_result(json.loads(response_text), show_all)
+
+    @staticmethod
+    def _houndify_request(audio_data, client_id, client_key):
         assert isinstance(client_id, str), "``client_id`` must be a string"
         assert isinstance(client_key, str), "``client_key`` must be a string"
 
-        wav_data = audio_data.get_wav_data(
-            convert_rate=None if audio_data.sample_rate in [8000, 16000] else 16000,  # audio samples must be 8 kHz or 16 kHz
+        wav_data = _wav_request_body(
+            audio_data,
+            lambda sample_rate: None if sample_rate in [8000, 16000] else 16000,  # audio samples must be 8 kHz or 16 kHz
             convert_width=2  # audio samples should be 16-bit
         )
         url = "https://api.houndify.com/v1/audio"
@@ -801,22 +1092,17 @@ class Recognizer(AudioSource):
                 hashlib.sha256
             ).digest()  # get the HMAC digest as bytes
         ).decode("utf-8")
-        request = Request(url, data=wav_data, headers={
+        headers = {
             "Content-Type": "application/json",
             "Hound-Request-Info": json.dumps({"ClientID": client_id, "UserID": user_id}),
             "Hound-Request-Authentication": "{};{}".format(user_id, request_id),
             "Hound-Client-Authentication": "{};{};{}".format(client_id, request_time, request_signature)
-        })
-        try:
-            response = urlopen(request, timeout=self.operation_timeout)
-        except HTTPError as e:
-            raise RequestError("recognition request failed: {}".format(e.reason))
-        except URLError as e:
-            raise RequestError("recognition connection failed: {}".format(e.reason))
-        response_text = response.read().decode("utf-8")
-        result = json.loads(response_text)
+        }
+        if not isinstance(wav_data, bytes): headers["Transfer-Encoding"] = "chunked"
+        return Request(url, data=wav_data, headers=headers)
 
-        # return results
+    @staticmethod
+    def _houndify_result(result, show_all):
         if show_all: return result
         if "Disambiguation" not in result or result["Disambiguation"] is None:
             raise UnknownValueError()
@@ -844,28 +1130,8 @@ class Recognizer(AudioSource):
         bucket_name = bucket_name or ('%s-%s' % (str(uuid.uuid4()), proc.pid))
         job_name = job_name or ('%s-%s' % (str(uuid.uuid4()), proc.pid))
 
-        try:
-            import boto3
-        except ImportError:
-            raise RequestError("missing boto3 module: ensure that boto3 is set up correctly.")
-
-        transcribe = boto3.client(
-            'transcribe',
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name=region)
-
-        s3 = boto3.client(
-            's3',
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name=region)
-
-        session = boto3.Session(
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            region_name=region
-        )
+        transcribe = self._aws_client('transcribe', access_key_id, secret_access_key, region)
+        s3 = self._aws_client('s3', access_key_id, secret_access_key, region)
 
         # Upload audio data to S3.
         filename = '%s.wav' % job_name
@@ -875,13 +1141,11 @@ class Recognizer(AudioSource):
             s3.create_bucket(Bucket=bucket_name)
         except ClientError as exc:
             print('Error creating bucket %s: %s' % (bucket_name, exc))
-        s3res = session.resource('s3')
         if audio_data is not None:
             print('Uploading audio data...')
             wav_data = audio_data.get_wav_data()
             s3.put_object(Bucket=bucket_name, Key=filename, Body=wav_data)
-            object_acl = s3res.ObjectAcl(bucket_name, filename)
-            object_acl.put(ACL='public-read')
+            s3.put_object_acl(Bucket=bucket_name, Key=filename, ACL='public-read')
         else:
             print('Skipping audio upload.')
         job_uri = 'https://%s.s3.amazonaws.com/%s' % (bucket_name, filename)
@@ -1067,6 +1331,26 @@ class Recognizer(AudioSource):
 
         Raises a ``speech_recognition.UnknownValueError`` exception if the speech is unintelligible. Raises a ``speech_recognition.RequestError`` exception if the speech recognition operation failed, if the key isn't valid, or if there is no internet connection.
         """
+        request = self._ibm_request(audio_data, key)
+        try:
+            response = transport.get_transport(self).send(request, self.operation_timeout)
+        except HTTPError as e:
+            raise RequestError("recognition request failed: {}".format(e.reason))
+        except URLError as e:
+            raise RequestError("recognition connection failed: {}".format(e.reason))
+        response_text = response.decode("utf-8")
+        return self._ibm_result(json.loads(response_text), show_all)
+
+    async def recognize_ibm_async(self, audio_data, key, language="en-US", show_all=False):
+        """
+        Coroutine version of ``recognizer_instance.recognize_ibm``, which takes the same parameters and returns the same results. The request is sent through ``recognizer_instance.async_transport``, and the audio is converted in the event loop's default executor, so that neither blocks the event loop.
+        """
+        request = await asyncio.get_running_loop().run_in_executor(None, self._ibm_request, audio_data, key)
+        response_text = await transport.obtain_response_text(self, request, self.operation_timeout)
+        return self._ibm_result(json.loads(response_text), show_all)
+
+    @staticmethod
+    def _ibm_request(audio_data, key):
         assert isinstance(audio_data, AudioData), "Data must be audio data"
         assert isinstance(key, str), "``key`` must be a string"
 
@@ -1083,16 +1367,10 @@ class Recognizer(AudioSource):
         password = key
         authorization_value = base64.standard_b64encode("{}:{}".format(username, password).encode("utf-8")).decode("utf-8")
         request.add_header("Authorization", "Basic {}".format(authorization_value))
-        try:
-            response = urlopen(request, timeout=self.operation_timeout)
-        except HTTPError as e:
-            raise RequestError("recognition request failed: {}".format(e.reason))
-        except URLError as e:
-            raise RequestError("recognition connection failed: {}".format(e.reason))
-        response_text = response.read().decode("utf-8")
-        result = json.loads(response_text)
+        return request
 
-        # return results
+    @staticmethod
+    def _ibm_result(result, show_all):
         if show_all:
             return result
         if "results" not in result or len(result["results"]) < 1 or "alternatives" not in result["results"][0]:
@@ -1157,6 +1435,334 @@ class Recognizer(AudioSource):
                 return human_string
 
 
+class AzureTokenCache(object):
+    """
+    Caches Microsoft Azure Speech access tokens by subscription key and location, for all the ``Recognizer`` instances and threads in the process. ``recognizer_instance.recognize_azure`` uses the one in ``speech_recognition.azure_token_cache``.
+
+    Tokens are valid for ``TOKEN_LIFETIME`` seconds. Once a token is ``refresh_after`` seconds old, the next request for it starts fetching a new one in a background thread, and gets the old one in the meantime, so that requests only wait for a token when there's no valid one at all. At most one token is fetched at a time for each key and location: concurrent requests for a token that isn't cached wait for the same fetch.
+    """
+
+    TOKEN_LIFETIME = 600  # according to https://learn.microsoft.com/en-us/azure/ai-services/speech-service/rest-speech-to-text-short#authentication, tokens expire in exactly 10 minutes
+
+    def __init__(self, refresh_after=540):
+        assert 0 <= refresh_after <= self.TOKEN_LIFETIME, "``refresh_after`` must be between 0 and ``TOKEN_LIFETIME`` seconds"
+        self.refresh_after = refresh_after
+        self._tokens = {}  # ``(key, location)`` -> ``_CachedToken``
+        self._lock = threading.Lock()
+
+    def get(self, key, location, fetch_token):
+        """
+        Returns a valid access token for ``key`` and ``location``, calling ``fetch_token()`` to get a new one if needed.
+
+        ``fetch_token`` is a function that requests a new token and returns it, or raises an exception (which is raised from here too, if there is no valid token to return instead).
+        """
+        token = self.peek(key, location, fetch_token)
+        if token is not None:
+            return token
+        cached = self._cached_token(key, location)
+        with cached.fetch_lock:
+            if not cached.is_valid():  # otherwise, another thread fetched it while this one was waiting
+                cached.fetch(fetch_token)
+            return cached.token
+
+    def peek(self, key, location, fetch_token):
+        """Returns the cached access token for ``key`` and ``location`` if it's valid, or ``None`` otherwise, without waiting. Starts refreshing the token in the background with ``fetch_token`` if it's due."""
+        cached = self._cached_token(key, location)
+        with self._lock:
+            if not cached.is_valid():
+                return None
+            refresh = not cached.refreshing and time.monotonic() >= cached.fetched_at + self.refresh_after
+            if refresh: cached.refreshing = True
+            token = cached.token
+        if refresh:
+            threading.Thread(target=self._refresh, args=(cached, fetch_token), daemon=True).start()
+        return token
+
+    def clear(self):
+        """Discards the cached tokens."""
+        with self._lock:
+            self._tokens.clear()
+
+    def _cached_token(self, key, location):
+        with self._lock:
+            return self._tokens.setdefault((key, location), _CachedToken(self.TOKEN_LIFETIME))
+
+    def _refresh(self, cached, fetch_token):
+        try:
+            with cached.fetch_lock:
+                cached.fetch(fetch_token)
+        except Exception:  # the old token is still valid for now; once it expires, the next request fetches a token itself, and gets the error
+            pass
+        finally:
+            cached.refreshing = False
+
+
+class _CachedToken(object):
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+        self.token = None
+        self.fetched_at = None  # ``time.monotonic()`` when the request for ``token`` was sent, since the token's lifetime starts when the server issues it
+        self.refreshing = False
+        self.fetch_lock = threading.Lock()
+
+    def is_valid(self):
+        return self.token is not None and time.monotonic() < self.fetched_at + self.lifetime
+
+    def fetch(self, fetch_token):
+        fetched_at = time.monotonic()
+        token = fetch_token()
+        self.fetched_at = fetched_at  # before the token, so that a new token never has an old time
+        self.token = token
+
+
+azure_token_cache = AzureTokenCache()
+
+
+class BackgroundListener(object):
+    """
+    Captures phrases from an ``AudioSource`` on one thread, and passes them to a callback on a pool of worker threads, through a bounded queue. Returned by ``recognizer_instance.listen_in_background``; call it to stop listening.
+    """
+
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest", "block")
+
+    def __init__(self, recognizer, source, callback, phrase_time_limit=None, workers=1, max_queue_size=10, overflow="drop_oldest"):
+        assert isinstance(workers, int) and workers > 0, "``workers`` must be a positive integer"
+        assert max_queue_size is None or (isinstance(max_queue_size, int) and max_queue_size > 0), "``max_queue_size`` must be a positive integer or ``None``"
+        assert overflow in self.OVERFLOW_POLICIES, "``overflow`` must be one of {}".format(", ".join(self.OVERFLOW_POLICIES))
+        self.recognizer = recognizer
+        self.source = source
+        self.callback = callback
+        self.phrase_time_limit = phrase_time_limit
+        self.overflow = overflow
+        self.running = True
+        self.queue = queue.Queue(max_queue_size or 0)  # phrases waiting for a worker; a ``None`` tells a worker to stop
+
+        self.phrases_captured = 0  # phrases read from the source
+        self.phrases_dropped = 0  # phrases discarded because the queue was full
+        self.callback_errors = 0  # calls to ``callback`` that raised an exception
+        self._counter_lock = threading.Lock()
+
+        self.capture_thread = threading.Thread(target=self._capture, daemon=True)
+        self.worker_threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self.worker_threads: thread.start()
+        self.capture_thread.start()
+
+    @property
+    def queue_depth(self):
+        """The number of captured phrases waiting for a worker."""
+        return self.queue.qsize()
+
+    def __call__(self, wait_for_stop=True):
+        """Requests that the background threads stop, and waits for them to stop (which can take around 1 second) if ``wait_for_stop`` is truthy. Phrases still in the queue are discarded."""
+        self.running = False
+        if wait_for_stop:
+            self.capture_thread.join()
+            for thread in self.worker_threads: thread.join()
+
+    def _capture(self):
+        try:
+            with self.source as s:
+                while self.running:
+                    try:  # listen for 1 second, then check again if the stop function has been called
+                        audio = self.recognizer.listen(s, 1, self.phrase_time_limit)
+                    except WaitTimeoutError:  # listening timed out, just try again
+                        continue
+                    if self.running: self._enqueue(audio)
+        finally:
+            # discard the phrases nobody will process, then stop the workers
+            while True:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    break
+            for _ in self.worker_threads: self.queue.put(None)
+
+    def _enqueue(self, audio):
+        with self._counter_lock: self.phrases_captured += 1
+        while self.running:
+            try:
+                if self.overflow == "block":
+                    self.queue.put(audio, timeout=0.1)  # wake up now and then to check if listening has stopped
+                else:
+                    self.queue.put_nowait(audio)
+                return
+            except queue.Full:
+                if self.overflow == "block": continue
+                if self.overflow == "drop_oldest":
+                    try:
+                        self.queue.get_nowait()
+                    except queue.Empty:  # a worker took it in the meantime
+                        continue
+                with self._counter_lock: self.phrases_dropped += 1
+                if self.overflow == "drop_newest": return
+
+    def _work(self):
+        while True:
+            audio = self.queue.get()
+            if audio is None: break
+            if not self.running: continue
+            try:
+                self.callback(self.recognizer, audio)
+            except Exception:  # keep the worker going, but report the error like an uncaught exception in a thread would
+                with self._counter_lock: self.callback_errors += 1
+                traceback.print_exc()
+
+
+def _wav_request_body(audio_data, convert_rate, convert_width):
+    """
+    Returns the WAV file of ``audio_data`` to send as a request body: bytes for an ``AudioData`` instance, or, for an iterable of ``AudioData`` chunks, an iterator that produces the WAV file as the chunks are produced, to send with chunked transfer encoding.
+
+    ``convert_rate`` is a function that takes the sample rate of the audio, and returns the sample rate to convert it to, or ``None`` to keep it.
+    """
+    if isinstance(audio_data, AudioData):
+        return audio_data.get_wav_data(convert_rate(audio_data.sample_rate), convert_width)
+    assert isinstance(audio_data, Iterable), "Data must be audio data, or an iterable of audio data chunks"
+    chunks = iter(audio_data)
+    first_chunk = next(chunks, None)  # the sample rate to convert to depends on the audio
+    assert isinstance(first_chunk, AudioData), "Data must be audio data, or an iterable of audio data chunks"
+    return stream_wav_data(itertools.chain([first_chunk], chunks), convert_rate(first_chunk.sample_rate), convert_width)
+
+
+def _recognize_in_process(engine, audio_data, options):
+    return getattr(Recognizer(), "recognize_" + engine)(audio_data, **options)
+
+
+def _batch_results(audio_datas, submit, ahead, executor):
+    """Yields the results of ``submit(audio_data)`` futures in order, submitting up to ``ahead`` of them before they're needed, then shuts ``executor`` down (unless it's ``None``)."""
+    pending = collections.deque()
+    try:
+        for audio_data in audio_datas:
+            pending.append(submit(audio_data))
+            if len(pending) >= ahead:
+                yield _future_result(pending.popleft())
+        while pending:
+            yield _future_result(pending.popleft())
+    finally:
+        for future in pending: future.cancel()
+        if executor is not None: executor.shutdown(wait=True, cancel_futures=True)
+
+
+_PERMANENT_ERRORS = (UnknownValueError, SetupError, AssertionError, TypeError, ValueError)  # exceptions that recognizing the same audio again would raise again
+
+
+def _stitch_results(results, offsets, separator):
+    """Joins the results of the chunks of ``recognizer_instance.transcribe_long``, which start ``offsets`` seconds into the audio; see that method."""
+    for result in results:
+        if isinstance(result, Exception) and not isinstance(result, UnknownValueError):
+            raise result
+    recognized = [(offset, result) for offset, result in zip(offsets, results) if not isinstance(result, UnknownValueError)]
+    if not recognized: raise UnknownValueError()
+
+    if all(isinstance(result, str) for _, result in recognized):
+        return separator.join(result.strip() for _, result in recognized)
+    if all(isinstance(result, dict) and "text" in result for _, result in recognized):
+        stitched = dict(recognized[0][1])
+        stitched["text"] = separator.join(result["text"].strip() for _, result in recognized)
+        for key in ("segments", "words"):
+            if all(key in result for _, result in recognized):
+                stitched[key] = [_shift_timestamps(item, offset) for offset, result in recognized for item in result[key]]
+        return stitched
+    return recognized
+
+
+def _shift_timestamps(item, offset):
+    """Returns a copy of ``item``, a segment or word of a transcription (a dictionary, dataclass or named tuple), with its ``start`` and ``end`` times, and those of its ``words``, ``offset`` seconds later."""
+    get = item.get if isinstance(item, dict) else lambda name: getattr(item, name, None)
+    changes = {name: get(name) + offset for name in ("start", "end") if isinstance(get(name), (int, float))}
+    if get("words"):
+        changes["words"] = [_shift_timestamps(word, offset) for word in get("words")]
+    if isinstance(item, dict):
+        return {**item, **changes}
+    if dataclasses.is_dataclass(item):
+        return dataclasses.replace(item, **changes)
+    if hasattr(item, "_replace"):
+        return item._replace(**changes)
+    return item
+
+
+def _future_result(future):
+    try:
+        return future.result()
+    except Exception as e:
+        return e
+
+
+def _frame_energies(audio_data, frame_size):
+    """Returns the energy of each consecutive ``frame_size``-sample frame of ``audio_data`` (the last one may be shorter), computed the same way as ``audioop.rms``."""
+    try:
+        import numpy as np
+    except ImportError:  # compute energies one frame at a time instead
+        raw_data = audio_data.get_raw_data()
+        if audio_data.sample_width == 1: raw_data = audioop.bias(raw_data, 1, -128)  # make 8-bit samples signed, as ``audioop`` expects
+        frame_bytes = frame_size * audio_data.sample_width
+        return [audioop.rms(raw_data[i:i + frame_bytes], audio_data.sample_width) for i in range(0, len(raw_data), frame_bytes)]
+
+    samples = audio_data.as_array()
+    sums, lengths = [], []
+    block_size = frame_size * max(1, 1048576 // frame_size)  # convert a whole number of frames at a time, so that there's never a float copy of all the audio
+    for start in range(0, len(samples), block_size):
+        block = samples[start:start + block_size].astype(np.float64)
+        if audio_data.sample_width == 1: block -= 128  # 8-bit samples are unsigned
+        whole_frames = len(block) // frame_size * frame_size
+        frames = block[:whole_frames].reshape(-1, frame_size)
+        sums.append(np.einsum("ij,ij->i", frames, frames))
+        lengths.append(np.full(len(frames), frame_size))
+        if whole_frames < len(block):  # the last frame is shorter
+            sums.append(np.array([np.dot(block[whole_frames:], block[whole_frames:])]))
+            lengths.append(np.array([len(block) - whole_frames]))
+    if not sums:
+        return []
+    return np.floor(np.sqrt(np.concatenate(sums) / np.concatenate(lengths))).tolist()  # ``audioop.rms`` rounds down to an integer
+
+
+class _FrameReader(object):
+    """
+    Reads buffers of ``source.CHUNK`` frames from ``source.stream``, and hands them out ``frame_size`` frames at a time.
+
+    After listening, ``unread`` gives back the rest of the last buffer read: the streams of ``AudioFile`` sources, which seek by frame, are moved back to where it starts, and otherwise it's kept in the reader to be handed out first the next time.
+    """
+
+    def __init__(self, source, frame_size):
+        self.stream = source.stream
+        self.seeks_by_frame = isinstance(source, AudioFile)  # other streams may have a ``seek`` method that counts something else, such as bytes
+        self.chunk_size = source.CHUNK
+        self.frame_size = frame_size
+        self.sample_width = source.SAMPLE_WIDTH
+        self.buffer = b""
+        self.position = 0  # offset into ``self.buffer`` of the next frame to hand out
+
+    def read(self):
+        """Returns the next ``frame_size`` frames (fewer at the end of the stream, and none once it has ended)."""
+        frame_bytes = self.frame_size * self.sample_width
+        pieces = []  # frames that span several buffers are put together from pieces of each
+        while frame_bytes > 0:
+            if self.position >= len(self.buffer):
+                self.buffer, self.position = self.stream.read(self.chunk_size), 0
+                if len(self.buffer) == 0: break  # reached end of the stream
+                if not pieces and len(self.buffer) == frame_bytes:  # hand out whole buffers as they are
+                    self.position = len(self.buffer)
+                    return self.buffer
+                self.buffer = memoryview(self.buffer)  # slices of the buffer shouldn't copy it
+            piece = self.buffer[self.position:self.position + frame_bytes]
+            self.position += len(piece)
+            frame_bytes -= len(piece)
+            pieces.append(piece)
+        if len(pieces) == 1:
+            return pieces[0]
+        return b"".join(pieces)
+
+    def unread(self):
+        """Gives back the frames that were read from the stream but not handed out, and returns whether they're still held by this reader."""
+        remaining = len(self.buffer) - self.position
+        if remaining == 0:
+            return False
+        if self.seeks_by_frame:
+            self.stream.seek(self.stream.tell() - remaining // self.sample_width)
+            self.buffer, self.position = b"", 0
+            return False
+        return True
+
+
 class PortableNamedTemporaryFile(object):
     """Limited replacement for ``tempfile.NamedTemporaryFile``, except unlike ``tempfile.NamedTemporaryFile``, the file can be opened again while it's currently open, even on Windows."""
     def __init__(self, mode="w+b"):
@@ -1196,12 +1802,17 @@ except (ModuleNotFoundError, ImportError):
     pass
 else:
     Recognizer.recognize_google = google.recognize_legacy  # type: ignore[attr-defined]
+    Recognizer.recognize_google_async = google.recognize_legacy_async  # type: ignore[attr-defined]
     Recognizer.recognize_google_cloud = google_cloud.recognize  # type: ignore[attr-defined]
+    Recognizer.recognize_google_cloud_streaming = google_cloud.recognize_streaming  # type: ignore[attr-defined]
     Recognizer.recognize_whisper = whisper.recognize  # type: ignore[attr-defined]
     Recognizer.recognize_faster_whisper = faster_whisper.recognize  # type: ignore[attr-defined]
     Recognizer.recognize_openai = openai.recognize  # type: ignore[attr-defined]
+    Recognizer.recognize_openai_async = openai.recognize_async  # type: ignore[attr-defined]
     Recognizer.recognize_groq = groq.recognize  # type: ignore[attr-defined]
+    Recognizer.recognize_groq_async = groq.recognize_async  # type: ignore[attr-defined]
     Recognizer.recognize_cohere_api = cohere_api.recognize  # type: ignore[attr-defined]
+    Recognizer.recognize_cohere_api_async = cohere_api.recognize_async  # type: ignore[attr-defined]
     Recognizer.recognize_sphinx = pocketsphinx.recognize  # type: ignore[attr-defined]
     Recognizer.recognize_vosk = vosk.recognize  # type: ignore[attr-defined]
 
@@ -2,13 +2,54 @@ from __future__ import annotations
 
 import aifc
 import audioop
+import functools
 import io
+import itertools
 import os
 import platform
 import stat
-import subprocess
+import struct
 import sys
+import threading
 import wave
+from collections import OrderedDict
+
+from speech_recognition import flac
+from speech_recognition.resampling import RawResampler, resample_raw
+
+# silence detection of ``AudioData.split``, as in ``librosa.effects.split``: the level of frames of ``_SILENCE_FRAME_LENGTH`` samples is measured every ``_SILENCE_HOP_LENGTH`` samples, and frames more than ``_SILENCE_TOP_DB`` dB below the loudest one near a cut are silent
+_SILENCE_TOP_DB = 40.0
+_SILENCE_FRAME_LENGTH = 2048
+_SILENCE_HOP_LENGTH = 512
+# hops of samples converted to floats at a time while measuring frame levels, which bounds the memory used for long recordings
+_SILENCE_BLOCK_HOPS = 2048
+
+
+def _cached_conversion(format, *attributes):
+    """Memoizes an ``AudioData.get_*_data(convert_rate, convert_width)`` method in the instance's conversion cache; ``attributes`` name any instance attributes the result also depends on."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, convert_rate=None, convert_width=None):
+            if convert_rate == self.sample_rate:
+                convert_rate = None  # resampling to the same rate is a no-op, so share the cache entry
+            if (
+                format == "raw"
+                and convert_rate is None
+                and convert_width is None
+                and isinstance(self.frame_data, bytes)
+            ):
+                return method(self)  # nothing to convert, ``frame_data`` is returned as-is
+            key = (format, convert_rate, convert_width) + tuple(
+                getattr(self, name) for name in attributes
+            )
+            return self._get_or_convert(
+                key, lambda: method(self, convert_rate, convert_width)
+            )
+
+        return wrapper
+
+    return decorator
 
 
 class AudioData(object):
@@ -17,6 +58,8 @@ class AudioData(object):
 
     The raw audio data is specified by ``frame_data``, which is a sequence of bytes representing audio samples. This is the frame data structure used by the PCM WAV format.
 
+    ``frame_data`` can also be any C-contiguous object supporting the buffer protocol, such as a ``bytearray``, ``memoryview``, ``mmap`` or NumPy array, holding little-endian samples. Such data is not copied: it is kept as a flat ``memoryview``, and ``get_segment`` and ``split`` return ``AudioData`` instances that are views into the same memory (for ``bytes``, they return ``bytes`` as usual). Note that a view keeps the whole underlying buffer alive, and that changes to a mutable buffer are visible through every view of it.
+
     The width of each sample, in bytes, is specified by ``sample_width``. Each group of ``sample_width`` bytes represents a single audio sample.
 
     The audio data is assumed to have a sample rate of ``sample_rate`` samples per second (Hertz).
@@ -26,14 +69,91 @@ class AudioData(object):
 
     _WAV_HEADER_OVERHEAD = 44
 
+    # byte budget of each instance's conversion cache; set to 0 to disable caching
+    conversion_cache_max_bytes = 64 * 1024 * 1024
+
+    # FLAC encoder used by ``get_flac_data``, or ``None`` to use ``flac.get_default_encoder()``; a plain function can be set here or on an instance, since it's looked up without being bound as a method
+    flac_encoder = None
+    # between 0 (fastest) and 8 (smallest)
+    flac_compression_level = flac.DEFAULT_COMPRESSION_LEVEL
+
     def __init__(self, frame_data, sample_rate, sample_width):
         assert sample_rate > 0, "Sample rate must be a positive integer"
         assert (
             sample_width % 1 == 0 and 1 <= sample_width <= 4
         ), "Sample width must be between 1 and 4 inclusive"
+        if not isinstance(frame_data, (bytes, memoryview)):
+            try:
+                frame_data = memoryview(frame_data)
+            except TypeError:  # not a buffer; store it as given, as before
+                pass
+        if isinstance(frame_data, memoryview) and (
+            frame_data.format != "B" or frame_data.ndim != 1
+        ):
+            frame_data = frame_data.cast("B")  # flat byte view of the same memory
         self.frame_data = frame_data
         self.sample_rate = sample_rate
         self.sample_width = int(sample_width)
+        self._init_conversion_cache()
+
+    def _init_conversion_cache(self):
+        self._conversion_cache = OrderedDict()  # ``(format, convert_rate, convert_width)`` -> converted data, least recently used first
+        self._conversion_cache_bytes = 0
+        self._conversion_locks = {}  # per-key locks, so that each conversion only runs once even when requested concurrently
+        self._conversion_cache_lock = threading.Lock()
+
+    def __getstate__(self):
+        # memoryviews can't be pickled; send views as the bytes they refer to
+        state = self.__dict__.copy()
+        if not isinstance(self.frame_data, bytes):
+            state["frame_data"] = bytes(self.frame_data)
+        # the conversion cache is cheap to rebuild compared to sending it along
+        for name in ("_conversion_cache", "_conversion_cache_bytes", "_conversion_locks", "_conversion_cache_lock"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_conversion_cache()
+
+    def clear_conversion_cache(self):
+        """
+        Discards the memoized results of ``get_raw_data``, ``get_wav_data``, ``get_aiff_data`` and ``get_flac_data``.
+
+        Conversions are cached per instance, keyed by output format, sample rate and sample width, so that fanning the same audio out to several recognizers only converts it once. Call this after modifying the buffer behind ``frame_data`` in place, or to release the memory early.
+        """
+        with self._conversion_cache_lock:
+            self._conversion_cache.clear()
+            self._conversion_cache_bytes = 0
+
+    def _get_or_convert(self, key, convert):
+        max_bytes = self.conversion_cache_max_bytes
+        if not max_bytes or max_bytes <= 0:
+            return convert()
+
+        with self._conversion_cache_lock:
+            if key in self._conversion_cache:
+                self._conversion_cache.move_to_end(key)
+                return self._conversion_cache[key]
+            key_lock = self._conversion_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._conversion_cache_lock:  # another thread may have finished the same conversion while we waited
+                if key in self._conversion_cache:
+                    self._conversion_cache.move_to_end(key)
+                    return self._conversion_cache[key]
+
+            result = convert()
+
+            with self._conversion_cache_lock:
+                self._conversion_locks.pop(key, None)
+                if len(result) <= max_bytes:
+                    self._conversion_cache[key] = result
+                    self._conversion_cache_bytes += len(result)
+                    while self._conversion_cache_bytes > max_bytes:
+                        _, evicted = self._conversion_cache.popitem(last=False)
+                        self._conversion_cache_bytes -= len(evicted)
+            return result
 
     @classmethod
     def from_file(cls, file_path: str) -> AudioData:
@@ -49,6 +169,8 @@ class AudioData(object):
         Returns a new ``AudioData`` instance, trimmed to a given time interval. In other words, an ``AudioData`` instance with the same audio data except starting at ``start_ms`` milliseconds in and ending ``end_ms`` milliseconds in.
 
         If not specified, ``start_ms`` defaults to the beginning of the audio, and ``end_ms`` defaults to the end.
+
+        If ``frame_data`` is ``bytes``, so is the returned instance's. Otherwise, the audio data is not copied: the returned instance is a view into this instance's ``frame_data``.
         """
         assert (
             start_ms is None or start_ms >= 0
@@ -69,30 +191,78 @@ class AudioData(object):
                 (end_ms * self.sample_rate * self.sample_width) // 1000
             )
         return AudioData(
-            self.frame_data[start_byte:end_byte],
+            self._slice(start_byte, end_byte),
             self.sample_rate,
             self.sample_width,
         )
 
+    def _slice(self, start_byte, end_byte):
+        # ``bytes`` stay ``bytes``, so that callers can keep using them as such; other buffers are sliced without copying
+        if isinstance(self.frame_data, bytes):
+            return self.frame_data[start_byte:end_byte]
+        return self._view()[start_byte:end_byte]
+
+    def _view(self):
+        return (
+            self.frame_data
+            if isinstance(self.frame_data, memoryview)
+            else memoryview(self.frame_data)
+        )
+
+    def as_array(self):
+        """
+        Returns the audio samples as a one-dimensional NumPy array of integers, without copying the audio data when possible.
+
+        8-bit audio is returned as unsigned ``uint8`` samples (as in WAV files); 16-bit and 32-bit audio as little-endian ``int16`` and ``int32`` samples. The array shares memory with ``frame_data``, so it is read-only when ``frame_data`` is ``bytes``.
+
+        NumPy has no 24-bit integer type, so 24-bit audio is the exception: it is copied into a new ``int32`` array with the same sample values. Requires ``numpy``.
+        """
+        import numpy as np
+
+        if self.sample_width == 3:
+            packed = np.frombuffer(self.frame_data, dtype=np.uint8).reshape(-1, 3)
+            widened = np.zeros(len(packed), dtype="<i4")
+            widened.view(np.uint8).reshape(-1, 4)[:, 1:] = packed
+            widened >>= 8  # arithmetic shift, so this sign-extends the 24-bit samples
+            return widened
+        dtype = {1: np.uint8, 2: "<i2", 4: "<i4"}[self.sample_width]
+        return np.frombuffer(self.frame_data, dtype=dtype)
+
     def split(
-        self, max_bytes: int, *, silence_aware: bool = False
+        self,
+        max_bytes: int,
+        *,
+        silence_aware: bool = False,
+        silence_backend: str = "numpy",
     ) -> list[AudioData]:
         """
         Splits this audio into a list of ``AudioData`` chunks targeting ``max_bytes`` per chunk when serialized as WAV (via ``get_wav_data()``).
 
+        Like ``get_segment``, the returned chunks hold ``bytes`` if this instance's ``frame_data`` is ``bytes``, and are views into it rather than copies otherwise.
+
         When ``silence_aware=False`` (the default), splits the audio mechanically on sample boundaries; each returned chunk's WAV-serialized size is guaranteed to be at most ``max_bytes``. No optional dependency is required.
 
-        When ``silence_aware=True``, chooses chunk boundaries near silences via ``librosa.effects.split`` while keeping every chunk within ``max_bytes`` (the boundary search looks only before the target, never past it). When no suitable silence boundary is found in the look-back window, the chunk is cut at the size-derived target the same way as the fixed-time mode. Requires ``librosa`` and ``numpy``; raises ``SetupError`` if they are not installed or fail to initialize at runtime.
+        When ``silence_aware=True``, chooses chunk boundaries near silences while keeping every chunk within ``max_bytes`` (the boundary search looks only before the target, never past it). When no suitable silence boundary is found in the look-back window, the chunk is cut at the size-derived target the same way as the fixed-time mode. Silences are found by ``silence_backend``:
+
+        * ``"numpy"`` (the default) measures the level of every frame of the audio in one vectorized pass, converting a block of samples at a time, then picks the cut points from those levels. Requires ``numpy``; raises ``SetupError`` if it is not installed.
+        * ``"librosa"`` calls ``librosa.effects.split`` on each look-back window. It finds the same silences (to within a few milliseconds, since it measures the frames of each window separately), but is much slower on long recordings. Requires ``librosa`` and ``numpy``; raises ``SetupError`` if they are not installed or fail to initialize at runtime.
 
-        Raises ``ValueError`` if ``len(frame_data)`` is not a multiple of ``sample_width`` (which ``AudioData`` would otherwise accept), since enforcing the ``max_bytes`` cap requires sample-aligned input.
+        Raises ``ValueError`` if ``silence_backend`` is neither ``"numpy"`` nor ``"librosa"``, or if ``len(frame_data)`` is not a multiple of ``sample_width`` (which ``AudioData`` would otherwise accept), since enforcing the ``max_bytes`` cap requires sample-aligned input.
 
-        Returns ``[self]`` unchanged when the audio already fits within ``max_bytes`` (even when ``silence_aware=True``, in which case the librosa import is skipped).
+        Returns ``[self]`` unchanged when the audio already fits within ``max_bytes`` (even when ``silence_aware=True``, in which case no optional dependency is imported).
 
         Example::
 
             chunks = audio.split(max_bytes=24 * 1024 * 1024)
             texts = [r.recognize_openai(c) for c in chunks]
+
+        To recognize the chunks concurrently and join the results, use ``recognizer_instance.transcribe_long`` instead.
         """
+        if silence_backend not in ("numpy", "librosa"):
+            raise ValueError(
+                "``silence_backend`` must be \"numpy\" or \"librosa\"; "
+                f"got {silence_backend!r}"
+            )
         min_required = self._WAV_HEADER_OVERHEAD + self.sample_width
         if max_bytes < min_required:
             raise ValueError(
@@ -115,7 +285,7 @@ class AudioData(object):
             return [self]
 
         if silence_aware:
-            return self._split_silence_aware(max_bytes)
+            return self._split_silence_aware(max_bytes, silence_backend)
         return self._split_fixed(max_bytes)
 
     def _split_fixed(self, max_bytes: int) -> list[AudioData]:
@@ -126,45 +296,25 @@ class AudioData(object):
         for start in range(0, len(self.frame_data), chunk_size):
             chunks.append(
                 AudioData(
-                    self.frame_data[start:start + chunk_size],
+                    self._slice(start, start + chunk_size),
                     self.sample_rate,
                     self.sample_width,
                 )
             )
         return chunks
 
-    def _split_silence_aware(self, max_bytes: int) -> list[AudioData]:
-        # Force-load the exact dependencies we use so that lazy import or
-        # numba-style runtime errors from librosa surface here as a single
-        # ``SetupError`` rather than escaping later mid-loop.
-        try:
-            import numpy as np
-            from librosa.effects import split as librosa_split
-        except Exception as exc:
-            from speech_recognition.exceptions import SetupError
-
-            if isinstance(exc, ImportError):
-                hint = (
-                    "install them with `pip install "
-                    "SpeechRecognition[audio-split]`"
-                )
-            else:
-                hint = (
-                    "the package(s) appear installed but failed to "
-                    "initialize; check environment-specific issues such "
-                    "as a non-writable numba cache directory"
-                )
-            raise SetupError(
-                "silence-aware splitting could not initialize librosa/numpy: "
-                f"{type(exc).__name__}: {exc}. {hint}."
-            ) from exc
+    def _split_silence_aware(
+        self, max_bytes: int, silence_backend: str
+    ) -> list[AudioData]:
+        if silence_backend == "librosa":
+            silence_edges = self._librosa_silence_edges()
+        else:
+            silence_edges = self._numpy_silence_edges()
 
         target_payload = max_bytes - self._WAV_HEADER_OVERHEAD
         chunk_samples = target_payload // self.sample_width
 
-        sw = self.sample_width
-        total_samples = len(self.frame_data) // sw
-        silence_top_db = 40.0
+        total_samples = len(self.frame_data) // self.sample_width
         min_progress_samples = self.sample_rate // 2
         # Search window stays entirely before ``target`` so ``max_bytes`` is
         # a hard ceiling on chunk size. Quality is recovered by snapping to
@@ -184,44 +334,7 @@ class AudioData(object):
 
             proposed_end = target
             if search_end > search_start:
-                # Materialize only the search window as float to keep peak
-                # memory bounded by the window size (≈ seconds of audio),
-                # not the entire recording (potentially hours).
-                segment = self._to_float_ndarray(
-                    np,
-                    raw=self.frame_data[
-                        search_start * sw:search_end * sw
-                    ],
-                )
-                # Call-time numba JIT/cache failures inside librosa can
-                # raise long after our import probe; translate them into
-                # the same SetupError surface.
-                try:
-                    nonsilent_ranges = librosa_split(
-                        segment,
-                        top_db=silence_top_db,
-                        frame_length=2048,
-                        hop_length=512,
-                    )
-                except Exception as exc:
-                    from speech_recognition.exceptions import SetupError
-
-                    raise SetupError(
-                        "librosa.effects.split failed during invocation: "
-                        f"{type(exc).__name__}: {exc}. The package is "
-                        "installed but its runtime backend (numba/llvmlite) "
-                        "could not initialize in this environment."
-                    ) from exc
-                segment_len = len(segment)
-                candidates = []
-                for nonsilent_range in nonsilent_ranges:
-                    start_idx = int(nonsilent_range[0])
-                    end_idx = int(nonsilent_range[1])
-                    if start_idx > 0:
-                        candidates.append(search_start + start_idx)
-                    if end_idx < segment_len:
-                        candidates.append(search_start + end_idx)
-
+                candidates = silence_edges(search_start, search_end)
                 min_allowed = start + min_progress_samples
                 valid = [
                     c for c in candidates if min_allowed < c <= search_end
@@ -245,49 +358,207 @@ class AudioData(object):
             byte_end = sample_end * self.sample_width
             chunks.append(
                 AudioData(
-                    self.frame_data[byte_start:byte_end],
+                    self._slice(byte_start, byte_end),
                     self.sample_rate,
                     self.sample_width,
                 )
             )
         return chunks
 
+    def _numpy_silence_edges(self):
+        # Returns a function giving the samples between ``search_start`` and
+        # ``search_end`` where silence starts or ends, from frame levels
+        # measured once for the whole recording.
+        try:
+            import numpy as np
+        except ImportError as exc:
+            from speech_recognition.exceptions import SetupError
+
+            raise SetupError(
+                "silence-aware splitting requires numpy: install it with "
+                "`pip install numpy`."
+            ) from exc
+
+        levels = self._frame_levels_db(np)
+        hop = _SILENCE_HOP_LENGTH
+
+        def silence_edges(search_start, search_end):
+            # frames centered in the window, like the frames librosa would
+            # measure in the window on its own
+            first = -(-search_start // hop)
+            window = levels[first:-(-search_end // hop)]
+            if len(window) < 2:
+                return []
+            nonsilent = window > window.max() - _SILENCE_TOP_DB
+            changes = np.flatnonzero(nonsilent[1:] != nonsilent[:-1]) + 1
+            return ((changes + first) * hop).tolist()
+
+        return silence_edges
+
+    def _frame_levels_db(self, np):
+        # Level in dB of the frame centered on every ``_SILENCE_HOP_LENGTH``th
+        # sample, zero-padded at both ends, which is what
+        # ``librosa.effects.split`` compares against ``top_db``. Only one
+        # block of samples is converted to floats at a time; what's kept is
+        # one value per hop.
+        sw = self.sample_width
+        hop = _SILENCE_HOP_LENGTH
+        hops_per_frame = _SILENCE_FRAME_LENGTH // hop
+        view = self._view()
+        total_samples = len(view) // sw
+
+        hop_energies = np.zeros(
+            -(-total_samples // hop) + hops_per_frame, dtype=np.float64
+        )
+        offset = hops_per_frame // 2  # padding before the first hop
+        block_samples = _SILENCE_BLOCK_HOPS * hop
+        for block_start in range(0, total_samples, block_samples):
+            samples = self._to_float_ndarray(
+                np, raw=view[block_start * sw:(block_start + block_samples) * sw]
+            )
+            if len(samples) % hop:
+                samples = np.concatenate(
+                    [samples, np.zeros(hop - len(samples) % hop, np.float32)]
+                )
+            hops = samples.reshape(-1, hop).astype(np.float64)
+            first_hop = offset + block_start // hop
+            hop_energies[first_hop:first_hop + len(hops)] = np.einsum(
+                "ij,ij->i", hops, hops
+            )
+
+        frame_count = 1 + total_samples // hop
+        frame_energies = sum(
+            hop_energies[i:i + frame_count] for i in range(hops_per_frame)
+        )
+        mean_squares = frame_energies / _SILENCE_FRAME_LENGTH
+        return 10.0 * np.log10(np.maximum(mean_squares, 1e-10))
+
+    def _librosa_silence_edges(self):
+        # Force-load the exact dependencies we use so that lazy import or
+        # numba-style runtime errors from librosa surface here as a single
+        # ``SetupError`` rather than escaping later mid-loop.
+        try:
+            import numpy as np
+            from librosa.effects import split as librosa_split
+        except Exception as exc:
+            from speech_recognition.exceptions import SetupError
+
+            if isinstance(exc, ImportError):
+                hint = (
+                    "install them with `pip install "
+                    "SpeechRecognition[audio-split]`"
+                )
+            else:
+                hint = (
+                    "the package(s) appear installed but failed to "
+                    "initialize; check environment-specific issues such "
+                    "as a non-writable numba cache directory"
+                )
+            raise SetupError(
+                "silence-aware splitting could not initialize librosa/numpy: "
+                f"{type(exc).__name__}: {exc}. {hint}."
+            ) from exc
+
+        sw = self.sample_width
+
+        def silence_edges(search_start, search_end):
+            # Materialize only the search window as float to keep peak
+            # memory bounded by the window size (≈ seconds of audio),
+            # not the entire recording (potentially hours).
+            segment = self._to_float_ndarray(
+                np,
+                raw=self._view()[search_start * sw:search_end * sw],
+            )
+            # Call-time numba JIT/cache failures inside librosa can
+            # raise long after our import probe; translate them into
+            # the same SetupError surface.
+            try:
+                nonsilent_ranges = librosa_split(
+                    segment,
+                    top_db=_SILENCE_TOP_DB,
+                    frame_length=_SILENCE_FRAME_LENGTH,
+                    hop_length=_SILENCE_HOP_LENGTH,
+                )
+            except Exception as exc:
+                from speech_recognition.exceptions import SetupError
+
+                raise SetupError(
+                    "librosa.effects.split failed during invocation: "
+                    f"{type(exc).__name__}: {exc}. The package is "
+                    "installed but its runtime backend (numba/llvmlite) "
+                    "could not initialize in this environment."
+                ) from exc
+
+            segment_len = len(segment)
+            candidates = []
+            for nonsilent_range in nonsilent_ranges:
+                start_idx = int(nonsilent_range[0])
+                end_idx = int(nonsilent_range[1])
+                if start_idx > 0:
+                    candidates.append(search_start + start_idx)
+                if end_idx < segment_len:
+                    candidates.append(search_start + end_idx)
+            return candidates
+
+        return silence_edges
+
     def _to_float_ndarray(self, np, raw=None):
         # WAV PCM frame data is little-endian; use explicit byte-order
-        # dtypes so the conversion is correct on big-endian hosts.
+        # dtypes so the conversion is correct on big-endian hosts. Each
+        # branch allocates only the float32 output and scales it in place.
         if raw is None:
             raw = self.frame_data
         sw = self.sample_width
         if sw == 1:
-            raw = audioop.bias(raw, 1, -128)
-            return np.frombuffer(raw, dtype=np.int8).astype(np.float32) / 128.0
+            samples = np.frombuffer(raw, dtype=np.uint8).astype(np.float32)
+            samples -= 128.0
+            samples *= 1.0 / 128.0
+            return samples
         if sw == 2:
-            return (
-                np.frombuffer(raw, dtype="<i2").astype(np.float32) / 32768.0
-            )
+            samples = np.frombuffer(raw, dtype="<i2").astype(np.float32)
+            samples *= 1.0 / 32768.0
+            return samples
         if sw == 3:
             packed = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 3)
-            pad = np.where(packed[:, 2:3] & 0x80, 0xFF, 0x00).astype(np.uint8)
             # ``packed`` is already in little-endian byte order (low byte
-            # first); append the sign-extension byte at the high end so
-            # the resulting 4-byte rows are little-endian int32.
-            extended = np.concatenate([packed, pad], axis=1)
-            return (
-                extended.view(dtype="<i4").flatten().astype(np.float32)
-                / float(1 << 23)
-            )
+            # first); place it in the upper three bytes of little-endian
+            # int32 rows so the sign bit lands in the int32 sign bit, which
+            # scales every sample by 2 ** 8.
+            widened = np.zeros(len(packed), dtype="<i4")
+            widened.view(np.uint8).reshape(-1, 4)[:, 1:] = packed
+            samples = widened.astype(np.float32)
+            samples *= 1.0 / float(1 << 31)
+            return samples
         if sw == 4:
-            return (
-                np.frombuffer(raw, dtype="<i4").astype(np.float32)
-                / float(1 << 31)
-            )
+            samples = np.frombuffer(raw, dtype="<i4").astype(np.float32)
+            samples *= 1.0 / float(1 << 31)
+            return samples
         raise ValueError(f"Unsupported sample_width: {sw}")
 
+    def get_float_array(self, convert_rate=None):
+        """
+        Returns a contiguous NumPy ``float32`` array of the audio samples, scaled to the range -1.0 to 1.0.
+
+        If ``convert_rate`` is specified and the audio sample rate is not ``convert_rate`` Hz, the resulting audio is resampled to match.
+
+        This is equivalent to decoding ``get_wav_data(convert_rate)`` with an audio library, but converts the samples directly without building and parsing a WAV file. Requires ``numpy``.
+        """
+        import numpy as np
+
+        if convert_rate is None or convert_rate == self.sample_rate:
+            return self._to_float_ndarray(np)
+        # keep 8-bit samples unsigned, which is what ``_to_float_ndarray`` expects for WAV-style frame data
+        raw_data = self.get_raw_data(
+            convert_rate, 1 if self.sample_width == 1 else None
+        )
+        return self._to_float_ndarray(np, raw=raw_data)
+
+    @_cached_conversion("raw")
     def get_raw_data(self, convert_rate=None, convert_width=None):
         """
         Returns a byte string representing the raw frame data for the audio represented by the ``AudioData`` instance.
 
-        If ``convert_rate`` is specified and the audio sample rate is not ``convert_rate`` Hz, the resulting audio is resampled to match.
+        If ``convert_rate`` is specified and the audio sample rate is not ``convert_rate`` Hz, the resulting audio is resampled to match. When NumPy is installed, this uses the anti-aliasing polyphase filter in ``speech_recognition.resampling``; otherwise, it uses ``audioop.ratecv``.
 
         If ``convert_width`` is specified and the audio samples are not ``convert_width`` bytes each, the resulting audio is converted to match.
 
@@ -310,13 +581,8 @@ class AudioData(object):
 
         # resample audio at the desired rate if specified
         if convert_rate is not None and self.sample_rate != convert_rate:
-            raw_data, _ = audioop.ratecv(
-                raw_data,
-                self.sample_width,
-                1,
-                self.sample_rate,
-                convert_rate,
-                None,
+            raw_data = resample_raw(
+                raw_data, self.sample_width, self.sample_rate, convert_rate
             )
 
         # convert samples to desired sample width if specified
@@ -353,8 +619,11 @@ class AudioData(object):
                 raw_data, 1, 128
             )  # add 128 to every sample to make them act like unsigned samples again
 
+        if not isinstance(raw_data, bytes):  # no conversion was needed, but ``frame_data`` is a view
+            raw_data = bytes(raw_data)
         return raw_data
 
+    @_cached_conversion("wav")
     def get_wav_data(self, convert_rate=None, convert_width=None):
         """
         Returns a byte string representing the contents of a WAV file containing the audio represented by the ``AudioData`` instance.
@@ -386,6 +655,7 @@ class AudioData(object):
                 wav_writer.close()
         return wav_data
 
+    @_cached_conversion("aiff")
     def get_aiff_data(self, convert_rate=None, convert_width=None):
         """
         Returns a byte string representing the contents of an AIFF-C file containing the audio represented by the ``AudioData`` instance.
@@ -428,6 +698,17 @@ class AudioData(object):
                 aiff_writer.close()
         return aiff_data
 
+    def _flac_encoder(self):
+        # look ``flac_encoder`` up without the descriptor protocol, so that a function set on the class isn't bound to ``self``
+        if "flac_encoder" in vars(self):
+            return vars(self)["flac_encoder"]
+        for cls in type(self).__mro__:
+            if "flac_encoder" in vars(cls):
+                encoder = vars(cls)["flac_encoder"]
+                return encoder.__func__ if isinstance(encoder, staticmethod) else encoder
+        return None
+
+    @_cached_conversion("flac", "flac_encoder", "flac_compression_level")
     def get_flac_data(self, convert_rate=None, convert_width=None):
         """
         Returns a byte string representing the contents of a FLAC file containing the audio represented by the ``AudioData`` instance.
@@ -439,6 +720,8 @@ class AudioData(object):
         If ``convert_width`` is specified and the audio samples are not ``convert_width`` bytes each, the resulting audio is converted to match.
 
         Writing these bytes directly to a file results in a valid `FLAC file <https://en.wikipedia.org/wiki/FLAC>`__.
+
+        The FLAC data is produced by ``audiodata_instance.flac_encoder`` at compression level ``audiodata_instance.flac_compression_level`` (see ``speech_recognition.flac``). These can be set on an instance, or on the ``AudioData`` class to change the defaults, for example ``AudioData.flac_encoder = speech_recognition.flac.encode_with_subprocess``.
         """
         assert convert_width is None or (
             convert_width % 1 == 0 and 1 <= convert_width <= 3
@@ -449,39 +732,82 @@ class AudioData(object):
         ):  # resulting WAV data would be 32-bit, which is not convertable to FLAC using our encoder
             convert_width = 3  # the largest supported sample width is 24-bit, so we'll limit the sample width to that
 
-        # run the FLAC converter with the WAV data to get the FLAC data
-        wav_data = self.get_wav_data(convert_rate, convert_width)
-        flac_converter = get_flac_converter()
-        if (
-            os.name == "nt"
-        ):  # on Windows, specify that the process is to be started without showing a console window
-            startup_info = subprocess.STARTUPINFO()
-            startup_info.dwFlags |= (
-                subprocess.STARTF_USESHOWWINDOW
-            )  # specify that the wShowWindow field of `startup_info` contains a value
-            startup_info.wShowWindow = (
-                subprocess.SW_HIDE
-            )  # specify that the console window should be hidden
-        else:
-            startup_info = None  # default startupinfo
-        process = subprocess.Popen(
-            [
-                flac_converter,
-                "--stdout",
-                "--totally-silent",  # put the resulting FLAC file in stdout, and make sure it's not mixed with any program output
-                "--best",  # highest level of compression available
-                "-",  # the input FLAC file contents will be given in stdin
-            ],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            startupinfo=startup_info,
+        sample_width = (
+            self.sample_width if convert_width is None else convert_width
         )
-        flac_data, stderr = process.communicate(wav_data)
-        return flac_data
+        encoder = self._flac_encoder() or flac.get_default_encoder()
+        return encoder(
+            self.get_raw_data(convert_rate, convert_width),
+            self.sample_rate if convert_rate is None else convert_rate,
+            sample_width,
+            self.flac_compression_level,
+        )
+
 
+def stream_raw_data(audio_datas, convert_rate=None, convert_width=None):
+    """
+    Yields the frame data of ``audio_datas``, an iterable of consecutive ``AudioData`` instances with the same sample rate and sample width, such as the chunks yielded by ``recognizer_instance.listen(source, stream=True)``. The audio is converted in the same way as ``audiodata_instance.get_raw_data(convert_rate, convert_width)`` converts it.
+
+    Each chunk is converted and yielded as soon as ``audio_datas`` produces it. Resampling keeps its state from one chunk to the next, so the result is the same as converting all the audio at once.
+    """
+    resampler = None
+    for audio_data in audio_datas:
+        assert isinstance(audio_data, AudioData), "Chunks must be audio data"
+        if resampler is None:  # first chunk
+            sample_rate, sample_width = audio_data.sample_rate, audio_data.sample_width
+            resampler = RawResampler(sample_width, sample_rate, sample_rate if convert_rate is None else convert_rate)
+        assert (audio_data.sample_rate, audio_data.sample_width) == (sample_rate, sample_width), "Chunks must all have the same sample rate and sample width"
+        yield _convert_chunk(resampler, audio_data.frame_data, convert_width)
+    if resampler is not None and resampler.from_rate != resampler.to_rate:
+        yield _convert_chunk(resampler, b"", convert_width, final=True)  # the rest of the resampled audio
+
+
+def stream_wav_data(audio_datas, convert_rate=None, convert_width=None):
+    """
+    Yields the contents of a WAV file containing the audio of ``audio_datas``, an iterable of consecutive ``AudioData`` instances like the one ``stream_raw_data`` takes. The audio is converted in the same way as ``audiodata_instance.get_wav_data(convert_rate, convert_width)`` converts it.
 
+    The WAV header is yielded first, and then each chunk is converted and yielded as soon as ``audio_datas`` produces it, so that the WAV file can be sent while the audio is still being recorded. Since the length of the audio isn't known in advance, the header gives the largest possible sizes, as is usual for streamed WAV files; readers stop at the end of the data instead.
+    """
+    chunks = iter(audio_datas)
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
+        return
+    assert isinstance(first_chunk, AudioData), "Chunks must be audio data"
+    yield _streamed_wav_header(
+        first_chunk.sample_rate if convert_rate is None else convert_rate,
+        first_chunk.sample_width if convert_width is None else convert_width,
+    )
+    yield from stream_raw_data(itertools.chain([first_chunk], chunks), convert_rate, convert_width)
+
+
+def _streamed_wav_header(sample_rate, sample_width):
+    unknown_size = 0xFFFFFFFF
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", unknown_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * sample_width, sample_width, 8 * sample_width,  # mono PCM
+        b"data", unknown_size,
+    )
+
+
+def _convert_chunk(resampler, frame_data, convert_width, final=False):
+    """Converts ``frame_data`` like ``AudioData.get_raw_data`` does, except that the resampling state is kept in ``resampler`` between chunks."""
+    raw_data = frame_data
+    if resampler.sample_width == 1:
+        raw_data = audioop.bias(raw_data, 1, -128)  # ``resampler`` takes signed samples
+    raw_data = resampler.process(raw_data, final)
+    if resampler.sample_width == 1:
+        raw_data = audioop.bias(raw_data, 1, 128)
+    return AudioData(raw_data, resampler.to_rate, resampler.sample_width).get_raw_data(convert_width=convert_width)
+
+
+@functools.lru_cache(maxsize=None)
 def get_flac_converter():
-    """Returns the absolute path of a FLAC converter executable, or raises an OSError if none can be found."""
+    """
+    Returns the absolute path of a FLAC converter executable, or raises an OSError if none can be found.
+
+    The path is looked up once, and then reused for the rest of the process.
+    """
     flac_converter = shutil_which("flac")  # check for installed version first
     if flac_converter is None:  # flac utility is not installed
         base_path = os.path.dirname(
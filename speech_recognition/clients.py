@@ -0,0 +1,97 @@
+"""
+Long-lived clients of the vendor SDKs that some recognizers call: OpenAI, Groq, Cohere, Google Cloud Speech and Amazon Web Services.
+
+Creating an SDK client sets up a connection pool, and often resolves credentials from the environment or from files, so the recognizers get their clients from a ``ClientRegistry`` rather than creating one per request: a client is created the first time it's needed, and reused by later requests with the same credentials, base URL and region, which then skip the TCP and TLS handshakes too.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Callable, Hashable
+
+
+class ClientRegistry(object):
+    """
+    Hands out SDK clients, creating one for each combination of provider, credentials, base URL and region the first time it's requested, and returning the same one afterwards. Instances can be shared between threads.
+
+    ``max_connections`` limits the number of connections that each client keeps open (or ``None``, the default, to keep each SDK's own limit). It applies to clients created after it's set.
+
+    Clients of asynchronous SDKs are kept separately for each event loop, since their connections can only be used in the event loop they were opened in.
+    """
+
+    def __init__(self, max_connections: int | None = None) -> None:
+        assert max_connections is None or (isinstance(max_connections, int) and max_connections > 0), "``max_connections`` must be ``None`` or a positive integer"
+        self.max_connections = max_connections
+        self._clients: dict[Hashable, Any] = {}  # ``(provider, credentials, base_url, region)`` -> client
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[Hashable, Any]] = weakref.WeakKeyDictionary()  # event loop -> ``(provider, credentials, base_url, region)`` -> client
+        self._create_locks: dict[tuple[asyncio.AbstractEventLoop | None, Hashable], threading.Lock] = {}  # ``(event loop or None, key)`` -> lock held while creating that client
+        self._lock = threading.Lock()  # guards the dictionaries above, and isn't held while creating clients
+
+    def get(self, provider: str, create: Callable[[], Any], credentials: Hashable = None, base_url: str | None = None, region: str | None = None, asynchronous: bool = False) -> Any:
+        """
+        Returns the client for ``provider`` with ``credentials``, ``base_url`` and ``region``, calling ``create()`` to create it if there isn't one yet. ``credentials`` is anything hashable that tells apart the credentials the client was created with, such as an API key, or ``None`` if the SDK finds them itself.
+
+        Each client is created while holding a lock of its own, so concurrent requests for the same client wait for one to be created, rather than each creating their own, while requests for clients that already exist, or for other clients, go ahead.
+
+        If ``asynchronous`` is true, the client is kept for the running event loop only, so this must be called from a coroutine.
+        """
+        key = (provider, credentials, base_url, region)
+        with self._lock:
+            if asynchronous:
+                loop = asyncio.get_running_loop()
+                clients = self._async_clients.setdefault(loop, {})
+            else:
+                loop, clients = None, self._clients
+            if key in clients:
+                return clients[key]
+            create_lock = self._create_locks.setdefault((loop, key), threading.Lock())
+        with create_lock:
+            with self._lock:
+                if key in clients:  # it was created while this thread waited for the lock
+                    return clients[key]
+            try:
+                client = create()
+            except BaseException:
+                with self._lock:
+                    self._create_locks.pop((loop, key), None)
+                raise
+            with self._lock:  # store the client before dropping the lock, so that nobody creates another one in between
+                clients[key] = client
+                self._create_locks.pop((loop, key), None)
+            return client
+
+    def httpx_client(self, asynchronous: bool = False):
+        """Returns a new ``httpx.Client`` (or ``httpx.AsyncClient`` if ``asynchronous`` is true) limited to ``max_connections`` connections, for SDKs built on ``httpx`` to send their requests through, or ``None`` if ``max_connections`` is ``None``, for them to use their own."""
+        if self.max_connections is None:
+            return None
+        import httpx
+
+        limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+        return (httpx.AsyncClient if asynchronous else httpx.Client)(limits=limits, follow_redirects=True)
+
+    def close(self) -> None:
+        """
+        Closes the clients, and forgets them, so that later requests create new ones. Call it after changing credentials in the environment, or before exiting, to close the connections the clients keep open.
+
+        Clients of asynchronous SDKs are only forgotten, since they can only be closed in their own event loop.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._async_clients.clear()
+        for client in clients:
+            if hasattr(client, "close"):
+                client.close()
+            elif hasattr(client, "__exit__"):  # such as ``google.cloud.speech.SpeechClient``, which closes its channel on exit
+                client.__exit__(None, None, None)
+
+
+shared_registry = ClientRegistry()
+
+
+def get_registry(recognizer) -> ClientRegistry:
+    """Returns the ``ClientRegistry`` that ``recognizer`` gets its SDK clients from: ``recognizer.client_registry`` if it is set, otherwise ``shared_registry``, which is shared by all recognizers."""
+    registry = getattr(recognizer, "client_registry", None)
+    return shared_registry if registry is None else registry
@@ -0,0 +1,196 @@
+"""
+FLAC encoders used by ``AudioData.get_flac_data``, and the in-process FLAC decoder used by ``AudioFile``.
+
+An encoder is a callable ``encoder(raw_data, sample_rate, sample_width, compression_level) -> bytes``, taking mono PCM samples in the same form as the frame data of a WAV file (little-endian, with unsigned 8-bit samples) and returning the contents of a FLAC file. ``compression_level`` is between 0 (fastest) and 8 (smallest), as with the ``flac`` command line tool.
+
+``encode_with_soundfile`` encodes in-process with libFLAC, through the ``soundfile`` package. ``encode_with_subprocess`` runs the ``flac`` command line tool, which is slower because it starts a new process every time, but doesn't need any extra packages. ``get_default_encoder`` picks the former if it's available.
+"""
+
+from __future__ import annotations
+
+import functools
+import io
+import os
+import subprocess
+import wave
+
+# ``flac --best``, which ``AudioData.get_flac_data`` has always used
+DEFAULT_COMPRESSION_LEVEL = 8
+
+_SOUNDFILE_SUBTYPES = {1: "PCM_S8", 2: "PCM_16", 3: "PCM_24"}
+
+
+def _check_arguments(sample_width, compression_level):
+    assert 1 <= sample_width <= 3, "FLAC sample width must be between 1 and 3 inclusive"
+    assert 0 <= compression_level <= 8, "FLAC compression level must be between 0 and 8 inclusive"
+
+
+def startup_info():
+    """Returns the ``startupinfo`` to start a subprocess with; on Windows, this makes sure that no console window is shown."""
+    if os.name != "nt":
+        return None  # default startupinfo
+    info = subprocess.STARTUPINFO()
+    info.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # specify that the wShowWindow field of `info` contains a value
+    info.wShowWindow = subprocess.SW_HIDE  # specify that the console window should be hidden
+    return info
+
+
+def encode_with_subprocess(raw_data, sample_rate, sample_width, compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """Encodes FLAC by running the FLAC command line tool found by ``speech_recognition.audio.get_flac_converter``."""
+    from speech_recognition.audio import get_flac_converter
+
+    _check_arguments(sample_width, compression_level)
+    with io.BytesIO() as wav_file:
+        wav_writer = wave.open(wav_file, "wb")
+        try:
+            wav_writer.setframerate(sample_rate)
+            wav_writer.setsampwidth(sample_width)
+            wav_writer.setnchannels(1)
+            wav_writer.writeframes(raw_data)
+        finally:
+            wav_writer.close()
+        wav_data = wav_file.getvalue()
+
+    process = subprocess.Popen(
+        [
+            get_flac_converter(),
+            "--stdout",
+            "--totally-silent",  # put the resulting FLAC file in stdout, and make sure it's not mixed with any program output
+            f"-{compression_level}",
+            "-",  # the input WAV file contents will be given in stdin
+        ],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        startupinfo=startup_info(),
+    )
+    flac_data, _ = process.communicate(wav_data)
+    return flac_data
+
+
+def encode_with_soundfile(raw_data, sample_rate, sample_width, compression_level=DEFAULT_COMPRESSION_LEVEL):
+    """Encodes FLAC in-process with libFLAC, through ``soundfile`` (version 0.12 or later). Requires ``numpy`` and ``soundfile``."""
+    import numpy as np
+    import soundfile
+
+    _check_arguments(sample_width, compression_level)
+    if sample_width == 2:
+        samples, dtype = np.frombuffer(raw_data, dtype="<i2"), "int16"
+    else:
+        # libsndfile only accepts 16-bit or 32-bit integer samples, and converts them to the file's sample width by dropping low bits, so put the samples in the high bits of 32-bit ones
+        if sample_width == 1:
+            samples = np.frombuffer(raw_data, dtype=np.uint8).astype("<i4")
+            samples -= 128  # WAV 8-bit samples are unsigned
+            samples <<= 24
+        else:
+            packed = np.frombuffer(raw_data, dtype=np.uint8).reshape(-1, 3)
+            samples = np.zeros(len(packed), dtype="<i4")
+            samples.view(np.uint8).reshape(-1, 4)[:, 1:] = packed
+        dtype = "int32"
+
+    with io.BytesIO() as flac_file:
+        with soundfile.SoundFile(
+            flac_file,
+            "w",
+            samplerate=sample_rate,
+            channels=1,
+            subtype=_SOUNDFILE_SUBTYPES[sample_width],
+            format="FLAC",
+            compression_level=compression_level / 8,
+        ) as writer:
+            writer.buffer_write(samples, dtype)
+        return flac_file.getvalue()
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_encoder():
+    """Returns ``encode_with_soundfile`` if ``soundfile`` is installed and can write FLAC files, or ``encode_with_subprocess`` otherwise."""
+    try:
+        encode_with_soundfile(b"\x00\x00", 16000, 2, 0)
+    except Exception:  # not installed, too old, or libsndfile was built without FLAC support
+        return encode_with_subprocess
+    return encode_with_soundfile
+
+
+_SAMPLE_WIDTHS = {"PCM_S8": 1, "PCM_16": 2, "PCM_24": 3}
+
+
+class FlacReader(object):
+    """
+    Decodes a FLAC file incrementally with libFLAC, through ``soundfile``, as frames are read.
+
+    This has the same interface as the ``wave.Wave_read`` objects ``AudioFile`` uses to read WAV files, and likewise returns little-endian samples (8-bit samples are unsigned, as in WAV files), so only the frames being read are ever held in memory. Use ``open_reader`` to create one.
+    """
+
+    def __init__(self, sound_file):
+        import numpy as np
+
+        self._np = np
+        self.sound_file = sound_file
+        self._sample_width = _SAMPLE_WIDTHS[sound_file.subtype]
+
+    def getnchannels(self):
+        return self.sound_file.channels
+
+    def getsampwidth(self):
+        return self._sample_width
+
+    def getframerate(self):
+        return self.sound_file.samplerate
+
+    def getnframes(self):
+        return self.sound_file.frames
+
+    def tell(self):
+        return self.sound_file.tell()
+
+    def setpos(self, pos):
+        self.sound_file.seek(pos)
+
+    def readframes(self, n):
+        np = self._np
+        if self._sample_width == 2:
+            samples = np.frombuffer(self.sound_file.buffer_read(n, dtype="int16"), dtype=np.int16)
+            return samples.astype("<i2", copy=False).tobytes()
+
+        # libsndfile returns 8-bit and 24-bit samples in the high bits of 32-bit ones
+        samples = np.frombuffer(self.sound_file.buffer_read(n, dtype="int32"), dtype=np.int32).astype("<i4", copy=False)
+        if self._sample_width == 1:
+            return ((samples >> 24) + 128).astype(np.uint8).tobytes()
+        return samples.view(np.uint8).reshape(-1, 4)[:, 1:].tobytes()
+
+    def close(self):
+        self.sound_file.close()
+
+
+def tell(fileobject):
+    """Returns the current position of ``fileobject``, or ``None`` if it isn't seekable."""
+    try:
+        return fileobject.tell()
+    except (AttributeError, OSError):
+        return None
+
+
+def open_reader(filename_or_fileobject):
+    """
+    Returns a ``FlacReader`` for the FLAC file ``filename_or_fileobject`` (a path or a seekable file-like object), or ``None`` if it can't be decoded in-process.
+
+    This is the case when ``numpy`` or ``soundfile`` isn't installed, libsndfile can't decode FLAC, or the file isn't a FLAC file with 8-bit, 16-bit, or 24-bit samples. File-like objects are left at their original position in that case.
+    """
+    try:
+        import numpy  # noqa: F401
+        import soundfile
+    except ImportError:
+        return None
+
+    position = None if isinstance(filename_or_fileobject, str) else tell(filename_or_fileobject)
+    try:
+        sound_file = soundfile.SoundFile(filename_or_fileobject)
+    except Exception:  # not a file libsndfile can read
+        sound_file = None
+    if sound_file is not None:
+        if sound_file.format == "FLAC" and sound_file.subtype in _SAMPLE_WIDTHS:
+            return FlacReader(sound_file)
+        sound_file.close()
+    if position is not None:
+        filename_or_fileobject.seek(position)
+    return None
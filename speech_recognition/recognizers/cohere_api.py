@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 from io import BytesIO
 
+from speech_recognition import clients
 from speech_recognition.audio import AudioData
 from speech_recognition.exceptions import SetupError
 
@@ -19,35 +22,83 @@ def recognize(
     """Performs speech recognition on ``audio_data`` (an ``AudioData`` instance), using the `Cohere Transcribe <https://docs.cohere.com/docs/transcribe>`__ API via the official Python SDK.
 
     Requires the ``cohere`` package (install with ``pip install SpeechRecognition[cohere-api]``).
-    Set environment variable ``CO_API_KEY`` as documented by Cohere; this library does not read or override it in code.
+    Set environment variable ``CO_API_KEY`` as documented by Cohere. The client is reused by later requests with the same ``CO_API_KEY`` and ``CO_API_URL``; see ``recognizer_instance.client_registry``.
 
     ``language`` is required by the Cohere transcription API (e.g. ``\"en\"``, ``\"ja\"``).
 
     Detail: https://docs.cohere.com/reference/create-audio-transcription
     """
-    try:
-        import cohere
-    except ImportError:
-        raise SetupError(
-            "missing cohere module: ensure that cohere is set up correctly "
-            "(e.g. pip install SpeechRecognition[cohere-api])."
-        )
+    cohere = _import_cohere()
+    wav_data = _to_wav_file(audio_data)
 
-    if not isinstance(audio_data, AudioData):
-        raise ValueError("``audio_data`` must be an ``AudioData`` instance")
+    client = _get_client(recognizer, cohere)
+    logger.debug(
+        "cohere audio.transcriptions.create: model=%r language=%r",
+        model,
+        language,
+    )
+    response = client.audio.transcriptions.create(
+        model=model,
+        file=wav_data,
+        language=language,
+    )
+    return response.text
 
-    wav_data = BytesIO(audio_data.get_wav_data())
-    wav_data.name = "SpeechRecognition_audio.wav"
 
-    client = cohere.ClientV2()
+async def recognize_async(
+    recognizer,
+    audio_data: AudioData,
+    *,
+    language: str,
+    model: str = "cohere-transcribe-03-2026",
+) -> str:
+    """Coroutine version of ``recognize``, which takes the same parameters and returns the same results, using the asynchronous Cohere client so that the request doesn't block the event loop. The audio is converted in the event loop's default executor."""
+    cohere = _import_cohere()
+    wav_data = await asyncio.get_running_loop().run_in_executor(
+        None, _to_wav_file, audio_data
+    )
+
+    client = _get_client(recognizer, cohere, asynchronous=True)
     logger.debug(
         "cohere audio.transcriptions.create: model=%r language=%r",
         model,
         language,
     )
-    response = client.audio.transcriptions.create(
+    response = await client.audio.transcriptions.create(
         model=model,
         file=wav_data,
         language=language,
     )
     return response.text
+
+
+def _import_cohere():
+    try:
+        import cohere
+    except ImportError:
+        raise SetupError(
+            "missing cohere module: ensure that cohere is set up correctly "
+            "(e.g. pip install SpeechRecognition[cohere-api])."
+        )
+    return cohere
+
+
+def _get_client(recognizer, cohere, asynchronous=False):
+    registry = clients.get_registry(recognizer)
+    client_class = cohere.AsyncClientV2 if asynchronous else cohere.ClientV2
+    return registry.get(
+        "cohere",
+        lambda: client_class(httpx_client=registry.httpx_client(asynchronous)),
+        credentials=os.environ.get("CO_API_KEY"),
+        base_url=os.environ.get("CO_API_URL"),
+        asynchronous=asynchronous,
+    )
+
+
+def _to_wav_file(audio_data: AudioData) -> BytesIO:
+    if not isinstance(audio_data, AudioData):
+        raise ValueError("``audio_data`` must be an ``AudioData`` instance")
+
+    wav_data = BytesIO(audio_data.get_wav_data())
+    wav_data.name = "SpeechRecognition_audio.wav"
+    return wav_data
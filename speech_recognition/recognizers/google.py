@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Dict, Literal, Optional, TypedDict
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
+from urllib.request import Request
 
 from typing_extensions import NotRequired
 
+from speech_recognition import transport
 from speech_recognition.audio import AudioData
 from speech_recognition.exceptions import RequestError, UnknownValueError
 
@@ -211,16 +213,22 @@ class OutputParser:
         return best_hypothesis
 
 
-def obtain_transcription(request: Request, timeout: int) -> str:
+def obtain_transcription(
+    request: Request,
+    timeout: int,
+    http_transport: transport.HTTPTransport | transport.UrllibTransport | None = None,
+) -> str:
+    if http_transport is None:
+        http_transport = transport.UrllibTransport()
     try:
-        response = urlopen(request, timeout=timeout)
+        response = http_transport.send(request, timeout)
     except HTTPError as e:
         raise RequestError("recognition request failed: {}".format(e.reason))
     except URLError as e:
         raise RequestError(
             "recognition connection failed: {}".format(e.reason)
         )
-    return response.read().decode("utf-8")
+    return response.decode("utf-8")
 
 
 def recognize_legacy(
@@ -254,7 +262,41 @@ def recognize_legacy(
     request = request_builder.build(audio_data)
 
     response_text = obtain_transcription(
-        request, timeout=recognizer.operation_timeout
+        request,
+        timeout=recognizer.operation_timeout,
+        http_transport=transport.get_transport(recognizer),
+    )
+
+    output_parser = OutputParser(
+        show_all=show_all, with_confidence=with_confidence
+    )
+    return output_parser.parse(response_text)
+
+
+async def recognize_legacy_async(
+    recognizer,
+    audio_data: AudioData,
+    key: str | None = None,
+    language: str = "en-US",
+    pfilter: ProfanityFilterLevel = 0,
+    show_all: bool = False,
+    with_confidence: bool = False,
+    *,
+    endpoint: str = ENDPOINT,
+):
+    """Coroutine version of ``recognize_legacy``, which takes the same parameters and returns the same results.
+
+    The request is sent through ``recognizer.async_transport`` (see ``speech_recognition.transport.get_async_transport``), and the audio is converted to FLAC in the event loop's default executor, so that neither blocks the event loop.
+    """
+    request_builder = create_request_builder(
+        endpoint=endpoint, key=key, language=language, filter_level=pfilter
+    )
+    request = await asyncio.get_running_loop().run_in_executor(
+        None, request_builder.build, audio_data
+    )
+
+    response_text = await transport.obtain_response_text(
+        recognizer, request, recognizer.operation_timeout
     )
 
     output_parser = OutputParser(
@@ -1,19 +1,47 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, TypedDict, cast
+import itertools
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypedDict, cast
 from urllib.error import URLError
 
-from speech_recognition.audio import AudioData
+from speech_recognition import clients
+from speech_recognition.audio import AudioData, stream_raw_data
 from speech_recognition.exceptions import RequestError, UnknownValueError
 
 if TYPE_CHECKING:
     from google.cloud.speech import (
         RecognitionConfig,
         RecognizeResponse,
+        SpeechClient,
         SpeechContext,
+        StreamingRecognizeResponse,
     )
     from typing_extensions import Required, Unpack
 
+    from speech_recognition import AudioSource
+
+# the API accepts at most this much audio in each request of a stream
+MAX_STREAMING_REQUEST_BYTES = 25600
+
+
+class _ReadableSource(Protocol):
+    """The attributes of an entered ``AudioSource``, such as a ``Microphone`` or an ``AudioFile``, that its audio is read with."""
+    stream: Any
+    CHUNK: int
+    SAMPLE_RATE: int
+    SAMPLE_WIDTH: int
+
+
+class _ResponseStream(Protocol):
+    """The responses of a streaming call, which is a gRPC call that can also be cancelled."""
+    def __iter__(self) -> Iterator[StreamingRecognizeResponse]:
+        pass
+
+    def cancel(self) -> bool:
+        pass
+
 
 class GoogleCloudRecognizerParameters(TypedDict, total=False):
     """Optional parameters.
@@ -58,14 +86,28 @@ class GoogleCloudSpeechV1Parameters(TypedDict, total=False):
     use_enhanced: bool
 
 
+class StreamingResult(NamedTuple):
+    """A transcription of part of the audio, yielded by :py:func:`recognize_streaming`.
+
+    Interim results (``is_final`` is false) are guesses that later results for the same audio replace, with a ``stability`` between 0 and 1 estimating how likely they are to stay the same. Final results (``is_final`` is true) don't change, and have a ``confidence`` between 0 and 1.
+    """
+
+    transcript: str
+    is_final: bool
+    stability: float
+    confidence: float
+
+
 def _build_config(
-    audio_data: AudioData, recognizer_params: GoogleCloudRecognizerParameters
+    sample_rate: int,
+    recognizer_params: GoogleCloudRecognizerParameters,
+    encoding: RecognitionConfig.AudioEncoding | None = None,
 ) -> RecognitionConfig:
     from google.cloud import speech
 
     parameters: GoogleCloudSpeechV1Parameters = {
-        "encoding": cast(speech.RecognitionConfig.AudioEncoding, speech.RecognitionConfig.AudioEncoding.FLAC),
-        "sample_rate_hertz": audio_data.sample_rate,
+        "encoding": encoding if encoding is not None else cast(speech.RecognitionConfig.AudioEncoding, speech.RecognitionConfig.AudioEncoding.FLAC),
+        "sample_rate_hertz": sample_rate,
         "language_code": recognizer_params.pop("language_code", "en-US"),
     }
     if preferred_phrases := recognizer_params.pop("preferred_phrases", None):
@@ -78,6 +120,39 @@ def _build_config(
     return speech.RecognitionConfig(**(parameters | recognizer_params))
 
 
+def _supported_sample_rate(sample_rate: int) -> int | None:
+    """Returns the sample rate to convert audio at ``sample_rate`` to, or ``None`` if it's supported as it is."""
+    # audio sample rate must be between 8 kHz and 48 kHz inclusive - clamp sample rate into this range
+    return (
+        None
+        if 8000 <= sample_rate <= 48000
+        else max(8000, min(sample_rate, 48000))
+    )
+
+
+def get_client(
+    recognizer, credentials_json_path: str | None = None
+) -> SpeechClient:
+    """Returns the ``SpeechClient`` that ``recognizer`` sends requests through: ``recognizer.google_cloud_client`` if it is set, otherwise the one for ``credentials_json_path`` in ``recognizer``'s client registry (see ``speech_recognition.clients.get_registry``).
+
+    Clients keep their gRPC channel open, so reusing one skips connecting and authenticating again for every request.
+    """
+    client = getattr(recognizer, "google_cloud_client", None)
+    if client is not None:
+        return client
+    from google.cloud import speech
+
+    return clients.get_registry(recognizer).get(
+        "google-cloud-speech",
+        lambda: (
+            speech.SpeechClient.from_service_account_json(credentials_json_path)
+            if credentials_json_path
+            else speech.SpeechClient()
+        ),
+        credentials=credentials_json_path,
+    )
+
+
 def recognize(
     recognizer,
     audio_data: AudioData,
@@ -102,24 +177,15 @@ def recognize(
             "missing google-cloud-speech module: ensure that google-cloud-speech is set up correctly."
         )
 
-    client = (
-        speech.SpeechClient.from_service_account_json(credentials_json_path)
-        if credentials_json_path
-        else speech.SpeechClient()
-    )
+    client = get_client(recognizer, credentials_json_path)
 
     flac_data = audio_data.get_flac_data(
-        # audio sample rate must be between 8 kHz and 48 kHz inclusive - clamp sample rate into this range
-        convert_rate=(
-            None
-            if 8000 <= audio_data.sample_rate <= 48000
-            else max(8000, min(audio_data.sample_rate, 48000))
-        ),
+        convert_rate=_supported_sample_rate(audio_data.sample_rate),
         convert_width=2,  # audio samples must be 16-bit
     )
     audio = speech.RecognitionAudio(content=flac_data)
 
-    config = _build_config(audio_data, kwargs.copy())
+    config = _build_config(audio_data.sample_rate, kwargs.copy())
 
     try:
         response = client.recognize(config=config, audio=audio)
@@ -140,3 +206,104 @@ def recognize(
         for result in response.results
     )
     return transcript
+
+
+def recognize_streaming(
+    recognizer,
+    audio: AudioSource | Iterable[AudioData],
+    credentials_json_path: str | None = None,
+    interim_results: bool = True,
+    single_utterance: bool = False,
+    **kwargs: Unpack[GoogleCloudRecognizerParameters],
+) -> Iterator[StreamingResult | StreamingRecognizeResponse]:
+    """Performs streaming speech recognition on ``audio``, using the Google Cloud Speech-to-Text V1 API, and yields the results as they arrive.
+
+    ``audio`` is either an iterable of consecutive ``AudioData`` chunks, such as the generator returned by ``recognizer_instance.listen(source, stream=True)``, or an ``AudioSource`` instance that has been entered, which is read until the end of its stream (for a ``Microphone``, until the iteration stops). Each chunk is sent as soon as it's produced, as 16-bit linear PCM, so no FLAC encoding is needed.
+
+    Yields a :py:class:`StreamingResult` for each transcription that arrives, while the audio is still being sent. If ``interim_results`` is true (the default), these include interim results that are replaced as more of the audio is heard; otherwise, only final results are yielded. If ``single_utterance`` is true, the API stops listening at the end of the first utterance, and the stream ends after its final result. If ``show_all`` is true, the raw ``StreamingRecognizeResponse`` objects are yielded instead.
+
+    The requests are sent through the client that :py:func:`get_client` returns, which is kept for later requests. For credentials and other parameters, see :py:func:`recognize` and :py:class:`GoogleCloudRecognizerParameters`. Stopping the iteration early cancels the request.
+
+    Raises a ``speech_recognition.UnknownValueError`` exception if the stream ends without a final result, such as when the audio has no speech (unless ``show_all`` is true). Raises a ``speech_recognition.RequestError`` exception if the speech recognition operation failed, if the credentials aren't valid, or if there is no Internet connection.
+    """
+    try:
+        from google.api_core.exceptions import GoogleAPICallError
+        from google.cloud import speech
+    except ImportError:
+        raise RequestError(
+            "missing google-cloud-speech module: ensure that google-cloud-speech is set up correctly."
+        )
+    from speech_recognition import AudioSource
+
+    chunks = _read_chunks(cast(_ReadableSource, audio)) if isinstance(audio, AudioSource) else iter(audio)
+    first_chunk = next(chunks, None)  # the sample rate is sent before any audio
+    if first_chunk is None:
+        raise UnknownValueError()
+    assert isinstance(first_chunk, AudioData), "``audio`` must be an audio source, or an iterable of audio data chunks"
+    convert_rate = _supported_sample_rate(first_chunk.sample_rate)
+    show_all = kwargs.get("show_all", False)
+    config = speech.StreamingRecognitionConfig(
+        config=_build_config(
+            convert_rate or first_chunk.sample_rate,
+            kwargs.copy(),
+            cast(speech.RecognitionConfig.AudioEncoding, speech.RecognitionConfig.AudioEncoding.LINEAR16),
+        ),
+        interim_results=interim_results,
+        single_utterance=single_utterance,
+    )
+    stop_sending = threading.Event()
+
+    def requests():  # iterated by gRPC on a thread of its own
+        raw_chunks = stream_raw_data(
+            itertools.chain([first_chunk], chunks),
+            convert_rate,
+            convert_width=2,  # audio samples must be 16-bit
+        )
+        for raw_data in raw_chunks:
+            if stop_sending.is_set():
+                break
+            for start in range(0, len(raw_data), MAX_STREAMING_REQUEST_BYTES):
+                yield speech.StreamingRecognizeRequest(
+                    audio_content=raw_data[start:start + MAX_STREAMING_REQUEST_BYTES]
+                )
+
+    client = get_client(recognizer, credentials_json_path)
+    try:
+        # ``SpeechClient`` overrides the generated ``streaming_recognize`` with a helper that takes the config and the requests separately, and returns the gRPC call
+        responses = cast(_ResponseStream, client.streaming_recognize(config, requests()))  # type: ignore[call-arg]
+    except GoogleAPICallError as e:
+        raise RequestError(e)
+    has_final_result = False
+    try:
+        for response in responses:
+            if response.speech_event_type == speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE:
+                stop_sending.set()  # the API won't listen to any more audio
+            if show_all:
+                yield response
+                continue
+            for result in response.results:
+                if not result.alternatives:
+                    continue
+                has_final_result = has_final_result or result.is_final
+                yield StreamingResult(
+                    transcript=result.alternatives[0].transcript.strip(),
+                    is_final=result.is_final,
+                    stability=result.stability,
+                    confidence=result.alternatives[0].confidence,
+                )
+    except GoogleAPICallError as e:
+        raise RequestError(e)
+    finally:
+        stop_sending.set()
+        responses.cancel()  # does nothing if the stream has ended, and otherwise stops it, such as when the iteration is stopped early
+    if not show_all and not has_final_result:
+        raise UnknownValueError()
+
+
+def _read_chunks(source: _ReadableSource) -> Iterator[AudioData]:
+    assert source.stream is not None, "Audio source must be entered before recognizing, see documentation for ``AudioSource``; are you using ``source`` outside of a ``with`` statement?"
+    while True:
+        buffer = source.stream.read(source.CHUNK)
+        if len(buffer) == 0:
+            break  # reached end of the stream
+        yield AudioData(buffer, source.SAMPLE_RATE, source.SAMPLE_WIDTH)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Sequence
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Sequence
+from contextlib import contextmanager
 
 from speech_recognition import PortableNamedTemporaryFile
 from speech_recognition.audio import AudioData
@@ -17,6 +20,74 @@ Sensitivity = float
 KeywordEntry = tuple[Keyword, Sensitivity]
 
 
+class DecoderPool:
+    """
+    Thread-safe pool of pre-warmed ``pocketsphinx.Decoder`` instances.
+
+    Building a decoder loads the acoustic model, language model and phoneme dictionary from disk, which takes far longer than decoding a short utterance. The pool keeps decoders that are not in use, keyed by everything that was baked into them (model paths, keyword entries and grammar), so that later recognitions with the same configuration can reuse them.
+
+    A decoder is only ever used by one thread at a time: ``checkout`` removes an idle decoder from the pool (or builds a new one with ``factory`` if none is idle), and ``checkin`` puts it back. At most ``max_size`` idle decoders are retained in total; when that is exceeded, the least recently used ones are dropped. Setting ``max_size`` to 0 disables pooling.
+    """
+
+    def __init__(self, max_size: int = 4) -> None:
+        assert max_size >= 0, "``max_size`` must be a non-negative integer"
+        self.max_size = max_size
+        self._idle: OrderedDict[Hashable, list] = OrderedDict()
+        self._idle_count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._idle_count
+
+    def checkout(self, key: Hashable, factory: Callable[[], object]):
+        """Returns an idle decoder for ``key``, or a new one built by calling ``factory`` if there is none."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                decoder = idle.pop()
+                self._idle_count -= 1
+                if not idle:
+                    del self._idle[key]
+                return decoder
+        # build outside of the lock, since loading the models is slow and other keys shouldn't have to wait for it
+        return factory()
+
+    def checkin(self, key: Hashable, decoder) -> None:
+        """Returns ``decoder``, previously checked out for ``key``, to the pool."""
+        with self._lock:
+            self._idle.setdefault(key, []).append(decoder)
+            self._idle.move_to_end(key)
+            self._idle_count += 1
+            while self._idle_count > self.max_size:
+                oldest_key, oldest = next(iter(self._idle.items()))
+                oldest.pop(0)
+                self._idle_count -= 1
+                if not oldest:
+                    del self._idle[oldest_key]
+
+    @contextmanager
+    def decoder(self, key: Hashable, factory: Callable[[], object]) -> Iterator:
+        """
+        Context manager that checks out a decoder for ``key`` and checks it back in afterwards.
+
+        If the body raises an exception, the decoder is discarded instead, since it may have been left in the middle of an utterance.
+        """
+        decoder = self.checkout(key, factory)
+        yield decoder
+        self.checkin(key, decoder)
+
+    def clear(self) -> None:
+        """Drops all idle decoders."""
+        with self._lock:
+            self._idle.clear()
+            self._idle_count = 0
+
+
+# shared by all ``Recognizer`` instances; set ``decoder_pool.max_size = 0`` to build a fresh decoder for every call
+decoder_pool = DecoderPool()
+
+
 def recognize(
     recognizer,
     audio_data: AudioData,
@@ -34,7 +105,9 @@ def recognize(
 
     Sphinx can also handle FSG or JSGF grammars. The parameter ``grammar`` expects a path to the grammar file. Note that if a JSGF grammar is passed, an FSG grammar will be created at the same location to speed up execution in the next run. If ``keyword_entries`` are passed, content of ``grammar`` will be ignored.
 
-    Returns the most likely transcription if ``show_all`` is false (the default). Otherwise, returns the Sphinx ``pocketsphinx.pocketsphinx.Decoder`` object resulting from the recognition.
+    Decoders are expensive to build, so they are kept in ``speech_recognition.recognizers.pocketsphinx.decoder_pool`` (a ``DecoderPool``) and reused by later calls with the same ``language``, ``keyword_entries`` and ``grammar``.
+
+    Returns the most likely transcription if ``show_all`` is false (the default). Otherwise, returns the Sphinx ``pocketsphinx.pocketsphinx.Decoder`` object resulting from the recognition. That decoder is handed over to the caller and is not returned to the pool.
 
     Raises a ``speech_recognition.UnknownValueError`` exception if the speech is unintelligible. Raises a ``speech_recognition.RequestError`` exception if there are any issues with the Sphinx installation.
     """
@@ -62,6 +135,61 @@ def recognize(
     if not os.path.isfile(phoneme_dictionary_file):
         raise RequestError("missing PocketSphinx phoneme dictionary file: \"{}\"".format(phoneme_dictionary_file))
 
+    if grammar is not None and keyword_entries is None:
+        if not os.path.exists(grammar):
+            raise ValueError("Grammar '{0}' does not exist.".format(grammar))
+        grammar = os.path.abspath(grammar)
+
+    # everything that gets baked into the decoder has to be part of the key, including the grammar file's modification time so edits are picked up
+    decoder_key = (
+        acoustic_parameters_directory,
+        language_model_file,
+        phoneme_dictionary_file,
+        None if keyword_entries is None else tuple((keyword, float(sensitivity)) for keyword, sensitivity in keyword_entries),
+        None if grammar is None or keyword_entries is not None else (grammar, os.path.getmtime(grammar)),
+    )
+
+    def build_decoder():
+        return _build_decoder(
+            pocketsphinx, Jsgf, FsgModel,
+            acoustic_parameters_directory, language_model_file, phoneme_dictionary_file,
+            keyword_entries, grammar,
+        )
+
+    # obtain audio data
+    raw_data = audio_data.get_raw_data(convert_rate=16000, convert_width=2)  # the included language models require audio to be 16-bit mono 16 kHz in little-endian format
+
+    # obtain recognition results
+    if show_all:  # the caller gets to keep the decoder, so it can't go back into the pool
+        decoder = decoder_pool.checkout(decoder_key, build_decoder)
+        _decode(decoder, raw_data)
+        return decoder
+
+    with decoder_pool.decoder(decoder_key, build_decoder) as decoder:
+        _decode(decoder, raw_data)
+        hypothesis = decoder.hyp()
+
+    # return results
+    if hypothesis is not None: return hypothesis.hypstr
+    raise UnknownValueError()  # no transcriptions available
+
+
+def _decode(decoder, raw_data: bytes) -> None:
+    decoder.start_utt()  # begin utterance processing
+    decoder.process_raw(raw_data, False, True)  # process audio data with recognition enabled (no_search = False), as a full utterance (full_utt = True)
+    decoder.end_utt()  # stop utterance processing
+
+
+def _build_decoder(
+    pocketsphinx,
+    Jsgf,
+    FsgModel,
+    acoustic_parameters_directory: str,
+    language_model_file: str,
+    phoneme_dictionary_file: str,
+    keyword_entries: Sequence[KeywordEntry] | None,
+    grammar: str | None,
+):
     # create decoder object
     config = pocketsphinx.Config()
     config.set_string("-hmm", acoustic_parameters_directory)  # set the path of the hidden Markov model (HMM) parameter files
@@ -70,23 +198,17 @@ def recognize(
     config.set_string("-logfn", os.devnull)  # disable logging (logging causes unwanted output in terminal)
     decoder = pocketsphinx.Decoder(config)
 
-    # obtain audio data
-    raw_data = audio_data.get_raw_data(convert_rate=16000, convert_width=2)  # the included language models require audio to be 16-bit mono 16 kHz in little-endian format
-
-    # obtain recognition results
     if keyword_entries is not None:  # explicitly specified set of keywords
         with PortableNamedTemporaryFile("w") as f:
             # generate a keywords file - Sphinx documentation recommendeds sensitivities between 1e-50 and 1e-5
             f.writelines("{} /1e{}/\n".format(keyword, 100 * sensitivity - 110) for keyword, sensitivity in keyword_entries)
             f.flush()
 
-            # perform the speech recognition with the keywords file (this is inside the context manager so the file isn;t deleted until we're done)
+            # set up the keyword search (this is inside the context manager so the file isn't deleted until the decoder has read it)
             decoder.add_kws("keywords", f.name)
             decoder.activate_search("keywords")
     elif grammar is not None:  # a path to a FSG or JSGF grammar
-        if not os.path.exists(grammar):
-            raise ValueError("Grammar '{0}' does not exist.".format(grammar))
-        grammar_path = os.path.abspath(os.path.dirname(grammar))
+        grammar_path = os.path.dirname(grammar)
         grammar_name = os.path.splitext(os.path.basename(grammar))[0]
         fsg_path = "{0}/{1}.fsg".format(grammar_path, grammar_name)
         if not os.path.exists(fsg_path):  # create FSG grammar if not available
@@ -98,14 +220,4 @@ def recognize(
             fsg = FsgModel(fsg_path, decoder.get_logmath(), 7.5)
         decoder.set_fsg(grammar_name, fsg)
         decoder.set_search(grammar_name)
-
-    decoder.start_utt()  # begin utterance processing
-    decoder.process_raw(raw_data, False, True)  # process audio data with recognition enabled (no_search = False), as a full utterance (full_utt = True)
-    decoder.end_utt()  # stop utterance processing
-
-    if show_all: return decoder
-
-    # return results
-    hypothesis = decoder.hyp()
-    if hypothesis is not None: return hypothesis.hypstr
-    raise UnknownValueError()  # no transcriptions available
+    return decoder
@@ -1,54 +1,112 @@
 from __future__ import annotations
 
 import json
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, TypedDict, Union, cast, overload
 
 from speech_recognition.exceptions import SetupError
 
 if TYPE_CHECKING:
+    from vosk import Model
+
     from speech_recognition.audio import AudioData
 
+DEFAULT_MODEL_PATH = Path(__file__).parent.parent / "models" / "vosk"
+SAMPLE_RATE = 16_000
+
+# loaded models are shared by all threads; ``KaldiRecognizer`` instances are cheap and created per call
+_models: dict[str, Model] = {}
+_model_locks: dict[str, threading.Lock] = {}
+_models_lock = threading.Lock()
+
 
 class VoskResponse(TypedDict):
     text: str
 
 
+def _model_key(model_path: str | Path | None) -> str:
+    return str(Path(DEFAULT_MODEL_PATH if model_path is None else model_path).resolve())
+
+
+def load_model(model_path: str | Path | None = None) -> Model:
+    """
+    Returns the Vosk model stored in the directory ``model_path``, loading it only if it isn't resident yet.
+
+    If ``model_path`` is not specified, the model downloaded by ``sprc download vosk`` is used. Loaded models stay in memory, shared by all threads, until ``unload_model`` is called, so several models (for example, one per language) can be kept resident at once.
+    """
+    key = _model_key(model_path)
+    with _models_lock:
+        if key in _models:
+            return _models[key]
+        model_lock = _model_locks.setdefault(key, threading.Lock())
+
+    # load outside of the global lock so that loading one model doesn't block using the others
+    with model_lock:
+        with _models_lock:
+            if key in _models:  # another thread finished loading it while we were waiting
+                return _models[key]
+
+        try:
+            if not Path(key).exists():
+                raise SetupError(
+                    f"Vosk model not found at {key}. "
+                    "Please download the model using `sprc download vosk` command."
+                )
+            from vosk import Model
+
+            model = Model(key)
+        except BaseException:
+            with _models_lock:
+                _model_locks.pop(key, None)
+            raise
+        with _models_lock:  # the lock is only dropped once the model is stored, so that nobody starts loading it again in between
+            _models[key] = model
+            _model_locks.pop(key, None)
+        return model
+
+
+def unload_model(model_path: str | Path | None = None) -> None:
+    """Releases the Vosk model loaded from ``model_path`` (by default, the model downloaded by ``sprc download vosk``), if it is loaded."""
+    key = _model_key(model_path)
+    with _models_lock:
+        model_lock = _model_locks.get(key)
+    if model_lock is None:
+        with _models_lock:
+            _models.pop(key, None)
+        return
+    with model_lock:  # wait for a load in progress, so that it can't store the model after it's been released
+        with _models_lock:
+            _models.pop(key, None)
+
+
 @overload
 def recognize(  # noqa: E704
-    _recognizer, audio_data: AudioData, *, verbose: Literal[False]
+    _recognizer, audio_data: AudioData, *, verbose: Literal[False], model_path: str | Path | None = None
 ) -> str: ...
 
 
 @overload
 def recognize(  # noqa: E704
-    _recognizer, audio_data: AudioData, *, verbose: Literal[True]
+    _recognizer, audio_data: AudioData, *, verbose: Literal[True], model_path: str | Path | None = None
 ) -> VoskResponse: ...
 
 
 def recognize(
-    _recognizer, audio_data: AudioData, *, verbose: bool = False
+    _recognizer, audio_data: AudioData, *, verbose: bool = False, model_path: str | Path | None = None
 ) -> Union[str, VoskResponse]:
     """
     Perform speech recognition on ``audio_data`` using Vosk.
 
-    Requires the Vosk model to be downloaded and unpacked in a folder named 'model' (``$PWD/model``).
+    Requires the Vosk model to be downloaded with ``sprc download vosk``, or an unpacked Vosk model directory to be specified by ``model_path``. The model is loaded on first use and kept in memory for later calls (see ``load_model`` and ``unload_model``).
 
     If ``verbose`` is ``False`` (default), only the recognized text is returned.
     If ``verbose`` is ``True``, the parsed result dictionary from Vosk is returned.
     """
 
-    from vosk import KaldiRecognizer, Model
-
-    vosk_model_path = Path(__file__).parent.parent / "models" / "vosk"
-    if not vosk_model_path.exists():
-        raise SetupError(
-            f"Vosk model not found at {vosk_model_path}. "
-            "Please download the model using `sprc download vosk` command."
-        )
+    from vosk import KaldiRecognizer
 
-    SAMPLE_RATE = 16_000
-    rec = KaldiRecognizer(Model(str(vosk_model_path)), SAMPLE_RATE)
+    rec = KaldiRecognizer(load_model(model_path), SAMPLE_RATE)
 
     rec.AcceptWaveform(
         audio_data.get_raw_data(convert_rate=SAMPLE_RATE, convert_width=2)
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from io import BytesIO
 
@@ -11,13 +12,7 @@ class OpenAICompatibleRecognizer:
         self.client = client
 
     def recognize(self, audio_data: "AudioData", model: str, **kwargs) -> str:
-        if not isinstance(audio_data, AudioData):
-            raise ValueError(
-                "``audio_data`` must be an ``AudioData`` instance"
-            )
-
-        wav_data = BytesIO(audio_data.get_wav_data())
-        wav_data.name = "SpeechRecognition_audio.wav"
+        wav_data = self._to_wav_file(audio_data)
 
         parameters = {"model": model, **kwargs}
         logger.debug(parameters)
@@ -26,3 +21,30 @@ class OpenAICompatibleRecognizer:
             file=wav_data, **parameters
         )
         return transcript.text
+
+    async def recognize_async(
+        self, audio_data: "AudioData", model: str, **kwargs
+    ) -> str:
+        """Like ``recognize``, for an asynchronous client (such as ``openai.AsyncOpenAI``). The audio is converted in the event loop's default executor."""
+        wav_data = await asyncio.get_running_loop().run_in_executor(
+            None, self._to_wav_file, audio_data
+        )
+
+        parameters = {"model": model, **kwargs}
+        logger.debug(parameters)
+
+        transcript = await self.client.audio.transcriptions.create(
+            file=wav_data, **parameters
+        )
+        return transcript.text
+
+    @staticmethod
+    def _to_wav_file(audio_data: "AudioData") -> BytesIO:
+        if not isinstance(audio_data, AudioData):
+            raise ValueError(
+                "``audio_data`` must be an ``AudioData`` instance"
+            )
+
+        wav_data = BytesIO(audio_data.get_wav_data())
+        wav_data.name = "SpeechRecognition_audio.wav"
+        return wav_data
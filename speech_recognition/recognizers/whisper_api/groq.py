@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 from typing import Literal, TypedDict
 
 from typing_extensions import Unpack
 
+from speech_recognition import clients
 from speech_recognition.audio import AudioData
 from speech_recognition.exceptions import SetupError
 from speech_recognition.recognizers.whisper_api.base import (
@@ -42,6 +44,8 @@ def recognize(
     Detail: https://console.groq.com/docs/speech-to-text
 
     Set environment variable ``GROQ_API_KEY``; otherwise groq library will raise a ``groq.GroqError``.
+
+    The client is reused by later requests with the same ``GROQ_API_KEY`` and ``GROQ_BASE_URL``; see ``recognizer_instance.client_registry``.
     """
     try:
         import groq
@@ -50,5 +54,38 @@ def recognize(
             "missing groq module: ensure that groq is set up correctly."
         )
 
-    groq_recognizer = OpenAICompatibleRecognizer(groq.Groq())
+    groq_recognizer = OpenAICompatibleRecognizer(_get_client(recognizer, groq))
     return groq_recognizer.recognize(audio_data, model, **kwargs)
+
+
+async def recognize_async(
+    recognizer,
+    audio_data: "AudioData",
+    *,
+    model: GroqModel = "whisper-large-v3-turbo",
+    **kwargs: Unpack[GroqOptionalParameters],
+) -> str:
+    """Coroutine version of ``recognize``, which takes the same parameters and returns the same results, using the asynchronous Groq client so that the request doesn't block the event loop."""
+    try:
+        import groq
+    except ImportError:
+        raise SetupError(
+            "missing groq module: ensure that groq is set up correctly."
+        )
+
+    groq_recognizer = OpenAICompatibleRecognizer(
+        _get_client(recognizer, groq, asynchronous=True)
+    )
+    return await groq_recognizer.recognize_async(audio_data, model, **kwargs)
+
+
+def _get_client(recognizer, groq, asynchronous=False):
+    registry = clients.get_registry(recognizer)
+    client_class = groq.AsyncGroq if asynchronous else groq.Groq
+    return registry.get(
+        "groq",
+        lambda: client_class(http_client=registry.httpx_client(asynchronous)),
+        credentials=os.environ.get("GROQ_API_KEY"),
+        base_url=os.environ.get("GROQ_BASE_URL"),
+        asynchronous=asynchronous,
+    )
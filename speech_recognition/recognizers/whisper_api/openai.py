@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Literal, TypedDict
 
 from typing_extensions import Unpack
 
+from speech_recognition import clients
 from speech_recognition.audio import AudioData
 from speech_recognition.exceptions import SetupError
 from speech_recognition.recognizers.whisper_api.base import (
@@ -49,6 +51,8 @@ def recognize(
     Detail: https://platform.openai.com/docs/guides/speech-to-text
 
     OpenAI-compatible self-hosted endpoints (e.g., vLLM, Ollama): set ``OPENAI_BASE_URL`` to your custom endpoint URL with dummy ``OPENAI_API_KEY``.
+
+    The client is reused by later requests with the same ``OPENAI_API_KEY`` and ``OPENAI_BASE_URL``; see ``recognizer_instance.client_registry``.
     """
     try:
         import openai
@@ -57,10 +61,43 @@ def recognize(
             "missing openai module: ensure that openai is set up correctly."
         )
 
-    openai_recognizer = OpenAICompatibleRecognizer(openai.OpenAI())
+    openai_recognizer = OpenAICompatibleRecognizer(_get_client(recognizer, openai))
     return openai_recognizer.recognize(audio_data, model, **kwargs)
 
 
+async def recognize_async(
+    recognizer,
+    audio_data: "AudioData",
+    *,
+    model: WhisperModel = "whisper-1",
+    **kwargs: Unpack[OpenAIOptionalParameters],
+) -> str:
+    """Coroutine version of ``recognize``, which takes the same parameters and returns the same results, using the asynchronous OpenAI client so that the request doesn't block the event loop."""
+    try:
+        import openai
+    except ImportError:
+        raise SetupError(
+            "missing openai module: ensure that openai is set up correctly."
+        )
+
+    openai_recognizer = OpenAICompatibleRecognizer(
+        _get_client(recognizer, openai, asynchronous=True)
+    )
+    return await openai_recognizer.recognize_async(audio_data, model, **kwargs)
+
+
+def _get_client(recognizer, openai, asynchronous=False):
+    registry = clients.get_registry(recognizer)
+    client_class = openai.AsyncOpenAI if asynchronous else openai.OpenAI
+    return registry.get(
+        "openai",
+        lambda: client_class(http_client=registry.httpx_client(asynchronous)),
+        credentials=os.environ.get("OPENAI_API_KEY"),
+        base_url=os.environ.get("OPENAI_BASE_URL"),
+        asynchronous=asynchronous,
+    )
+
+
 if __name__ == "__main__":
     import argparse
     from typing import get_args
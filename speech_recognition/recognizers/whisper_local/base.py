@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 from typing import TYPE_CHECKING, Generic, Protocol, TypeVar
 
 from speech_recognition.audio import AudioData
@@ -37,14 +36,8 @@ class WhisperCompatibleRecognizer:
                 "``audio_data`` must be an ``AudioData`` instance"
             )
 
-        import numpy as np
-        import soundfile as sf
-
         # 16 kHz https://github.com/openai/whisper/blob/28769fcfe50755a817ab922a7bc83483159600a9/whisper/audio.py#L98-L99
-        wav_bytes = audio_data.get_wav_data(convert_rate=16000)
-        wav_stream = io.BytesIO(wav_bytes)
-        audio_array, sampling_rate = sf.read(wav_stream)
-        audio_array = audio_array.astype(np.float32)
+        audio_array = audio_data.get_float_array(convert_rate=16000)
 
         result: TranscribeOutputBase[SegmentT] = self.model.transcribe(audio_array, **kwargs)
 
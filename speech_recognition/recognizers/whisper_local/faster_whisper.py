@@ -6,6 +6,9 @@ from speech_recognition.audio import AudioData
 from speech_recognition.recognizers.whisper_local.base import (
     TranscribeOutputBase, WhisperCompatibleRecognizer,
 )
+from speech_recognition.recognizers.whisper_local.registry import (
+    ModelKey, estimate_size, model_registry,
+)
 
 if TYPE_CHECKING:
     import numpy as np
@@ -30,6 +33,19 @@ class TranscribableAdapter:
         }
 
 
+# bytes per model parameter for each CTranslate2 compute type (converted models are stored as float16 by default)
+BYTES_PER_PARAMETER = {
+    "float32": 4,
+    "float16": 2,
+    "bfloat16": 2,
+    "int16": 2,
+    "int8": 1,
+    "int8_float32": 1,
+    "int8_float16": 1,
+    "int8_bfloat16": 1,
+}
+
+
 class InitOptionalParameters(TypedDict, total=False):
     # https://github.com/SYSTRAN/faster-whisper/blob/v1.1.0/faster_whisper/transcribe.py#L575
     device: Literal["cpu", "gpu", "auto"]
@@ -71,12 +87,23 @@ def recognize(
             * If you want transcribe + **translate** to english, set ``task="translate"``.
 
     Other values are passed directly to whisper. See https://github.com/SYSTRAN/faster-whisper/blob/master/faster_whisper/transcribe.py for all options.
+
+    Loaded models are kept in ``speech_recognition.recognizers.whisper_local.registry.model_registry`` and reused by later calls with the same ``model`` and ``init_options``, including calls from other threads.
     """
     from faster_whisper import WhisperModel
 
-    model = WhisperModel(model, **init_options or {})
+    init_options = init_options or {}
+    model_size = estimate_size(
+        model,
+        BYTES_PER_PARAMETER.get(init_options.get("compute_type", "default"), 2),
+    )
+    whisper_model = model_registry.get(
+        ModelKey.from_options("faster_whisper", model, init_options),
+        lambda: WhisperModel(model, **init_options),
+        lambda _: model_size,
+    )
     whisper_recognizer = WhisperCompatibleRecognizer(
-        TranscribableAdapter(model)
+        TranscribableAdapter(whisper_model)
     )
     return whisper_recognizer.recognize(
         audio_data, show_dict=show_dict, **transcribe_options
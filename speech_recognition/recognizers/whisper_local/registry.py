@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from typing import Any, NamedTuple, TypeVar
+
+ModelT = TypeVar("ModelT")
+
+# approximate parameter counts, used to estimate memory usage of models that can't be introspected
+# ref: https://github.com/openai/whisper#available-models-and-languages
+PARAMETER_COUNTS = {
+    "tiny": 39_000_000,
+    "base": 74_000_000,
+    "small": 244_000_000,
+    "medium": 769_000_000,
+    "large": 1_550_000_000,
+    "turbo": 809_000_000,
+}
+
+
+class ModelKey(NamedTuple):
+    backend: str
+    model: str
+    device: str | None = None
+    compute_type: str | None = None
+    download_root: str | None = None
+    # any other loading options, as sorted ``(name, value)`` pairs, with list and dictionary values converted to tuples
+    options: tuple = ()
+
+    @classmethod
+    def from_options(cls, backend: str, model: str, options: Mapping[str, Any]) -> ModelKey:
+        """
+        >>> ModelKey.from_options("faster_whisper", "base", {"compute_type": "int8", "cpu_threads": 4})
+        ModelKey(backend='faster_whisper', model='base', device=None, compute_type='int8', download_root=None, options=(('cpu_threads', 4),))
+        >>> ModelKey.from_options("faster_whisper", "base", {"device": "cuda", "device_index": [0, 1]}).options
+        (('device_index', (0, 1)),)
+        """
+        other_options = dict(options)
+        device = other_options.pop("device", None)
+        return cls(
+            backend,
+            model,
+            None if device is None else str(device),
+            other_options.pop("compute_type", None),
+            other_options.pop("download_root", None),
+            _hashable(other_options),
+        )
+
+
+def _hashable(value):
+    """Converts ``value`` to a hashable equivalent, turning dictionaries into sorted tuples of ``(key, value)`` pairs and lists into tuples, recursively."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _hashable(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    return value
+
+
+class ModelRegistry:
+    """
+    Thread-safe registry of loaded local Whisper models.
+
+    Loading a model from disk takes seconds, so models stay resident after their first use and are shared by every thread that asks for the same ``ModelKey``. When the estimated memory used by resident models exceeds ``max_bytes``, the least recently used models are evicted (the most recently used one is always kept, even if it alone exceeds the budget). ``max_bytes=None`` means no limit.
+
+    Evicting a model only drops the registry's reference; recognitions that are still using it are not affected.
+    """
+
+    def __init__(self, max_bytes: int | None = 4 * 1024 ** 3) -> None:
+        self.max_bytes = max_bytes
+        self._models: OrderedDict[ModelKey, tuple[object, int]] = OrderedDict()
+        self._load_locks: dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def __contains__(self, key: ModelKey) -> bool:
+        with self._lock:
+            return key in self._models
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._models)
+
+    @property
+    def total_bytes(self) -> int:
+        """Estimated memory used by the resident models, in bytes."""
+        with self._lock:
+            return sum(size for _, size in self._models.values())
+
+    def get(
+        self,
+        key: ModelKey,
+        loader: Callable[[], ModelT],
+        size_of: Callable[[ModelT], int],
+    ) -> ModelT:
+        """
+        Returns the model registered under ``key``, calling ``loader`` to load it if it isn't resident.
+
+        ``size_of`` is called with a freshly loaded model and should return its approximate memory usage in bytes.
+        """
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key][0]  # type: ignore[return-value]
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # only one thread loads a given model; loading different models can happen concurrently
+        with load_lock:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    return self._models[key][0]  # type: ignore[return-value]
+
+            try:
+                model = loader()
+                size = size_of(model)
+            except BaseException:
+                with self._lock:
+                    self._load_locks.pop(key, None)
+                raise
+            with self._lock:
+                self._models[key] = (model, size)
+                self._evict()
+                self._load_locks.pop(key, None)
+            return model
+
+    def evict(self, key: ModelKey) -> None:
+        """Drops the model registered under ``key``, if any."""
+        with self._lock:
+            self._models.pop(key, None)
+
+    def clear(self) -> None:
+        """Drops all resident models."""
+        with self._lock:
+            self._models.clear()
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+        total = sum(size for _, size in self._models.values())
+        while total > self.max_bytes and len(self._models) > 1:
+            _, (_, size) = self._models.popitem(last=False)
+            total -= size
+
+
+def estimate_size(model: str, bytes_per_parameter: int = 4) -> int:
+    """
+    Estimates the memory used by the Whisper model ``model``, given either as a model name like ``"small.en"`` or ``"large-v3"``, or as a path to a converted model directory.
+
+    >>> estimate_size("base")
+    296000000
+    >>> estimate_size("large-v3", bytes_per_parameter=2)
+    3100000000
+    """
+    if os.path.isdir(model):
+        return sum(
+            entry.stat().st_size for entry in os.scandir(model) if entry.is_file()
+        )
+    name = os.path.basename(model.rstrip("/")).lower()
+    for prefix in ("distil-", "faster-whisper-", "whisper-"):
+        name = name.removeprefix(prefix)
+    family = "turbo" if "turbo" in name else name.split(".")[0].split("-")[0]
+    return PARAMETER_COUNTS.get(family, PARAMETER_COUNTS["large"]) * bytes_per_parameter
+
+
+# shared by ``recognize_whisper`` and ``recognize_faster_whisper``; change ``model_registry.max_bytes`` to adjust the memory budget
+model_registry = ModelRegistry()
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import threading
+import weakref
 from typing import TYPE_CHECKING, Literal, TypedDict
 
 from speech_recognition.audio import AudioData
 from speech_recognition.recognizers.whisper_local.base import (
     TranscribeOutputBase, WhisperCompatibleRecognizer,
 )
+from speech_recognition.recognizers.whisper_local.registry import (
+    ModelKey, model_registry,
+)
 
 if TYPE_CHECKING:
     import numpy as np
@@ -48,6 +53,23 @@ class Segment(TypedDict):
     no_speech_prob: float
 
 
+# Whisper installs key/value cache hooks on the model while decoding, so concurrent transcriptions must not share a model
+_transcribe_locks: weakref.WeakKeyDictionary[Whisper, threading.Lock] = weakref.WeakKeyDictionary()
+_transcribe_locks_lock = threading.Lock()
+
+
+def _transcribe_lock(model: Whisper) -> threading.Lock:
+    with _transcribe_locks_lock:
+        return _transcribe_locks.setdefault(model, threading.Lock())
+
+
+def _model_size(model: Whisper) -> int:
+    return sum(
+        parameter.numel() * parameter.element_size()
+        for parameter in model.parameters()
+    )
+
+
 class TranscribableAdapter:
     def __init__(self, model: Whisper) -> None:
         self.model = model
@@ -60,7 +82,8 @@ class TranscribableAdapter:
 
             kwargs["fp16"] = torch.cuda.is_available()
 
-        return self.model.transcribe(audio_array, **kwargs)
+        with _transcribe_lock(self.model):
+            return self.model.transcribe(audio_array, **kwargs)
 
 
 def recognize(
@@ -89,11 +112,18 @@ def recognize(
             * If you want transcribe + **translate** to english, set ``task="translate"``.
 
     Other values are passed directly to whisper. See https://github.com/openai/whisper/blob/main/whisper/transcribe.py for all options.
+
+    Loaded models are kept in ``speech_recognition.recognizers.whisper_local.registry.model_registry`` and reused by later calls with the same ``model`` and ``load_options``, including calls from other threads.
     """
 
     import whisper
 
-    whisper_model = whisper.load_model(model, **load_options or {})
+    load_options = load_options or {}
+    whisper_model = model_registry.get(
+        ModelKey.from_options("whisper", model, load_options),
+        lambda: whisper.load_model(model, **load_options),
+        _model_size,
+    )
     whisper_recognizer = WhisperCompatibleRecognizer(
         TranscribableAdapter(whisper_model)
     )
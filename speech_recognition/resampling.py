@@ -0,0 +1,242 @@
+"""
+Sample rate conversion for PCM audio.
+
+``PolyphaseResampler`` is a windowed-sinc polyphase resampler built on NumPy. It is used by ``AudioData.get_raw_data`` whenever NumPy is installed, and ``audioop.ratecv`` is used otherwise.
+"""
+
+from __future__ import annotations
+
+import audioop
+import functools
+import math
+import types
+
+# filter half-length, in multiples of the larger of the two conversion factors; more taps make for a sharper cutoff at the cost of speed
+ZERO_CROSSINGS = 10
+
+# Kaiser window shape parameter; larger values suppress aliasing more at the cost of a wider transition band
+KAISER_BETA = 5.0
+
+# rate pairs that reduce to conversion factors above this, such as 44100 Hz to 44101 Hz, would need very large filter banks, so ``RawResampler`` hands them to ``audioop.ratecv`` instead
+MAX_CONVERSION_FACTOR = 4096
+
+# Outputs are computed in time order, a block at a time, so that the input they read stays in the CPU cache. Each block
+# computes this many outputs, or at least ``_MIN_BLOCK_ROWS`` outputs of every phase, in as few matrix products as possible.
+_BLOCK_SIZE = 16384
+_MIN_BLOCK_ROWS = 1024
+
+
+@functools.lru_cache(maxsize=32)
+def _filter_bank(up: int, down: int, dtype: str):
+    """
+    Returns ``(bank, half_length)`` for converting by a factor of ``up / down``, where ``bank[phase]`` holds the time-reversed filter taps applied to the input for outputs of that phase.
+
+    Banks are cached per conversion factor, so they're only designed once for every pair of rates in use.
+    """
+    import numpy as np
+
+    factor = max(up, down)
+    half_length = ZERO_CROSSINGS * factor
+    n = np.arange(-half_length, half_length + 1, dtype=np.float64)
+    taps = np.sinc(n / factor) * np.kaiser(len(n), KAISER_BETA)
+    taps *= up / taps.sum()  # unity gain at DC for every phase
+
+    taps_per_phase = -(-len(taps) // up)  # ceiling division
+    padded = np.zeros(taps_per_phase * up)
+    padded[:len(taps)] = taps
+    bank = padded.reshape(taps_per_phase, up).T[:, ::-1].astype(dtype)
+    bank.flags.writeable = False
+    return bank, half_length
+
+
+class PolyphaseResampler:
+    """
+    Converts mono audio sampled at ``from_rate`` Hz into audio sampled at ``to_rate`` Hz, using a Kaiser-windowed sinc filter evaluated in polyphase form.
+
+    Call ``process`` with consecutive chunks of samples; filter state is kept between calls, so the chunks can be of any length and the output is the same as converting all the audio at once. Pass ``final=True`` with the last chunk (which may be empty) to flush the remaining output. ``resample`` converts a whole signal in one call.
+
+    Samples are given as any array-like of numbers, and returned as a NumPy array of ``dtype`` floating point numbers. ``float32`` is about twice as fast as the default ``float64``, and is precise enough for samples up to 24 bits wide.
+    """
+
+    def __init__(self, from_rate: int, to_rate: int, dtype: str = "float64") -> None:
+        assert from_rate > 0 and to_rate > 0, "Sample rates must be positive integers"
+        import numpy as np
+
+        self._np = np
+        divisor = math.gcd(from_rate, to_rate)
+        self.from_rate, self.to_rate = from_rate, to_rate
+        self.up, self.down = to_rate // divisor, from_rate // divisor
+        self.dtype = np.dtype(dtype)
+        self._bank, self._half_length = _filter_bank(self.up, self.down, self.dtype.str)
+        self._taps_per_phase = self._bank.shape[1]
+
+        if 1 < self.down < self._taps_per_phase:
+            # the input windows of consecutive outputs overlap; see ``_filter_overlapping`` for how these are used
+            frames = -(-self._taps_per_phase // self.down)
+            padded = np.zeros((self.up, frames * self.down), dtype=self.dtype)
+            padded[:, :self._taps_per_phase] = self._bank
+            self._frame_bank = np.ascontiguousarray(
+                padded.reshape(self.up, frames, self.down).transpose(0, 2, 1)
+            )
+        self.reset()
+
+    def reset(self) -> None:
+        """Discards the filter state, so that the next call to ``process`` starts a new signal."""
+        # input samples before the start of the signal are zeros
+        self._history = self._np.zeros(self._taps_per_phase - 1, dtype=self.dtype)
+        self._history_start = -(self._taps_per_phase - 1)  # input index of ``self._history[0]``
+        self._inputs = 0  # number of input samples received so far
+        self._outputs = 0  # number of output samples produced so far
+
+    def resample(self, samples):
+        """Converts the complete signal ``samples`` and returns the result, independently of any streaming state."""
+        return type(self)(self.from_rate, self.to_rate, self.dtype).process(samples, final=True)
+
+    def process(self, samples, final: bool = False):
+        """Consumes the next chunk of input ``samples`` and returns the output samples that can be computed so far."""
+        np = self._np
+        samples = np.asarray(samples)
+        if self.up == self.down:  # same rate, nothing to filter
+            return samples.astype(self.dtype)
+        self._inputs += len(samples)
+
+        if final:
+            # output is produced for the whole duration of the input; the filter reads past the end, where the signal is zero
+            output_end = -(-self._inputs * self.up // self.down)
+            padding = self._taps_per_phase + self.down
+        else:
+            # output ``m`` needs inputs up to index ``(m * down + half_length) // up``, so stop before the first output that needs inputs we don't have yet
+            output_end = max(
+                self._outputs,
+                (self._inputs * self.up - 1 - self._half_length) // self.down + 1,
+            )
+            padding = 0
+        buffer = np.zeros(len(self._history) + len(samples) + padding, dtype=self.dtype)
+        buffer[:len(self._history)] = self._history
+        buffer[len(self._history):len(self._history) + len(samples)] = samples
+
+        output = self._compute(buffer, self._outputs, output_end)
+
+        # keep only the input that outputs from ``output_end`` onwards still need
+        next_first_input = (
+            (output_end * self.down + self._half_length) // self.up
+            - (self._taps_per_phase - 1)
+        )
+        keep_from = max(0, min(next_first_input - self._history_start, len(buffer)))
+        if final:
+            self.reset()
+        else:
+            self._history = buffer[keep_from:].copy()
+            self._history_start += keep_from
+            self._outputs = output_end
+        return output
+
+    def _compute(self, buffer, start: int, end: int):
+        np = self._np
+        output = np.empty(max(0, end - start), dtype=self.dtype)
+        if len(output) == 0:
+            return output
+        windows = np.lib.stride_tricks.sliding_window_view(buffer, self._taps_per_phase)
+        up, down = self.up, self.down
+        rows = max(_MIN_BLOCK_ROWS, _BLOCK_SIZE // up)
+        # outputs ``up`` apart share a filter phase, and their input windows are ``down`` samples apart
+        for block in range(0, len(output), rows * up):
+            for offset in range(block, min(block + up, len(output))):
+                position = (start + offset) * down + self._half_length
+                phase = position % up
+                # index into ``buffer`` of the first input sample used by this output
+                first = position // up - (self._taps_per_phase - 1) - self._history_start
+                count = min(rows, -(-(len(output) - offset) // up))
+                if 1 < down < self._taps_per_phase:
+                    result = self._filter_overlapping(buffer, first, count, phase)
+                else:
+                    # when ``down >= taps_per_phase`` the windows don't overlap, and this strided view of them is passed to BLAS without being copied
+                    result = windows[first:first + (count - 1) * down + 1:down] @ self._bank[phase]
+                output[offset:offset + count * up:up] = result
+        return output
+
+    def _filter_overlapping(self, buffer, first: int, count: int, phase: int):
+        # Gathering overlapping windows would copy every input sample many times. Instead, view the input as
+        # consecutive frames of ``down`` samples (output ``i`` starts at frame ``i``) and multiply each frame by
+        # every ``down``-sample slice of the taps in one matrix product; output ``i`` is then the sum of the
+        # products of frame ``i + j`` with slice ``j``, which lie on a diagonal of the result.
+        np = self._np
+        frame_bank = self._frame_bank[phase]
+        down, frames = frame_bank.shape
+        length = (count + frames - 1) * down
+        segment = buffer[first:first + length]
+        if len(segment) < length:  # the padding taps can reach past the end of the buffer
+            segment = np.concatenate((segment, np.zeros(length - len(segment), dtype=self.dtype)))
+        products = segment.reshape(-1, down) @ frame_bank
+        row_stride, column_stride = products.strides
+        diagonals = np.lib.stride_tricks.as_strided(
+            products, shape=(count, frames), strides=(row_stride, row_stride + column_stride), writeable=False
+        )
+        return diagonals.sum(axis=1)
+
+
+def decode_samples(np, raw_data, sample_width: int):
+    """Returns the signed little-endian PCM samples in ``raw_data`` as an ``int32`` NumPy array (8-bit samples are expected to be signed)."""
+    if sample_width == 3:
+        packed = np.frombuffer(raw_data, dtype=np.uint8).reshape(-1, 3)
+        widened = np.zeros(len(packed), dtype="<i4")
+        widened.view(np.uint8).reshape(-1, 4)[:, 1:] = packed
+        widened >>= 8  # arithmetic shift, so this sign-extends the 24-bit samples
+        return widened
+    dtype = {1: np.int8, 2: "<i2", 4: "<i4"}[sample_width]
+    return np.frombuffer(raw_data, dtype=dtype).astype(np.int32)
+
+
+def encode_samples(np, samples, sample_width: int) -> bytes:
+    """Rounds and clips the floating point ``samples`` to signed little-endian PCM samples ``sample_width`` bytes wide."""
+    limit = 1 << (8 * sample_width - 1)
+    samples = np.clip(np.rint(samples), -limit, limit - 1).astype("<i4")
+    if sample_width == 3:
+        return samples.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    dtype = {1: np.int8, 2: "<i2", 4: "<i4"}[sample_width]
+    return samples.astype(dtype).tobytes()
+
+
+class RawResampler:
+    """
+    Converts consecutive chunks of signed little-endian PCM samples ``sample_width`` bytes wide from ``from_rate`` Hz to ``to_rate`` Hz. Like ``PolyphaseResampler``, the state is kept between calls to ``process``, so the output is the same as converting all the audio at once; pass ``final=True`` with the last chunk.
+
+    Uses ``PolyphaseResampler`` when NumPy is installed and the conversion factors are reasonably small, and falls back to ``audioop.ratecv`` otherwise.
+    """
+
+    def __init__(self, sample_width: int, from_rate: int, to_rate: int) -> None:
+        self.sample_width, self.from_rate, self.to_rate = sample_width, from_rate, to_rate
+        self._np: types.ModuleType | None = None
+        self._resampler: PolyphaseResampler | None = None
+        self._ratecv_state: tuple | None = None  # ``audioop.ratecv`` state, when falling back to it
+        if from_rate == to_rate:
+            return
+        divisor = math.gcd(from_rate, to_rate)
+        try:
+            import numpy as np
+        except ImportError:
+            return  # falls back to ``audioop.ratecv``
+        if max(from_rate, to_rate) // divisor <= MAX_CONVERSION_FACTOR:
+            self._np = np
+            # single precision is enough for up to 24-bit samples
+            self._resampler = PolyphaseResampler(from_rate, to_rate, "float32" if sample_width <= 3 else "float64")
+
+    def process(self, raw_data, final: bool = False) -> bytes:
+        """Consumes the next chunk of samples ``raw_data`` and returns the converted samples that can be computed so far."""
+        if self.from_rate == self.to_rate:
+            return bytes(raw_data)
+        if self._resampler is None:
+            raw_data, self._ratecv_state = audioop.ratecv(raw_data, self.sample_width, 1, self.from_rate, self.to_rate, self._ratecv_state)
+            if final: self._ratecv_state = None
+            return raw_data
+        samples = decode_samples(self._np, raw_data, self.sample_width)
+        return encode_samples(self._np, self._resampler.process(samples, final), self.sample_width)
+
+
+def resample_raw(raw_data, sample_width: int, from_rate: int, to_rate: int) -> bytes:
+    """
+    Converts the signed little-endian PCM samples in ``raw_data`` from ``from_rate`` Hz to ``to_rate`` Hz.
+
+    Uses ``PolyphaseResampler`` when NumPy is installed and the conversion factors are reasonably small, and falls back to ``audioop.ratecv`` otherwise.
+    """
+    return RawResampler(sample_width, from_rate, to_rate).process(raw_data, final=True)
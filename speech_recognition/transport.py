@@ -0,0 +1,393 @@
+"""
+HTTP transports, which send the requests built by the web API recognizers.
+
+The ``recognize_*`` methods of ``Recognizer`` that call web APIs directly send their requests through an ``HTTPTransport``, which keeps connections open between requests, so that short recognitions aren't dominated by TCP and TLS handshakes. The ``recognize_*_async`` methods send theirs through an ``AsyncHTTPTransport``, so that any number of recognitions can run concurrently on one event loop rather than needing a thread each. The transports only use the standard library.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import collections
+import http.client
+import io
+import socket
+import ssl
+import sys
+import threading
+from urllib.error import HTTPError, URLError
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit, urlunsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
+
+from speech_recognition.exceptions import RequestError
+
+# size of the pieces that file-like request bodies are read and sent in, as chunks of a chunked-transfer request
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# the same limit as ``urllib.request.HTTPRedirectHandler``
+MAX_REDIRECTS = 10
+
+# the same ``User-Agent`` as ``urlopen`` sends
+USER_AGENT = "Python-urllib/{}.{}".format(*sys.version_info[:2])
+
+
+class HTTPTransport(object):
+    """
+    Sends ``urllib.request.Request`` instances over pooled HTTP/1.1 keep-alive connections, and returns the body of the response. Instances can be shared between threads.
+
+    After each response, the connection is kept open for later requests to the same host, which skip the TCP and TLS handshakes; up to ``pool_size`` idle connections are kept per host (set it to 0 to close every connection after its response). Requests whose bodies can't be sent again (iterators, and file-like objects that can't seek) are always sent over new connections, since an idle connection may turn out to have been closed by the server after part of the body was used up. When a new HTTPS connection is needed anyway, such as when several requests to the same host are in flight at once, it resumes the TLS session of an earlier connection to that host, skipping most of the TLS handshake.
+
+    Errors are reported in the same way as ``urllib.request.urlopen`` reports them, so that the same error handling works for both: responses with an error status raise ``urllib.error.HTTPError``, and connection failures and timeouts raise ``urllib.error.URLError``. Redirects are followed in the same way, too. Unlike ``urlopen``, proxies aren't supported; see ``UrllibTransport``.
+
+    ``ssl_context`` is the ``ssl.SSLContext`` used for HTTPS requests, defaulting to one with the system's default certificates.
+    """
+
+    def __init__(self, pool_size: int = 4, ssl_context: ssl.SSLContext | None = None) -> None:
+        assert isinstance(pool_size, int) and pool_size >= 0, "``pool_size`` must be a non-negative integer"
+        self.pool_size = pool_size
+        self.ssl_context = ssl_context
+        self._idle_connections: collections.defaultdict[tuple[str, str, int], collections.deque[http.client.HTTPConnection]] = collections.defaultdict(collections.deque)  # ``(scheme, host, port)`` -> idle connections, most recently used last
+        self._tls_sessions: dict[tuple[str, str, int], ssl.SSLSession] = {}  # ``(scheme, host, port)`` -> TLS session of the latest HTTPS connection
+        self._lock = threading.Lock()
+
+    def send(self, request: Request, timeout: float | None = None) -> bytes:
+        """Sends ``request``, and returns the body of the response. ``timeout`` is the number of seconds that connecting, and each wait for data from the server, may take, or ``None`` for no timeout."""
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, headers, body = self._exchange(request, timeout)
+            redirected = _redirected_request(request, status, headers)
+            if redirected is None: break
+            request = redirected
+        else:
+            raise HTTPError(request.full_url, status, "too many redirects, the last one was " + reason, headers, io.BytesIO(body))
+        if status >= 300:
+            raise HTTPError(request.full_url, status, reason, headers, io.BytesIO(body))
+        return body
+
+    def close(self) -> None:
+        """Closes the idle connections."""
+        with self._lock:
+            connections = [connection for idle in self._idle_connections.values() for connection in idle]
+            self._idle_connections.clear()
+        for connection in connections: connection.close()
+
+    def _exchange(self, request, timeout):
+        url = urlsplit(request.full_url)
+        if url.scheme not in ("http", "https"):
+            raise URLError("unknown url type: {}".format(url.scheme))
+        key = (url.scheme, url.hostname, url.port or (443 if url.scheme == "https" else 80))
+        headers = {"User-Agent": USER_AGENT}
+        headers.update(request.header_items())
+        headers = {name.title(): value for name, value in headers.items()}
+        if request.data is not None: headers.setdefault("Content-Type", "application/x-www-form-urlencoded")  # the same default as ``urlopen``
+        body_position = request.data.tell() if hasattr(request.data, "seek") else None
+        replayable = request.data is None or isinstance(request.data, (bytes, bytearray, memoryview)) or body_position is not None
+
+        connection = None
+        if replayable:
+            with self._lock:
+                idle = self._idle_connections[key]
+                connection = idle.pop() if idle else None
+        reused = connection is not None
+        while True:
+            if connection is None:
+                connection = self._connect(key, timeout)
+            elif connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(request.get_method(), request.selector, request.data, headers, encode_chunked="Transfer-Encoding" in headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (OSError, http.client.HTTPException) as e:
+                connection.close()
+                # the server may have closed the connection while it was idle; try again on a new one if the request can be sent again
+                stale = isinstance(e, (http.client.RemoteDisconnected, ConnectionResetError, ConnectionAbortedError, BrokenPipeError))
+                if not (reused and stale):  # only replayable requests are sent over reused connections
+                    raise URLError(e)
+                if body_position is not None: request.data.seek(body_position)
+                connection, reused = None, False
+
+        if isinstance(connection, _HTTPSConnection) and connection.sock is not None and connection.sock.session is not None:
+            with self._lock: self._tls_sessions[key] = connection.sock.session
+        if response.will_close:
+            connection.close()
+        else:
+            with self._lock:
+                idle = self._idle_connections[key]
+                idle.append(connection)
+                excess = [idle.popleft() for _ in range(len(idle) - self.pool_size)]
+            for connection in excess: connection.close()
+        return response.status, response.reason, response.msg, body
+
+    def _connect(self, key, timeout):
+        scheme, host, port = key
+        if scheme == "http":
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+        with self._lock:
+            if self.ssl_context is None: self.ssl_context = ssl.create_default_context()
+            tls_session = self._tls_sessions.get(key)
+        return _HTTPSConnection(host, port, timeout=timeout, context=self.ssl_context, tls_session=tls_session)
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """An ``http.client.HTTPSConnection`` that resumes ``tls_session``, if given."""
+
+    def __init__(self, host, port, *, timeout, context, tls_session=None):
+        super().__init__(host, port, timeout=timeout, context=context)
+        self.ssl_context = context
+        self.tls_session = tls_session
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        self.sock = self.ssl_context.wrap_socket(self.sock, server_hostname=self.host, session=self.tls_session)
+
+
+def _redirected_request(request, status, headers):
+    """Returns the request to send after receiving a response with ``status`` and ``headers`` to ``request``, or ``None`` if it isn't a redirect to follow. Follows the same redirects as ``urllib.request.HTTPRedirectHandler``."""
+    location = headers.get("Location")
+    method = request.get_method()
+    if status not in (301, 302, 303, 307, 308) or location is None:
+        return None
+    if not (method in ("GET", "HEAD") or (status in (301, 302, 303) and method == "POST")):
+        return None
+    new_url = urljoin(request.full_url, location)
+    if urlsplit(new_url).scheme not in ("http", "https"):
+        return None
+    headers = {name: value for name, value in request.header_items() if name.lower() not in ("content-length", "content-type", "transfer-encoding")}
+    return Request(new_url, headers=headers, method="HEAD" if method == "HEAD" else "GET")
+
+
+class UrllibTransport(object):
+    """
+    Sends ``urllib.request.Request`` instances with ``urllib.request.urlopen``, and returns the body of the response.
+
+    Each request opens a new connection, but unlike with ``HTTPTransport``, the proxies configured in the environment (such as in the ``https_proxy`` environment variable) are used.
+    """
+
+    def send(self, request: Request, timeout: float | None = None) -> bytes:
+        """Sends ``request``, and returns the body of the response. ``timeout`` is passed to ``urlopen``."""
+        with urlopen(request, timeout=timeout) as response:
+            return response.read()
+
+
+class AsyncHTTPTransport(object):
+    """
+    Sends ``urllib.request.Request`` instances over asyncio streams, and returns the body of the response.
+
+    Errors are reported in the same way as ``urllib.request.urlopen`` reports them, so that the same error handling works for both: responses with an error status raise ``urllib.error.HTTPError``, and connection failures and timeouts raise ``urllib.error.URLError``. Unlike ``urlopen``, redirects are not followed.
+
+    The proxies configured in the environment (such as in the ``https_proxy`` and ``no_proxy`` environment variables) are used, as by ``urlopen``: HTTPS requests are tunnelled through the proxy with a ``CONNECT`` request, and HTTP requests are sent to the proxy with the full URL. Only ``http://`` proxies are supported; requests that would go through any other kind of proxy raise ``urllib.error.URLError``.
+
+    ``ssl_context`` is the ``ssl.SSLContext`` used for HTTPS requests, defaulting to one with the system's default certificates.
+    """
+
+    def __init__(self, ssl_context: ssl.SSLContext | None = None) -> None:
+        self.ssl_context = ssl_context
+
+    async def send(self, request: Request, timeout: float | None = None) -> bytes:
+        """Sends ``request``, and returns the body of the response. ``timeout`` is the number of seconds that the whole exchange may take, or ``None`` for no timeout."""
+        try:
+            return await asyncio.wait_for(self._send(request), timeout)
+        except HTTPError:
+            raise
+        except asyncio.TimeoutError:
+            raise URLError("timed out")
+        except (OSError, EOFError, ValueError, asyncio.LimitOverrunError, http.client.HTTPException) as e:  # malformed responses; ``asyncio.IncompleteReadError`` is an ``EOFError``
+            raise URLError(e)
+
+    async def _send(self, request):
+        url = urlsplit(request.full_url)
+        if url.scheme not in ("http", "https"):
+            raise URLError("unknown url type: {}".format(url.scheme))
+        ssl_context = None
+        if url.scheme == "https":
+            if self.ssl_context is None: self.ssl_context = ssl.create_default_context()
+            ssl_context = self.ssl_context
+        host, port = url.hostname, url.port or (443 if ssl_context else 80)
+        proxy = _proxy_for(url)
+        proxy_headers = {}
+        if proxy is None:
+            reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        elif ssl_context is None:  # plain HTTP requests are sent to the proxy itself
+            reader, writer = await asyncio.open_connection(proxy.hostname, proxy.port or 80)
+            proxy_headers = _proxy_authorization(proxy)
+        else:
+            sock = await _open_tunnel(proxy, host, port)
+            try:
+                reader, writer = await asyncio.open_connection(sock=sock, ssl=ssl_context, server_hostname=host)
+            except BaseException:
+                sock.close()
+                raise
+        try:
+            await _write_request(writer, request, proxy_headers if proxy is not None and ssl_context is None else None)
+            status, reason, headers = await _read_response_head(reader)
+            body = await _read_response_body(reader, status, headers)
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except (OSError, ssl.SSLError):  # the connection is being discarded anyway
+                pass
+        if status >= 400:
+            raise HTTPError(request.full_url, status, reason, headers, io.BytesIO(body))
+        return body
+
+
+def _proxy_for(url: SplitResult) -> SplitResult | None:
+    """Returns the URL of the proxy that the environment configures for ``url``, or ``None`` to connect to its host directly."""
+    proxy = getproxies().get(url.scheme)
+    if not proxy or proxy_bypass(url.hostname or ""):
+        return None
+    if "://" not in proxy:  # such as ``proxy:3128``, which ``urlopen`` accepts too
+        proxy = "http://" + proxy
+    proxy_url = urlsplit(proxy)
+    if proxy_url.scheme != "http":
+        raise URLError("unsupported proxy type: {}".format(proxy_url.scheme))
+    return proxy_url
+
+
+def _proxy_authorization(proxy: SplitResult) -> dict[str, str]:
+    if proxy.username is None:
+        return {}
+    credentials = "{}:{}".format(unquote(proxy.username), unquote(proxy.password or ""))
+    return {"Proxy-Authorization": "Basic " + base64.b64encode(credentials.encode("utf-8")).decode("ascii")}
+
+
+async def _open_tunnel(proxy: SplitResult, host: str, port: int) -> socket.socket:
+    """Connects to ``proxy``, asks it to tunnel the connection to ``host`` and ``port`` with a ``CONNECT`` request, and returns the socket, for TLS to be started over it."""
+    loop = asyncio.get_running_loop()
+    sock = await loop.run_in_executor(None, socket.create_connection, (proxy.hostname, proxy.port or 80))
+    try:
+        sock.setblocking(False)
+        authority = "{}:{}".format("[{}]".format(host) if ":" in host else host, port)
+        headers = {"Host": authority, **_proxy_authorization(proxy)}
+        head = "CONNECT {} HTTP/1.1\r\n".format(authority) + "".join("{}: {}\r\n".format(name, value) for name, value in headers.items()) + "\r\n"
+        await loop.sock_sendall(sock, head.encode("latin-1"))
+        response = b""
+        while b"\r\n\r\n" not in response:  # the proxy sends nothing after its response until the TLS handshake starts
+            data = await loop.sock_recv(sock, 4096)
+            if not data:
+                raise http.client.RemoteDisconnected("proxy closed the connection without responding")
+            response += data
+        status_line = response.split(b"\r\n", 1)[0].decode("latin-1")
+        if status_line.split(" ")[1:2] != ["200"]:
+            raise OSError("Tunnel connection failed: {}".format(status_line.partition(" ")[2]))  # the same message as ``http.client``'s
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+async def _write_request(writer, request, proxy_headers=None):
+    """Writes ``request`` to ``writer``. If ``proxy_headers`` isn't ``None``, the request is written for an HTTP proxy, with the full URL as its target and ``proxy_headers`` added to its headers."""
+    data = request.data
+    headers = {"Host": request.host, "User-Agent": USER_AGENT, "Connection": "close"}
+    headers.update(request.header_items())
+    headers.update(proxy_headers or {})
+    headers = {name.title(): value for name, value in headers.items()}
+    chunked = data is not None and not isinstance(data, (bytes, bytearray, memoryview))  # file-like and iterable bodies have no known length
+    if chunked:
+        headers.pop("Content-Length", None)
+        headers["Transfer-Encoding"] = "chunked"
+    elif data is not None:
+        headers["Content-Length"] = str(len(data))
+        headers.setdefault("Content-Type", "application/x-www-form-urlencoded")  # the same default as ``urlopen``
+
+    url = urlsplit(request.full_url)
+    if proxy_headers is not None:
+        target = urlunsplit(url._replace(path=url.path or "/", fragment=""))
+    else:
+        target = (url.path or "/") + ("?" + url.query if url.query else "")
+    head = "{} {} HTTP/1.1\r\n".format(request.get_method(), target) + "".join("{}: {}\r\n".format(name, value) for name, value in headers.items()) + "\r\n"
+    writer.write(head.encode("latin-1"))
+    if not chunked:
+        if data is not None: writer.write(data)
+    else:
+        for chunk in _iterate_body(data):
+            if not chunk: continue
+            writer.write(b"%X\r\n" % len(chunk) + bytes(chunk) + b"\r\n")
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+    await writer.drain()
+
+
+def _iterate_body(data):
+    if hasattr(data, "read"):
+        return iter(lambda: data.read(UPLOAD_CHUNK_SIZE), b"")
+    return iter(data)
+
+
+async def _read_response_head(reader):
+    while True:
+        status_line = (await reader.readuntil(b"\r\n")).decode("latin-1")
+        version, _, rest = status_line.rstrip("\r\n").partition(" ")
+        code, _, reason = rest.partition(" ")
+        if not version.startswith("HTTP/") or not code.isdigit():
+            raise http.client.BadStatusLine(status_line)
+        head = b""
+        while True:
+            line = await reader.readuntil(b"\r\n")
+            head += line
+            if line == b"\r\n": break
+        headers = http.client.parse_headers(io.BytesIO(head))
+        if int(code) != 100:  # skip interim responses
+            return int(code), reason, headers
+
+
+async def _read_response_body(reader, status, headers):
+    if status in (204, 304):
+        return b""
+    if headers.get("Transfer-Encoding", "").lower() == "chunked":
+        chunks = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            if size == 0: break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)  # line break after the chunk
+        while await reader.readuntil(b"\r\n") != b"\r\n":  # skip trailers
+            pass
+        return b"".join(chunks)
+    if headers.get("Content-Length") is not None:
+        return await reader.readexactly(int(headers["Content-Length"]))
+    return await reader.read()  # the response ends when the connection is closed
+
+
+_shared_transport = None
+_shared_async_transport = None
+
+
+def get_transport(recognizer) -> HTTPTransport | UrllibTransport:
+    """Returns the transport that ``recognizer`` sends requests through: ``recognizer.http_transport`` if it is set, otherwise one that is shared by all recognizers. The shared transport is an ``HTTPTransport``, or a ``UrllibTransport`` if proxies are configured in the environment."""
+    global _shared_transport
+    transport = getattr(recognizer, "http_transport", None)
+    if transport is not None:
+        return transport
+    if _shared_transport is None:
+        _shared_transport = UrllibTransport() if getproxies() else HTTPTransport()
+    return _shared_transport
+
+
+def get_async_transport(recognizer) -> AsyncHTTPTransport:
+    """Returns the ``AsyncHTTPTransport`` that ``recognizer`` sends requests through: ``recognizer.async_transport`` if it is set, otherwise one that is shared by all recognizers."""
+    global _shared_async_transport
+    transport = getattr(recognizer, "async_transport", None)
+    if transport is not None:
+        return transport
+    if _shared_async_transport is None:
+        _shared_async_transport = AsyncHTTPTransport()
+    return _shared_async_transport
+
+
+async def obtain_response_text(recognizer, request: Request, timeout: float | None, purpose: str = "recognition") -> str:
+    """
+    Sends ``request`` through ``recognizer``'s ``AsyncHTTPTransport`` (see ``get_async_transport``), and returns the body of the response as text.
+
+    Raises a ``speech_recognition.RequestError`` exception, mentioning ``purpose``, if the request failed.
+    """
+    try:
+        response = await get_async_transport(recognizer).send(request, timeout)
+    except HTTPError as e:
+        raise RequestError("{} request failed: {}".format(purpose, e.reason))
+    except URLError as e:
+        raise RequestError("{} connection failed: {}".format(purpose, e.reason))
+    return response.decode("utf-8")
@@ -0,0 +1,163 @@
+"""
+Voice activity detectors, which decide whether frames of audio contain speech.
+
+By default, ``Recognizer`` detects phrases by comparing the energy of the audio against ``recognizer_instance.energy_threshold``. Setting ``recognizer_instance.voice_activity_detector`` to a detector from this module (or any other object implementing ``VoiceActivityDetector``) makes ``listen``, ``segment``, and ``adjust_for_ambient_noise`` use it instead.
+
+Detectors are stateful: they track the background noise level and the previous frame as audio is passed in, so each detector should only be used for one audio stream at a time.
+"""
+
+from __future__ import annotations
+
+import audioop
+from typing import Protocol
+
+from speech_recognition.resampling import decode_samples
+
+
+class VoiceActivityDetector(Protocol):
+    """
+    Decides whether consecutive frames of mono audio contain speech.
+
+    Frames are given as the raw frame data read from an ``AudioSource`` (or the frame data of an ``AudioData`` instance) with their sample width in bytes and sample rate in Hertz.
+    """
+
+    def is_speech(self, frame: bytes, sample_width: int, sample_rate: int, in_phrase: bool) -> bool:
+        """
+        Returns whether ``frame`` contains speech.
+
+        ``in_phrase`` is ``True`` if the previous frames are part of a phrase that hasn't ended yet, so that detectors can use different criteria for starting and for continuing phrases (hysteresis).
+        """
+        ...
+
+    def adjust_for_ambient_noise(self, frame: bytes, sample_width: int, sample_rate: int) -> None:
+        """Calibrates the detector with ``frame``, which is known not to contain speech."""
+        ...
+
+
+def _signed_frame(frame, sample_width):
+    if sample_width == 1:
+        return audioop.bias(frame, 1, -128)  # 8-bit samples are unsigned, but ``audioop`` treats them as signed
+    return frame
+
+
+class EnergyDetector(object):
+    """
+    Detects speech by comparing the RMS energy of each frame against a threshold, like ``Recognizer`` does by default, but with separate thresholds for starting and for continuing a phrase.
+
+    A phrase starts when a frame's energy is above ``start_threshold``, and continues as long as frames are above ``stop_threshold`` (by default, the same as ``start_threshold``). Setting ``stop_threshold`` lower than ``start_threshold`` keeps quieter parts of a phrase from ending it early, without letting quiet noise start one.
+
+    If ``dynamic`` is true, both thresholds follow the energy of the audio outside of phrases, keeping the thresholds ``ratio`` times above it, in the same way as ``recognizer_instance.dynamic_energy_threshold``. ``damping`` is the fraction of the old threshold that remains after one second.
+    """
+
+    def __init__(self, start_threshold: float = 300, stop_threshold: float | None = None, dynamic: bool = True, damping: float = 0.15, ratio: float = 1.5) -> None:
+        assert start_threshold >= 0 and (stop_threshold is None or stop_threshold >= 0), "Thresholds must be non-negative"
+        self.start_threshold = start_threshold
+        self.stop_threshold = start_threshold if stop_threshold is None else stop_threshold
+        self.dynamic = dynamic
+        self.damping = damping
+        self.ratio = ratio
+
+    def is_speech(self, frame: bytes, sample_width: int, sample_rate: int, in_phrase: bool) -> bool:
+        energy = audioop.rms(_signed_frame(frame, sample_width), sample_width)
+        if in_phrase:
+            return energy > self.stop_threshold
+        if energy > self.start_threshold:
+            return True
+        if self.dynamic:
+            self._adapt(energy, len(frame) / sample_width / sample_rate)
+        return False
+
+    def adjust_for_ambient_noise(self, frame: bytes, sample_width: int, sample_rate: int) -> None:
+        self._adapt(audioop.rms(_signed_frame(frame, sample_width), sample_width), len(frame) / sample_width / sample_rate)
+
+    def _adapt(self, energy, seconds):
+        # asymmetric weighted average, accounting for different frame lengths
+        damping = self.damping ** seconds
+        start_threshold = self.start_threshold * damping + energy * self.ratio * (1 - damping)
+        if self.start_threshold > 0:
+            self.stop_threshold *= start_threshold / self.start_threshold  # keep the ratio between the thresholds
+        else:
+            self.stop_threshold = start_threshold
+        self.start_threshold = start_threshold
+
+
+class SpectralDetector(object):
+    """
+    Detects speech using the energy, spectral flux, and zero-crossing rate of each frame, which rejects much of the noise that the energy alone would mistake for speech. Requires NumPy.
+
+    The energy of the background noise is tracked over frames that aren't speech (and calibrated by ``adjust_for_ambient_noise``). A frame starts a phrase when:
+
+    * its energy is more than ``start_threshold`` times that of the background noise,
+    * its spectral flux (how much its spectrum changed from the previous frame, between 0 and 1) is at least ``min_flux``, which rules out steady sounds such as hum and tones, and
+    * at most ``max_zero_crossing_rate`` of its consecutive samples change sign, which rules out hiss and other broadband noise.
+
+    Within a phrase, frames continue it if their energy is more than ``stop_threshold`` times that of the background noise and their spectral flux is at least ``min_flux``; the zero-crossing rate isn't checked, since some speech sounds (such as "s") are noisy too.
+
+    ``noise_adaptation`` is the fraction of the noise estimate that is replaced per second by the energy of non-speech frames when it is rising. The estimate falls ten times as fast, so that it recovers quickly from loud noise.
+    """
+
+    # frequency bands that spectra are summarized into, so that frames of different lengths and sample rates can be compared
+    BAND_COUNT = 32
+    MAX_FREQUENCY = 4000
+
+    def __init__(self, start_threshold: float = 4.0, stop_threshold: float = 2.0, min_flux: float = 0.1, max_zero_crossing_rate: float = 0.3, noise_adaptation: float = 0.5) -> None:
+        assert start_threshold >= stop_threshold > 0, "``start_threshold`` must be at least ``stop_threshold``, which must be positive"
+        try:
+            import numpy
+        except ImportError:
+            from speech_recognition.exceptions import SetupError
+
+            raise SetupError("missing numpy module: ensure that numpy is set up correctly.")
+        self._np = numpy
+        self.start_threshold = start_threshold
+        self.stop_threshold = stop_threshold
+        self.min_flux = min_flux
+        self.max_zero_crossing_rate = max_zero_crossing_rate
+        self.noise_adaptation = noise_adaptation
+        self.noise_energy: float | None = None  # mean square of the background noise samples, estimated from the first frame if not calibrated
+        self._previous_bands = None
+
+    def _features(self, frame, sample_width, sample_rate):
+        """Returns the mean square, spectral flux, and zero-crossing rate of ``frame``."""
+        np = self._np
+        samples = decode_samples(np, _signed_frame(frame, sample_width), sample_width).astype(np.float64)
+        samples /= 1 << (8 * sample_width - 1)
+        if len(samples) < 2:
+            return 0.0, 0.0, 0.0
+        energy = float(np.dot(samples, samples)) / len(samples)
+        zero_crossing_rate = np.count_nonzero(np.signbit(samples[1:]) != np.signbit(samples[:-1])) / (len(samples) - 1)
+
+        magnitudes = np.abs(np.fft.rfft(samples * np.hanning(len(samples))))
+        frequencies = np.fft.rfftfreq(len(samples), 1 / sample_rate)
+        edges = np.linspace(0, min(self.MAX_FREQUENCY, sample_rate / 2), self.BAND_COUNT + 1)
+        bands = np.bincount(np.clip(np.searchsorted(edges, frequencies, side="right") - 1, 0, self.BAND_COUNT), weights=magnitudes, minlength=self.BAND_COUNT + 1)[:self.BAND_COUNT]
+        total = bands.sum()
+        bands = bands / total if total > 0 else bands
+        # spectral flux: how much energy moved into bands that had less of it in the previous frame
+        flux = 0.0 if self._previous_bands is None else float(np.maximum(bands - self._previous_bands, 0).sum())
+        self._previous_bands = bands
+        return energy, flux, zero_crossing_rate
+
+    def is_speech(self, frame: bytes, sample_width: int, sample_rate: int, in_phrase: bool) -> bool:
+        energy, flux, zero_crossing_rate = self._features(frame, sample_width, sample_rate)
+        if self.noise_energy is None:
+            self.noise_energy = energy
+        noise_energy = max(self.noise_energy, 1e-10)  # digital silence
+        if in_phrase:
+            return energy > noise_energy * self.stop_threshold and flux >= self.min_flux
+        if energy > noise_energy * self.start_threshold and flux >= self.min_flux and zero_crossing_rate <= self.max_zero_crossing_rate:
+            return True
+        self._adapt(energy, len(frame) / sample_width / sample_rate)
+        return False
+
+    def adjust_for_ambient_noise(self, frame: bytes, sample_width: int, sample_rate: int) -> None:
+        energy, _, _ = self._features(frame, sample_width, sample_rate)
+        if self.noise_energy is None:
+            self.noise_energy = energy
+        else:
+            self._adapt(energy, len(frame) / sample_width / sample_rate)
+
+    def _adapt(self, energy, seconds):
+        if energy < self.noise_energy: seconds *= 10  # fall faster than rise
+        weight = 1 - (1 - self.noise_adaptation) ** seconds
+        self.noise_energy += (energy - self.noise_energy) * weight
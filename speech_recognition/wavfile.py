@@ -0,0 +1,145 @@
+"""
+Memory-mapped reading of PCM WAV files.
+
+``MappedWavReader`` maps a WAV file into memory instead of reading it, so that reading frames returns ``memoryview`` slices of the file without copying them, and any position in the file can be jumped to in constant time. ``AudioFile`` uses it for WAV files given as paths.
+"""
+
+from __future__ import annotations
+
+import audioop
+import mmap
+import struct
+
+from speech_recognition.audio import AudioData
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+class MappedWavReader(object):
+    """
+    Reads the PCM WAV file at ``filename`` through a read-only memory map.
+
+    This has the same interface as ``wave.Wave_read``, except that ``readframes`` returns ``memoryview`` slices of the file rather than ``bytes``. On top of that, ``seek_seconds`` moves to a given time and ``get_segment`` returns any part of the audio as an ``AudioData`` instance, without reading anything before it.
+
+    Raises ``ValueError`` if the file isn't a PCM WAV file (including ``WAVE_FORMAT_EXTENSIBLE`` files with PCM samples).
+    """
+
+    def __init__(self, filename):
+        with open(filename, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # the map stays valid after the file is closed
+        try:
+            self._parse()
+        except Exception:
+            self._map.close()
+            raise
+        self._position = 0
+
+    def _parse(self):
+        data = self._map
+        if len(data) < 12 or data[0:4] != b"RIFF" or data[8:12] != b"WAVE":
+            raise ValueError("file is not a RIFF WAVE file")
+        fmt = None
+        offset = 12
+        while offset + 8 <= len(data):
+            chunk_id = data[offset:offset + 4]
+            (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+            body = offset + 8
+            if chunk_id == b"fmt ":
+                fmt = struct.unpack_from("<HHIIHH", data, body)
+                if fmt[0] == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                    # the actual format is the first two bytes of the subformat GUID
+                    (subformat,) = struct.unpack_from("<H", data, body + 24)
+                    fmt = (subformat,) + fmt[1:]
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError("WAV data chunk comes before the format chunk")
+                # files written by streaming encoders may leave the data size unset, in which case the audio runs to the end of the file
+                self._data_start = body
+                self._data_end = len(data) if chunk_size in (0, 0xFFFFFFFF) else min(body + chunk_size, len(data))
+                break
+            offset = body + chunk_size + (chunk_size & 1)  # chunks are padded to an even length
+        else:
+            raise ValueError("WAV file has no data chunk")
+
+        format_tag, self._channels, self._frame_rate, _, block_align, bits_per_sample = fmt
+        if format_tag != WAVE_FORMAT_PCM:
+            raise ValueError(f"WAV format {format_tag:#x} is not PCM")
+        self._sample_width = (bits_per_sample + 7) // 8
+        if not 1 <= self._sample_width <= 4 or block_align != self._channels * self._sample_width:
+            raise ValueError(f"unsupported WAV sample layout: {bits_per_sample} bits per sample, {self._channels} channels, {block_align} bytes per frame")
+        self._frame_size = block_align
+        self._frame_count = (self._data_end - self._data_start) // block_align
+        self._view = memoryview(self._map)[self._data_start:self._data_start + self._frame_count * block_align]
+
+    def getnchannels(self):
+        return self._channels
+
+    def getsampwidth(self):
+        return self._sample_width
+
+    def getframerate(self):
+        return self._frame_rate
+
+    def getnframes(self):
+        return self._frame_count
+
+    def tell(self):
+        """Returns the current position, in frames."""
+        return self._position
+
+    def setpos(self, pos):
+        """Moves to the frame ``pos``."""
+        if not 0 <= pos <= self._frame_count:
+            raise ValueError("position not in range")
+        self._position = pos
+
+    def rewind(self):
+        self._position = 0
+
+    def seek_seconds(self, seconds):
+        """Moves to the frame closest to ``seconds`` seconds in, clamped to the length of the audio. (Use ``setpos`` to move to a frame.)"""
+        self._position = min(max(0, round(seconds * self._frame_rate)), self._frame_count)
+
+    def readframes(self, n):
+        """Returns the next ``n`` frames (or all remaining frames if ``n`` is negative) as a ``memoryview`` of the file, and moves ahead by that many frames."""
+        end = self._frame_count if n < 0 else min(self._position + n, self._frame_count)
+        frames = self._view[self._position * self._frame_size:end * self._frame_size]
+        self._position = end
+        return frames
+
+    def get_segment(self, start_ms=None, end_ms=None):
+        """
+        Returns an ``AudioData`` instance with the audio from ``start_ms`` milliseconds in up to ``end_ms`` milliseconds in (by default, the beginning and the end of the audio), regardless of the current position.
+
+        For mono files, the audio data is a view of the file; stereo audio is downmixed into a new buffer.
+        """
+        start = 0 if start_ms is None else min(max(0, round(start_ms * self._frame_rate / 1000)), self._frame_count)
+        end = self._frame_count if end_ms is None else min(max(start, round(end_ms * self._frame_rate / 1000)), self._frame_count)
+        frames = self._view[start * self._frame_size:end * self._frame_size]
+        if self._channels != 1:
+            frames = audioop.tomono(frames, self._sample_width, 1, 1)
+        return AudioData(frames, self._frame_rate, self._sample_width)
+
+    def close(self):
+        """
+        Releases the memory map.
+
+        Frames returned by ``readframes`` and ``get_segment`` that are still in use keep the map alive; in that case, it is released once they are no longer referenced.
+        """
+        if self._map is None:
+            return
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:  # views of the map are still in use elsewhere; it's unmapped when the last of them is garbage collected
+            pass
+        self._map = None
+
+
+def open_reader(filename):
+    """Returns a ``MappedWavReader`` for the file at ``filename``, or ``None`` if it isn't a PCM WAV file that can be memory-mapped."""
+    try:
+        return MappedWavReader(filename)
+    except (OSError, ValueError, struct.error):
+        return None
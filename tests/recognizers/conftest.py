@@ -0,0 +1,9 @@
+import pytest
+
+from speech_recognition import clients
+
+
+@pytest.fixture(autouse=True)
+def shared_registry(monkeypatch):
+    """Gives each test its own shared SDK clients, so that clients created with the mocks of one test aren't reused by the next."""
+    monkeypatch.setattr(clients, "shared_registry", clients.ClientRegistry())
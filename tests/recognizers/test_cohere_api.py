@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -25,7 +26,7 @@ def test_transcribe_default_model(mock_client_cls):
 
     assert actual == "Transcription by Cohere"
     audio_data.get_wav_data.assert_called_once()
-    mock_client_cls.assert_called_once_with()
+    mock_client_cls.assert_called_once_with(httpx_client=None)
     mock_client.audio.transcriptions.create.assert_called_once()
     call_kw = mock_client.audio.transcriptions.create.call_args.kwargs
     assert call_kw["model"] == "cohere-transcribe-03-2026"
@@ -52,3 +53,30 @@ def test_transcribe_with_language(mock_client_cls):
     call_kw = mock_client.audio.transcriptions.create.call_args.kwargs
     assert call_kw["model"] == "cohere-transcribe-03-2026"
     assert call_kw["language"] == "ja"
+
+
+@patch("cohere.AsyncClientV2")
+def test_transcribe_async(mock_client_cls):
+    mock_response = MagicMock()
+    mock_response.text = "Transcription by Cohere"
+    mock_client = MagicMock()
+    mock_client.audio.transcriptions.create = AsyncMock(
+        return_value=mock_response
+    )
+    mock_client_cls.return_value = mock_client
+
+    audio_data = MagicMock(spec=AudioData)
+    audio_data.get_wav_data.return_value = b"fake_wav"
+
+    actual = asyncio.run(
+        cohere_api.recognize_async(
+            MagicMock(spec=Recognizer), audio_data, language="en"
+        )
+    )
+
+    assert actual == "Transcription by Cohere"
+    audio_data.get_wav_data.assert_called_once()
+    call_kw = mock_client.audio.transcriptions.create.call_args.kwargs
+    assert call_kw["model"] == "cohere-transcribe-03-2026"
+    assert call_kw["language"] == "en"
+    assert call_kw["file"].read() == b"fake_wav"
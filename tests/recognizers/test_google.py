@@ -1,9 +1,12 @@
+import asyncio
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
+from urllib.error import URLError
 from urllib.request import Request
 
-from speech_recognition import Recognizer
+from speech_recognition import Recognizer, transport
 from speech_recognition.audio import AudioData
+from speech_recognition.exceptions import RequestError
 from speech_recognition.recognizers import google
 
 MODULE_UNDER_TEST = "speech_recognition.recognizers.google"
@@ -100,19 +103,38 @@ class OutputParserTestCase(TestCase):
 
 
 class ObtainTranscriptionTestCase(TestCase):
-    @patch(f"{MODULE_UNDER_TEST}.urlopen")
-    def test_obtain(self, urlopen):
+    def test_obtain(self):
         request = MagicMock(spec=Request)
-        response = urlopen.return_value
+        http_transport = MagicMock(spec=transport.HTTPTransport)
+        response = http_transport.send.return_value
+
+        actual = google.obtain_transcription(request, 0, http_transport)
+
+        self.assertEqual(actual, response.decode.return_value)
+        http_transport.send.assert_called_once_with(request, 0)
+        response.decode.assert_called_once_with("utf-8")
+
+    @patch("speech_recognition.transport.urlopen")
+    def test_obtain_without_transport(self, urlopen):
+        request = MagicMock(spec=Request)
+        response = urlopen.return_value.__enter__.return_value
+        response.read.return_value = b"response"
 
         actual = google.obtain_transcription(request, 0)
 
-        self.assertEqual(
-            actual, response.read.return_value.decode.return_value
-        )
+        self.assertEqual(actual, "response")
         urlopen.assert_called_once_with(request, timeout=0)
-        response.read.assert_called_once_with()
-        response.read.return_value.decode.assert_called_once_with("utf-8")
+
+    def test_obtain_error(self):
+        http_transport = MagicMock(spec=transport.HTTPTransport)
+        http_transport.send.side_effect = URLError("refused")
+
+        with self.assertRaisesRegex(
+            RequestError, "recognition connection failed: refused"
+        ):
+            google.obtain_transcription(
+                MagicMock(spec=Request), 0, http_transport
+            )
 
 
 @patch(f"{MODULE_UNDER_TEST}.OutputParser")
@@ -142,7 +164,9 @@ class RecognizeLegacyTestCase(TestCase):
         )
         request_builder.build.assert_called_once_with(audio_data)
         obtain_transcription.assert_called_once_with(
-            request, timeout=recognizer.operation_timeout
+            request,
+            timeout=recognizer.operation_timeout,
+            http_transport=recognizer.http_transport,
         )
         OutputParser.assert_called_once_with(
             show_all=False, with_confidence=False
@@ -179,7 +203,52 @@ class RecognizeLegacyTestCase(TestCase):
         )
         request_builder.build.assert_called_once_with(audio_data)
         obtain_transcription.assert_called_once_with(
-            request, timeout=recognizer.operation_timeout
+            request,
+            timeout=recognizer.operation_timeout,
+            http_transport=recognizer.http_transport,
+        )
+        OutputParser.assert_called_once_with(
+            show_all=True, with_confidence=False
+        )
+        output_parser.parse.assert_called_once_with(response_text)
+
+
+@patch(f"{MODULE_UNDER_TEST}.OutputParser")
+@patch(f"{MODULE_UNDER_TEST}.transport.obtain_response_text")
+@patch(f"{MODULE_UNDER_TEST}.create_request_builder")
+class RecognizeLegacyAsyncTestCase(TestCase):
+    def test_specified_values(
+        self, create_request_builder, obtain_response_text, OutputParser
+    ):
+        request_builder = create_request_builder.return_value
+        request = request_builder.build.return_value
+        response_text = obtain_response_text.return_value
+        output_parser = OutputParser.return_value
+        recognizer = MagicMock(spec=Recognizer())
+        audio_data = MagicMock(spec=AudioData)
+
+        actual = asyncio.run(
+            google.recognize_legacy_async(
+                recognizer,
+                audio_data,
+                key="awesome-key",
+                language="zh-CN",
+                pfilter=1,
+                show_all=True,
+                with_confidence=False,
+            )
+        )
+
+        self.assertEqual(actual, output_parser.parse.return_value)
+        create_request_builder.assert_called_once_with(
+            endpoint="http://www.google.com/speech-api/v2/recognize",
+            key="awesome-key",
+            language="zh-CN",
+            filter_level=1,
+        )
+        request_builder.build.assert_called_once_with(audio_data)
+        obtain_response_text.assert_called_once_with(
+            recognizer, request, recognizer.operation_timeout
         )
         OutputParser.assert_called_once_with(
             show_all=True, with_confidence=False
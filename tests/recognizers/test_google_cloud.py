@@ -1,9 +1,15 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from speech_recognition import Recognizer
+from speech_recognition import AudioFile, Recognizer
 from speech_recognition.audio import AudioData
+from speech_recognition.exceptions import RequestError, UnknownValueError
+from speech_recognition.recognizers import google_cloud
 from speech_recognition.recognizers.google_cloud import recognize
 
 speech = pytest.importorskip("google.cloud.speech")
@@ -182,3 +188,263 @@ def test_transcribe_with_specified_api_parameters(SpeechClient):
         ),
         audio=RecognitionAudio(content=b"flac_data"),
     )
+
+
+@patch("google.cloud.speech.SpeechClient")
+def test_client_is_shared(SpeechClient):
+    SpeechClient.return_value.recognize.return_value = RecognizeResponse(
+        results=[
+            SpeechRecognitionResult(
+                alternatives=[SpeechRecognitionAlternative(transcript="one")]
+            )
+        ]
+    )
+    audio_data = MagicMock(spec=AudioData)
+    audio_data.sample_rate = 16_000
+    audio_data.get_flac_data.return_value = b"flac_data"
+
+    recognize(MagicMock(spec=Recognizer), audio_data)
+    recognize(MagicMock(spec=Recognizer), audio_data)
+
+    SpeechClient.assert_called_once_with()
+    recognizer = Recognizer()
+    recognizer.google_cloud_client = MagicMock(
+        **{"recognize.return_value": SpeechClient.return_value.recognize.return_value}
+    )
+    recognize(recognizer, audio_data)
+    recognizer.google_cloud_client.recognize.assert_called_once()
+
+
+class FakeSpeechService:
+    """A local gRPC server with the ``StreamingRecognize`` method of the Speech-to-Text V1 API, which answers each request with ``respond(request)``."""
+
+    def __init__(self, respond):
+        import grpc
+
+        self.respond = respond
+        self.requests = []
+        self.cancelled = threading.Event()
+        self.server = grpc.server(ThreadPoolExecutor(4))
+        self.server.add_generic_rpc_handlers(
+            (
+                grpc.method_handlers_generic_handler(
+                    "google.cloud.speech.v1.Speech",
+                    {
+                        "StreamingRecognize": grpc.stream_stream_rpc_method_handler(
+                            self.streaming_recognize,
+                            request_deserializer=speech.StreamingRecognizeRequest.deserialize,
+                            response_serializer=speech.StreamingRecognizeResponse.serialize,
+                        )
+                    },
+                ),
+            )
+        )
+        self.port = self.server.add_insecure_port("127.0.0.1:0")
+        self.server.start()
+
+    def streaming_recognize(self, requests, context):
+        context.add_callback(self.cancelled.set)
+        for request in requests:
+            self.requests.append(request)
+            yield from self.respond(request)
+        yield from self.respond(None)  # the end of the audio
+
+    def client(self):
+        import grpc
+        from google.cloud.speech_v1.services.speech.transports import (
+            SpeechGrpcTransport,
+        )
+
+        return speech.SpeechClient(
+            transport=SpeechGrpcTransport(
+                channel=grpc.insecure_channel("127.0.0.1:{}".format(self.port))
+            )
+        )
+
+    def audio(self):
+        return b"".join(request.audio_content for request in self.requests[1:])
+
+
+def streaming_response(transcript, is_final=False, **kwargs):
+    return speech.StreamingRecognizeResponse(
+        results=[
+            speech.StreamingRecognitionResult(
+                alternatives=[
+                    SpeechRecognitionAlternative(
+                        transcript=transcript,
+                        confidence=0.9 if is_final else 0,
+                    )
+                ],
+                is_final=is_final,
+                stability=0 if is_final else 0.5,
+            )
+        ],
+        **kwargs,
+    )
+
+
+def transcribing_service():
+    """A fake service that answers each chunk of audio with an interim result of the number of bytes heard so far, and the end of the audio with a final result."""
+    heard = []
+
+    def respond(request):
+        if request is None:
+            yield streaming_response("{} bytes".format(sum(heard)), is_final=True)
+        elif request.audio_content:
+            heard.append(len(request.audio_content))
+            yield streaming_response("{} bytes so far".format(sum(heard)))
+
+    return FakeSpeechService(respond)
+
+
+@pytest.fixture
+def start_service():
+    services = []
+
+    def start(service):
+        services.append(service)
+        recognizer = Recognizer()
+        recognizer.google_cloud_client = service.client()
+        return recognizer
+
+    yield start
+    for service in services:
+        service.server.stop(None)
+
+
+def chunks_of(frame_data, sample_rate=16_000, chunk_size=3200):
+    for i in range(0, len(frame_data), chunk_size):
+        yield AudioData(frame_data[i:i + chunk_size], sample_rate, 2)
+
+
+def test_streaming_yields_interim_and_final_results(start_service):
+    service = transcribing_service()
+    recognizer = start_service(service)
+    frame_data = bytes(range(256)) * 50
+
+    actual = list(
+        google_cloud.recognize_streaming(
+            recognizer, chunks_of(frame_data), language_code="ja-JP"
+        )
+    )
+
+    assert actual == [
+        google_cloud.StreamingResult("3200 bytes so far", False, 0.5, 0),
+        google_cloud.StreamingResult("6400 bytes so far", False, 0.5, 0),
+        google_cloud.StreamingResult("9600 bytes so far", False, 0.5, 0),
+        google_cloud.StreamingResult("12800 bytes so far", False, 0.5, 0),
+        google_cloud.StreamingResult("12800 bytes", True, 0, pytest.approx(0.9)),
+    ]
+    assert service.requests[0].streaming_config == speech.StreamingRecognitionConfig(
+        config=RecognitionConfig(
+            encoding=RecognitionConfig.AudioEncoding.LINEAR16,
+            sample_rate_hertz=16_000,
+            language_code="ja-JP",
+        ),
+        interim_results=True,
+    )
+    assert service.audio() == frame_data
+
+
+def test_streaming_sends_audio_while_it_is_produced(start_service):
+    recognizer = start_service(transcribing_service())
+    first_result = threading.Event()
+
+    def chunks():
+        yield AudioData(b"\x00\x00" * 1600, 16_000, 2)
+        assert first_result.wait(5)  # the result for the first chunk arrives before the next chunk is produced
+        yield AudioData(b"\x00\x00" * 1600, 16_000, 2)
+
+    results = []
+    for result in recognizer.recognize_google_cloud_streaming(chunks()):
+        results.append(result.transcript)
+        first_result.set()
+
+    assert results == ["3200 bytes so far", "6400 bytes so far", "6400 bytes"]
+
+
+def test_streaming_converts_and_splits_audio(start_service):
+    service = transcribing_service()
+    recognizer = start_service(service)
+    audio_data = AudioData(bytes(96_000 * 2), 96_000, 2)  # one second of audio, too fast for the API
+
+    list(recognizer.recognize_google_cloud_streaming([audio_data], interim_results=False))
+
+    assert service.requests[0].streaming_config.config.sample_rate_hertz == 48_000
+    assert not service.requests[0].streaming_config.interim_results
+    assert len(service.audio()) == 48_000 * 2
+    assert max(len(request.audio_content) for request in service.requests) <= google_cloud.MAX_STREAMING_REQUEST_BYTES
+
+
+def test_streaming_from_audio_source(start_service):
+    service = transcribing_service()
+    recognizer = start_service(service)
+    audio_file = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), "english.wav")
+
+    with AudioFile(audio_file) as source:
+        actual = list(recognizer.recognize_google_cloud_streaming(source))
+
+    assert actual[-1].is_final
+    assert service.audio() == AudioData.from_file(audio_file).get_raw_data()
+
+
+def test_streaming_single_utterance_stops_sending(start_service):
+    def respond(request):
+        if request is not None and request.audio_content:
+            yield streaming_response(
+                "one",
+                speech_event_type=speech.StreamingRecognizeResponse.SpeechEventType.END_OF_SINGLE_UTTERANCE,
+            )
+            yield streaming_response("one", is_final=True)
+
+    service = FakeSpeechService(respond)
+    recognizer = start_service(service)
+
+    def microphone():
+        while True:
+            yield AudioData(b"\x00\x00" * 1600, 16_000, 2)
+            time.sleep(0.01)
+
+    actual = list(recognizer.recognize_google_cloud_streaming(microphone(), single_utterance=True))
+
+    assert actual[-1] == google_cloud.StreamingResult("one", True, 0, pytest.approx(0.9))
+    assert service.requests[0].streaming_config.single_utterance
+
+
+def test_streaming_stopped_early_cancels_the_request(start_service):
+    service = transcribing_service()
+    recognizer = start_service(service)
+
+    def microphone():
+        while True:
+            yield AudioData(b"\x00\x00" * 1600, 16_000, 2)
+            time.sleep(0.01)
+
+    results = recognizer.recognize_google_cloud_streaming(microphone())
+    assert next(results).transcript == "3200 bytes so far"
+    results.close()
+
+    assert service.cancelled.wait(5)
+
+
+def test_streaming_without_speech(start_service):
+    recognizer = start_service(FakeSpeechService(lambda request: iter(())))
+
+    with pytest.raises(UnknownValueError):
+        list(recognizer.recognize_google_cloud_streaming(chunks_of(b"\x00\x00" * 1600)))
+
+    with pytest.raises(UnknownValueError):
+        list(recognizer.recognize_google_cloud_streaming([]))
+
+
+def test_streaming_errors(start_service):
+    import grpc
+
+    def respond(request):
+        raise grpc.RpcError()
+
+    service = FakeSpeechService(respond)
+    recognizer = start_service(service)
+
+    with pytest.raises(RequestError):
+        list(recognizer.recognize_google_cloud_streaming(chunks_of(b"\x00\x00" * 1600)))
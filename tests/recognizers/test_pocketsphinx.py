@@ -0,0 +1,134 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from speech_recognition import AudioData, Recognizer
+from speech_recognition.recognizers import pocketsphinx
+from speech_recognition.recognizers.pocketsphinx import DecoderPool
+
+
+def test_checkout_builds_decoder_when_pool_is_empty():
+    pool = DecoderPool()
+    factory = MagicMock()
+
+    actual = pool.checkout("key", factory)
+
+    assert actual == factory.return_value
+    factory.assert_called_once_with()
+
+
+def test_checkin_makes_decoder_reusable_for_same_key():
+    pool = DecoderPool()
+    decoder = object()
+    pool.checkin("key", decoder)
+    factory = MagicMock()
+
+    assert pool.checkout("other key", factory) == factory.return_value
+    assert pool.checkout("key", factory) is decoder
+    assert len(pool) == 0
+
+
+def test_checked_out_decoder_is_not_shared():
+    pool = DecoderPool()
+    pool.checkin("key", "decoder 1")
+
+    first = pool.checkout("key", lambda: "decoder 2")
+    second = pool.checkout("key", lambda: "decoder 2")
+
+    assert {first, second} == {"decoder 1", "decoder 2"}
+
+
+def test_evicts_least_recently_used_decoders():
+    pool = DecoderPool(max_size=2)
+    pool.checkin("a", "decoder a")
+    pool.checkin("b", "decoder b")
+    pool.checkin("a", "decoder a2")
+
+    assert len(pool) == 2
+    assert pool.checkout("b", lambda: "new") == "new"
+    assert pool.checkout("a", lambda: "new") == "decoder a2"
+
+
+def test_zero_max_size_disables_pooling():
+    pool = DecoderPool(max_size=0)
+    pool.checkin("key", "decoder")
+
+    assert len(pool) == 0
+
+
+def test_decoder_context_manager_discards_decoder_on_error():
+    pool = DecoderPool()
+
+    with pytest.raises(RuntimeError):
+        with pool.decoder("key", lambda: "decoder"):
+            raise RuntimeError("decoding failed")
+
+    assert len(pool) == 0
+
+
+@pytest.fixture
+def language(tmp_path):
+    acoustic_parameters_directory = tmp_path / "acoustic-model"
+    acoustic_parameters_directory.mkdir()
+    language_model_file = tmp_path / "language-model.lm.bin"
+    language_model_file.touch()
+    phoneme_dictionary_file = tmp_path / "pronounciation-dictionary.dict"
+    phoneme_dictionary_file.touch()
+    return (
+        str(acoustic_parameters_directory),
+        str(language_model_file),
+        str(phoneme_dictionary_file),
+    )
+
+
+@pytest.fixture
+def pocketsphinx_module():
+    module = MagicMock()
+    module.pocketsphinx.Decoder.return_value.hyp.return_value.hypstr = "one two three"
+    with patch.dict(sys.modules, {"pocketsphinx": module}), patch.object(
+        pocketsphinx, "decoder_pool", DecoderPool()
+    ):
+        yield module
+
+
+def test_recognize_reuses_decoder(language, pocketsphinx_module):
+    audio_data = AudioData(b"\x00\x00" * 160, 16_000, 2)
+
+    first = pocketsphinx.recognize(Recognizer(), audio_data, language=language)
+    second = pocketsphinx.recognize(Recognizer(), audio_data, language=language)
+
+    assert first == second == "one two three"
+    pocketsphinx_module.pocketsphinx.Decoder.assert_called_once()
+    decoder = pocketsphinx_module.pocketsphinx.Decoder.return_value
+    assert decoder.process_raw.call_count == 2
+
+
+def test_recognize_builds_separate_decoders_per_keyword_set(
+    language, pocketsphinx_module
+):
+    audio_data = AudioData(b"\x00\x00" * 160, 16_000, 2)
+
+    pocketsphinx.recognize(
+        Recognizer(), audio_data, language=language,
+        keyword_entries=[("one", 1.0)],
+    )
+    pocketsphinx.recognize(
+        Recognizer(), audio_data, language=language,
+        keyword_entries=[("two", 1.0)],
+    )
+
+    assert pocketsphinx_module.pocketsphinx.Decoder.call_count == 2
+
+
+def test_recognize_show_all_does_not_return_decoder_to_pool(
+    language, pocketsphinx_module
+):
+    audio_data = AudioData(b"\x00\x00" * 160, 16_000, 2)
+
+    actual = pocketsphinx.recognize(
+        Recognizer(), audio_data, language=language, show_all=True
+    )
+
+    assert actual == pocketsphinx_module.pocketsphinx.Decoder.return_value
+    assert len(pocketsphinx.decoder_pool) == 0
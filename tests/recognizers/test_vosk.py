@@ -1,10 +1,18 @@
+import importlib.util
+import sys
+import threading
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from speech_recognition import AudioData, Recognizer
+from speech_recognition.exceptions import SetupError
+from speech_recognition.recognizers import vosk
 
-pytest.importorskip("vosk")
+requires_vosk = pytest.mark.skipif(
+    importlib.util.find_spec("vosk") is None, reason="requires vosk extra"
+)
 
 
 @pytest.fixture
@@ -13,6 +21,7 @@ def audio_data() -> AudioData:
     return AudioData.from_file(audio_file)
 
 
+@requires_vosk
 def test_recognize_vosk(audio_data):
     recognizer = Recognizer()
     actual = recognizer.recognize_vosk(audio_data)
@@ -20,8 +29,92 @@ def test_recognize_vosk(audio_data):
     assert actual == "one two three"
 
 
+@requires_vosk
 def test_recognize_vosk_verbose(audio_data):
     recognizer = Recognizer()
     actual = recognizer.recognize_vosk(audio_data, verbose=True)
 
     assert actual == {"text": "one two three"}
+
+
+@pytest.fixture
+def vosk_module():
+    module = MagicMock()
+    module.KaldiRecognizer.return_value.FinalResult.return_value = (
+        '{"text": "one two three"}'
+    )
+    with patch.dict(sys.modules, {"vosk": module}), patch.dict(
+        vosk._models, clear=True
+    ), patch.dict(vosk._model_locks, clear=True):
+        yield module
+
+
+def test_model_is_loaded_once_and_shared(tmp_path, vosk_module):
+    audio = AudioData(b"\x00\x00" * 160, 16_000, 2)
+
+    first = vosk.recognize(None, audio, model_path=tmp_path)
+    second = vosk.recognize(None, audio, model_path=tmp_path)
+
+    assert first == second == "one two three"
+    vosk_module.Model.assert_called_once_with(str(tmp_path.resolve()))
+    assert vosk_module.KaldiRecognizer.call_count == 2
+    vosk_module.KaldiRecognizer.assert_called_with(
+        vosk_module.Model.return_value, 16_000
+    )
+
+
+def test_several_models_stay_resident(tmp_path, vosk_module):
+    (tmp_path / "en").mkdir()
+    (tmp_path / "fr").mkdir()
+    vosk_module.Model.side_effect = lambda path: path
+
+    english = vosk.load_model(tmp_path / "en")
+    french = vosk.load_model(tmp_path / "fr")
+
+    assert english != french
+    assert vosk.load_model(tmp_path / "en") is english
+    assert vosk_module.Model.call_count == 2
+
+
+def test_unload_model(tmp_path, vosk_module):
+    vosk.load_model(tmp_path)
+    assert str(tmp_path.resolve()) not in vosk._model_locks
+    vosk.unload_model(tmp_path)
+    vosk.load_model(tmp_path)
+
+    assert vosk_module.Model.call_count == 2
+
+
+def test_unload_model_waits_for_a_load_in_progress(tmp_path, vosk_module):
+    loading, release = threading.Event(), threading.Event()
+
+    def load(path):
+        loading.set()
+        release.wait(5)
+        return MagicMock()
+    vosk_module.Model.side_effect = load
+    loader = threading.Thread(target=vosk.load_model, args=(tmp_path,))
+    loader.start()
+    assert loading.wait(5)
+    unloader = threading.Thread(target=vosk.unload_model, args=(tmp_path,))
+    unloader.start()
+    unloader.join(0.1)
+    assert unloader.is_alive()  # waits for the load to finish
+
+    release.set()
+    loader.join()
+    unloader.join()
+    assert str(tmp_path.resolve()) not in vosk._models
+
+
+def test_missing_model_raises_setup_error(tmp_path, vosk_module):
+    with pytest.raises(SetupError):
+        vosk.load_model(tmp_path / "missing")
+    assert str((tmp_path / "missing").resolve()) not in vosk._model_locks
+
+
+def test_failed_load_leaves_no_lock_behind(tmp_path, vosk_module):
+    vosk_module.Model.side_effect = RuntimeError("corrupt model")
+    with pytest.raises(RuntimeError):
+        vosk.load_model(tmp_path)
+    assert vosk._model_locks == {}
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import httpx
@@ -36,3 +37,26 @@ def test_transcribe_with_groq_whisper(respx_mock, monkeypatch):
     )
 
     assert actual == "Transcription by Groq Whisper"
+
+
+@respx.mock(assert_all_called=True, assert_all_mocked=True)
+def test_transcribe_async(respx_mock, monkeypatch):
+    monkeypatch.setenv("GROQ_API_KEY", "gsk_grok_api_key")
+
+    respx_mock.post(
+        "https://api.groq.com/openai/v1/audio/transcriptions",
+        headers__contains={"Authorization": "Bearer gsk_grok_api_key"},
+        data__contains={"model": "whisper-large-v3-turbo"},
+    ).respond(
+        200,
+        json={"text": "Transcription by Groq Whisper"},
+    )
+
+    audio_data = MagicMock(spec=AudioData)
+    audio_data.get_wav_data.return_value = b"audio_data"
+
+    actual = asyncio.run(
+        groq.recognize_async(MagicMock(spec=Recognizer), audio_data)
+    )
+
+    assert actual == "Transcription by Groq Whisper"
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import httpx
@@ -104,3 +105,48 @@ def test_transcribe_with_specified_prompt(respx_mock, setenv_openai_api_key):
     )
 
     assert actual == "Prompted transcription"
+
+
+@respx.mock(assert_all_called=True, assert_all_mocked=True)
+def test_transcribe_async(respx_mock, setenv_openai_api_key):
+    respx_mock.post(
+        "https://api.openai.com/v1/audio/transcriptions",
+        headers__contains={"Authorization": "Bearer sk_openai_api_key"},
+        data__contains={"model": "whisper-1", "language": "en"},
+    ).respond(
+        200,
+        json={"text": "Transcription by OpenAI Whisper"},
+    )
+
+    audio_data = MagicMock(spec=AudioData)
+    audio_data.get_wav_data.return_value = b"audio_data"
+
+    actual = asyncio.run(
+        openai.recognize_async(
+            MagicMock(spec=Recognizer), audio_data, language="en"
+        )
+    )
+
+    assert actual == "Transcription by OpenAI Whisper"
+    audio_data.get_wav_data.assert_called_once_with()
+
+
+@respx.mock(assert_all_called=True, assert_all_mocked=True)
+def test_client_is_reused(respx_mock, monkeypatch):
+    route = respx_mock.post("https://api.openai.com/v1/audio/transcriptions")
+    route.respond(200, json={"text": "Transcription by OpenAI Whisper"})
+    audio_data = MagicMock(spec=AudioData)
+    audio_data.get_wav_data.return_value = b"audio_data"
+    monkeypatch.setenv("OPENAI_API_KEY", "sk_first_key")
+    OpenAI = MagicMock(wraps=pytest.importorskip("openai").OpenAI)
+    monkeypatch.setattr("openai.OpenAI", OpenAI)
+
+    openai.recognize(Recognizer(), audio_data)
+    openai.recognize(Recognizer(), audio_data)
+    monkeypatch.setenv("OPENAI_API_KEY", "sk_second_key")
+    openai.recognize(Recognizer(), audio_data)
+
+    assert OpenAI.call_count == 2
+    assert [
+        call.request.headers["Authorization"] for call in route.calls
+    ] == ["Bearer sk_first_key"] * 2 + ["Bearer sk_second_key"]
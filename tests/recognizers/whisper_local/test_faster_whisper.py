@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import sys
-from collections.abc import Generator
 from typing import TYPE_CHECKING
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
@@ -13,18 +12,27 @@ from speech_recognition.audio import AudioData
 from speech_recognition.recognizers.whisper_local.faster_whisper import (
     recognize,
 )
+from speech_recognition.recognizers.whisper_local.registry import (
+    model_registry,
+)
 
 pytest.importorskip("faster_whisper")
-pytest.importorskip("soundfile")
 
 if TYPE_CHECKING:
     from faster_whisper.transcribe import Segment, TranscriptionInfo
 
 
+@pytest.fixture(autouse=True)
+def clear_model_registry():
+    model_registry.clear()
+    yield
+    model_registry.clear()
+
+
 @pytest.fixture
 def audio_data() -> AudioData:
     audio = MagicMock(spec=AudioData)
-    audio.get_wav_data.return_value = b""
+    audio.get_float_array.return_value = MagicMock(spec=np.ndarray)
     return audio
 
 
@@ -44,24 +52,12 @@ def transcription_info() -> TranscriptionInfo:
     return MagicMock(spec=TranscriptionInfo(*[None] * 7))
 
 
-@pytest.fixture
-def soundfile_read() -> Generator[tuple[MagicMock, np.ndarray], None, None]:
-    audio_array = MagicMock(spec=np.ndarray)
-    dummy_sampling_rate = 99_999
-
-    with patch("soundfile.read") as mock_read:
-        mock_read.return_value = (audio_array, dummy_sampling_rate)
-        yield mock_read, audio_array
-
-
 @pytest.mark.skipif(
     sys.version_info >= (3, 14), reason="skip on Python 3.14 or later"
 )
 @patch("faster_whisper.WhisperModel")
 class TestTranscribe:
-    def test_default_parameters(
-        self, WhisperModel, audio_data, soundfile_read
-    ):
+    def test_default_parameters(self, WhisperModel, audio_data):
         from faster_whisper.transcribe import (
             Segment,
             TranscriptionInfo,
@@ -69,8 +65,6 @@ class TestTranscribe:
             VadOptions,
         )
 
-        sf_read, audio_array = soundfile_read
-
         def segments():
             yield Segment(
                 id=1,
@@ -99,20 +93,16 @@ class TestTranscribe:
         whisper_model = WhisperModel.return_value
         whisper_model.transcribe.return_value = segments(), info
 
-        audio_data.get_wav_data.return_value = b"audio data"
         actual = recognize(MagicMock(spec=Recognizer), audio_data)
 
         assert actual == " 1, 2, 3"
         WhisperModel.assert_called_once_with("base")
-        audio_data.get_wav_data.assert_called_once_with(convert_rate=16_000)
-        sf_read.assert_called_once_with(ANY)
-        assert sf_read.call_args[0][0].read() == b"audio data"
-        audio_array.astype.assert_called_once_with(np.float32)
+        audio_data.get_float_array.assert_called_once_with(convert_rate=16_000)
         whisper_model.transcribe.assert_called_once_with(
-            audio_array.astype.return_value
+            audio_data.get_float_array.return_value
         )
 
-    def test_show_dict(self, WhisperModel, audio_data, soundfile_read):
+    def test_show_dict(self, WhisperModel, audio_data):
         from faster_whisper.transcribe import (
             Segment,
             TranscriptionInfo,
@@ -179,10 +169,7 @@ class TestTranscribe:
         audio_data,
         segment,
         transcription_info,
-        soundfile_read,
     ):
-        _, audio_array = soundfile_read
-
         def segments_generator():
             yield segment
 
@@ -204,7 +191,7 @@ class TestTranscribe:
 
         WhisperModel.assert_called_once_with("small")
         whisper_model.transcribe.assert_called_once_with(
-            audio_array.astype.return_value,
+            audio_data.get_float_array.return_value,
             language="fr",
             task="translate",
             beam_size=5,
@@ -216,7 +203,6 @@ class TestTranscribe:
         audio_data,
         segment,
         transcription_info,
-        soundfile_read,
     ):
         def segments_generator():
             yield segment
@@ -234,3 +220,27 @@ class TestTranscribe:
         )
 
         WhisperModel.assert_called_once_with("base", compute_type="int8")
+
+    def test_reuse_loaded_model(
+        self,
+        WhisperModel,
+        audio_data,
+        segment,
+        transcription_info,
+    ):
+        whisper_model = WhisperModel.return_value
+        whisper_model.transcribe.side_effect = lambda *args, **kwargs: (
+            iter([segment]),
+            transcription_info,
+        )
+
+        recognize(MagicMock(spec=Recognizer), audio_data)
+        recognize(MagicMock(spec=Recognizer), audio_data)
+        recognize(
+            MagicMock(spec=Recognizer),
+            audio_data,
+            init_options={"compute_type": "int8"},
+        )
+
+        assert WhisperModel.call_count == 2
+        WhisperModel.assert_called_with("base", compute_type="int8")
@@ -0,0 +1,135 @@
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from speech_recognition.recognizers.whisper_local.registry import (
+    ModelKey,
+    ModelRegistry,
+    estimate_size,
+)
+
+
+def test_get_loads_model_once():
+    registry = ModelRegistry()
+    loader = MagicMock()
+    key = ModelKey("whisper", "base")
+
+    first = registry.get(key, loader, lambda _: 1)
+    second = registry.get(key, loader, lambda _: 1)
+
+    assert first is second is loader.return_value
+    loader.assert_called_once_with()
+
+
+def test_models_are_keyed_by_loading_options():
+    registry = ModelRegistry()
+
+    cpu = registry.get(
+        ModelKey.from_options("faster_whisper", "base", {"device": "cpu"}),
+        lambda: "cpu model",
+        lambda _: 1,
+    )
+    int8 = registry.get(
+        ModelKey.from_options(
+            "faster_whisper", "base", {"device": "cpu", "compute_type": "int8"}
+        ),
+        lambda: "int8 model",
+        lambda _: 1,
+    )
+
+    assert (cpu, int8) == ("cpu model", "int8 model")
+    assert len(registry) == 2
+
+
+def test_unhashable_loading_options():
+    options = {"device": "cuda", "device_index": [0, 1], "extra": {"b": [2], "a": 1}}
+    key = ModelKey.from_options("faster_whisper", "base", options)
+
+    assert key == ModelKey.from_options("faster_whisper", "base", dict(options))
+    assert key.options == (("device_index", (0, 1)), ("extra", (("a", 1), ("b", (2,)))))
+    assert ModelRegistry().get(key, lambda: "model", lambda _: 1) == "model"
+
+
+def test_failed_load_leaves_no_lock_behind():
+    registry = ModelRegistry()
+    key = ModelKey("whisper", "base")
+
+    with pytest.raises(RuntimeError):
+        registry.get(key, MagicMock(side_effect=RuntimeError("out of memory")), lambda _: 1)
+
+    assert registry._load_locks == {}
+    assert registry.get(key, lambda: "model", lambda _: 1) == "model"
+
+
+def test_evicts_least_recently_used_model_over_budget():
+    registry = ModelRegistry(max_bytes=100)
+    tiny, base, small = (
+        ModelKey("whisper", "tiny"),
+        ModelKey("whisper", "base"),
+        ModelKey("whisper", "small"),
+    )
+    registry.get(tiny, lambda: "tiny", lambda _: 40)
+    registry.get(base, lambda: "base", lambda _: 40)
+    registry.get(tiny, lambda: "unused", lambda _: 40)  # tiny is now most recently used
+
+    registry.get(small, lambda: "small", lambda _: 40)
+
+    assert tiny in registry
+    assert base not in registry
+    assert small in registry
+    assert registry.total_bytes == 80
+
+
+def test_keeps_most_recent_model_even_if_over_budget():
+    registry = ModelRegistry(max_bytes=10)
+    key = ModelKey("whisper", "large")
+
+    registry.get(ModelKey("whisper", "tiny"), lambda: "tiny", lambda _: 5)
+    registry.get(key, lambda: "large", lambda _: 100)
+
+    assert len(registry) == 1
+    assert key in registry
+
+
+def test_concurrent_get_loads_model_once():
+    registry = ModelRegistry()
+    key = ModelKey("whisper", "base")
+    loading = threading.Event()
+    release = threading.Event()
+    loader = MagicMock()
+
+    def slow_loader():
+        loading.set()
+        release.wait()
+        return loader()
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(registry.get(key, slow_loader, lambda _: 1))
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    loading.wait()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    loader.assert_called_once_with()
+    assert results == [loader.return_value] * 4
+
+
+def test_estimate_size_of_model_names():
+    assert estimate_size("small.en") == 244_000_000 * 4
+    assert estimate_size("distil-large-v3", 2) == 1_550_000_000 * 2
+    assert estimate_size("large-v3-turbo", 1) == 809_000_000
+
+
+def test_estimate_size_of_model_directory(tmp_path):
+    (tmp_path / "model.bin").write_bytes(b"\x00" * 1000)
+    (tmp_path / "config.json").write_bytes(b"{}")
+
+    assert estimate_size(str(tmp_path)) == 1002
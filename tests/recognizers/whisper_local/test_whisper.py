@@ -1,23 +1,27 @@
 import sys
 from unittest import TestCase, skipIf
-from unittest.mock import ANY, MagicMock, patch
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pytest
 
 from speech_recognition import AudioData, Recognizer
+from speech_recognition.recognizers.whisper_local.registry import (
+    model_registry,
+)
 from speech_recognition.recognizers.whisper_local.whisper import recognize
 
-pytest.importorskip("soundfile")
 pytest.importorskip("whisper")
 
 
 @skipIf(sys.version_info >= (3, 14), "skip on Python 3.14")
-@patch("soundfile.read")
 @patch("torch.cuda.is_available")
 @patch("whisper.load_model")
 class RecognizeWhisperTestCase(TestCase):
-    def test_default_parameters(self, load_model, is_available, sf_read):
+    def setUp(self):
+        model_registry.clear()
+
+    def test_default_parameters(self, load_model, is_available):
         whisper_model = load_model.return_value
         whisper_model.transcribe.return_value = {
             "text": "Transcription by Whisper model",
@@ -25,25 +29,20 @@ class RecognizeWhisperTestCase(TestCase):
             # Omit "segments"
         }
         audio_array = MagicMock(spec=np.ndarray)
-        dummy_sampling_rate = 99_999
-        sf_read.return_value = (audio_array, dummy_sampling_rate)
 
         audio_data = MagicMock(spec=AudioData)
-        audio_data.get_wav_data.return_value = b"wav_data"
+        audio_data.get_float_array.return_value = audio_array
         actual = recognize(MagicMock(spec=Recognizer), audio_data)
 
         assert actual == "Transcription by Whisper model"
         load_model.assert_called_once_with("base")
-        audio_data.get_wav_data.assert_called_once_with(convert_rate=16000)
-        sf_read.assert_called_once_with(ANY)
-        assert sf_read.call_args[0][0].read() == b"wav_data"
-        audio_array.astype.assert_called_once_with(np.float32)
+        audio_data.get_float_array.assert_called_once_with(convert_rate=16000)
         whisper_model.transcribe.assert_called_once_with(
-            audio_array.astype.return_value,
+            audio_array,
             fp16=is_available.return_value,
         )
 
-    def test_return_as_dict(self, load_model, is_available, sf_read):
+    def test_return_as_dict(self, load_model, is_available):
         whisper_model = load_model.return_value
         whisper_model.transcribe.return_value = {
             "text": " 1, 2, 3",
@@ -64,11 +63,9 @@ class RecognizeWhisperTestCase(TestCase):
             "language": "en",
         }
         audio_array = MagicMock(spec=np.ndarray)
-        dummy_sampling_rate = 99_999
-        sf_read.return_value = (audio_array, dummy_sampling_rate)
 
         audio_data = MagicMock(spec=AudioData)
-        audio_data.get_wav_data.return_value = b""
+        audio_data.get_float_array.return_value = audio_array
         actual = recognize(
             MagicMock(spec=Recognizer), audio_data, show_dict=True
         )
@@ -94,14 +91,12 @@ class RecognizeWhisperTestCase(TestCase):
 
         assert actual == expected
 
-    def test_pass_parameters(self, load_model, is_available, sf_read):
+    def test_pass_parameters(self, load_model, is_available):
         whisper_model = load_model.return_value
         audio_array = MagicMock(spec=np.ndarray)
-        dummy_sampling_rate = 99_999
-        sf_read.return_value = (audio_array, dummy_sampling_rate)
 
         audio_data = MagicMock(spec=AudioData)
-        audio_data.get_wav_data.return_value = b""
+        audio_data.get_float_array.return_value = audio_array
         _ = recognize(
             MagicMock(spec=Recognizer),
             audio_data,
@@ -113,9 +108,25 @@ class RecognizeWhisperTestCase(TestCase):
 
         load_model.assert_called_once_with("small")
         whisper_model.transcribe.assert_called_once_with(
-            audio_array.astype.return_value,
+            audio_array,
             fp16=is_available.return_value,
             language="english",
             task="translate",
             temperature=0,
         )
+
+    def test_reuse_loaded_model(self, load_model, is_available):
+        audio_data = MagicMock(spec=AudioData)
+        audio_data.get_float_array.return_value = MagicMock(spec=np.ndarray)
+
+        recognize(MagicMock(spec=Recognizer), audio_data, model="small")
+        recognize(MagicMock(spec=Recognizer), audio_data, model="small")
+        recognize(
+            MagicMock(spec=Recognizer),
+            audio_data,
+            model="small",
+            load_options={"device": "cpu"},
+        )
+
+        self.assertEqual(load_model.call_count, 2)
+        load_model.assert_called_with("small", device="cpu")
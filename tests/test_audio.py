@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 
+import io
 import sys
 import unittest
+import wave
 from os import path
 from unittest import mock
 
@@ -128,6 +130,82 @@ class TestAudioFile(unittest.TestCase):
         else:
             self.assertSimilar(audio.get_raw_data()[:32], b"\x00\x00\x00\x00\x00\x00\xfe\xff\x00\x00\x02\x00\x00\x00\xfe\xff\x00\x00\x00\x00\x00\xff\x01\x00\x00\x02\xfc\xff\x00\xfe\x01\x00")
 
+    def test_record_seeks_to_offset(self):
+        for name in ("audio-stereo-16-bit-44100Hz.wav", "audio-stereo-16-bit-44100Hz.aiff", "audio-mono-24-bit-44100Hz.flac"):
+            file_path = path.join(path.dirname(path.realpath(__file__)), name)
+            audio = sr.AudioData.from_file(file_path)
+            frame_size = audio.sample_width
+            with sr.AudioFile(file_path) as source:
+                with mock.patch.object(source.stream, "read", wraps=source.stream.read) as read:
+                    segment = sr.Recognizer().record(source, duration=0.01, offset=0.02)
+                    rest = sr.Recognizer().record(source, offset=0.001)
+            self.assertEqual(read.call_args_list, [mock.call(441), mock.call(source.FRAME_COUNT - 882 - 441 - 44)])
+            self.assertEqual(segment.get_raw_data(), audio.get_raw_data()[882 * frame_size:1323 * frame_size])
+            self.assertEqual(rest.get_raw_data(), audio.get_raw_data()[(1323 + 44) * frame_size:])
+
+    def test_record_past_the_end(self):
+        with sr.AudioFile(path.join(path.dirname(path.realpath(__file__)), "audio-mono-16-bit-44100Hz.wav")) as source:
+            audio = sr.Recognizer().record(source, offset=source.DURATION + 1)
+        self.assertEqual(audio.get_raw_data(), b"")
+
+    def test_record_from_other_seekable_sources(self):
+        class BytesSource(sr.AudioSource):
+            CHUNK, SAMPLE_RATE, SAMPLE_WIDTH = 1024, 16000, 2
+
+            def __init__(self):
+                self.stream = None
+
+            def __enter__(self):
+                self.stream = io.BytesIO(bytes(range(256)) * 28)
+                return self
+
+            def __exit__(self, exc_type, exc_value, traceback):
+                self.stream = None
+
+        with BytesSource() as source:
+            audio = sr.Recognizer().record(source)
+        self.assertEqual(audio.get_raw_data(), bytes(range(256)) * 28)
+
+
+class TestAudioFileStreamConversion(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("the vectorized conversion requires numpy")
+
+    def record(self, name, channel=None, use_numpy=True):
+        with sr.AudioFile(path.join(path.dirname(path.realpath(__file__)), name), channel=channel) as source:
+            if not use_numpy:
+                source.stream._np = None
+            return sr.Recognizer().record(source).get_raw_data()
+
+    def test_matches_audioop(self):
+        for name in ("audio-stereo-8-bit-44100Hz.wav", "audio-stereo-16-bit-44100Hz.wav", "audio-stereo-24-bit-44100Hz.wav", "audio-stereo-32-bit-44100Hz.wav", "audio-mono-16-bit-44100Hz.aiff", "audio-stereo-16-bit-44100Hz.aiff"):
+            for channel in ((None,) if "mono" in name else (None, 0, 1)):
+                with self.subTest(name=name, channel=channel):
+                    self.assertEqual(self.record(name, channel), self.record(name, channel, use_numpy=False))
+
+    def test_big_endian_24_bit_and_clipping(self):
+        frames = b"".join(v.to_bytes(3, "big", signed=True) for v in (8388607, 1, -8388608, -1, 256, -512))
+        reader = mock.Mock(**{"readframes.return_value": frames, "getsampwidth.return_value": 3, "getnchannels.return_value": 2})
+        for channel, expected in ((None, (8388607, -8388608, -256)), (0, (8388607, -8388608, 256)), (1, (1, -1, -512))):
+            stream = sr.AudioFile.AudioFileStream(reader, False, False, channel)
+            self.assertEqual(stream.read(3), b"".join(v.to_bytes(3, "little", signed=True) for v in expected))
+
+    def test_channel_selection(self):
+        left, right = self.record("audio-stereo-16-bit-44100Hz.wav", 0), self.record("audio-stereo-16-bit-44100Hz.wav", 1)
+        with open(path.join(path.dirname(path.realpath(__file__)), "audio-stereo-16-bit-44100Hz.wav"), "rb") as f:
+            with sr.AudioFile(f) as source:
+                frames = source.audio_reader.readframes(source.FRAME_COUNT)
+        self.assertEqual(left, b"".join(frames[i:i + 2] for i in range(0, len(frames), 4)))
+        self.assertEqual(right, b"".join(frames[i + 2:i + 4] for i in range(0, len(frames), 4)))
+
+    def test_channel_must_exist(self):
+        with self.assertRaises(AssertionError):
+            with sr.AudioFile(path.join(path.dirname(path.realpath(__file__)), "audio-mono-16-bit-44100Hz.wav"), channel=1):
+                pass
+
 
 class TestAudioDataSplit(unittest.TestCase):
     def test_returns_self_when_already_fits(self):
@@ -195,6 +273,11 @@ class TestAudioDataSplit(unittest.TestCase):
         for chunk in chunks:
             self.assertEqual(len(chunk.frame_data) % 2, 0)
 
+    def test_raises_on_unknown_silence_backend(self):
+        audio = sr.AudioData(b"\x00\x01" * 100, sample_rate=16000, sample_width=2)
+        with self.assertRaises(ValueError):
+            audio.split(max_bytes=2_048, silence_aware=True, silence_backend="scipy")
+
     def test_silence_aware_raises_setup_error_without_librosa(self):
         # Pre-load numpy so mock.patch.dict's exit-time restore does not
         # remove a freshly-imported numpy entry; numpy 2.x refuses to
@@ -211,7 +294,7 @@ class TestAudioDataSplit(unittest.TestCase):
             {"librosa": None, "librosa.effects": None},
         ):
             with self.assertRaises(SetupError):
-                audio.split(max_bytes=2_048, silence_aware=True)
+                audio.split(max_bytes=2_048, silence_aware=True, silence_backend="librosa")
 
     def test_silence_aware_translates_call_time_errors_to_setup_error(self):
         # Regression: even after the dependency import succeeds, librosa's
@@ -233,7 +316,7 @@ class TestAudioDataSplit(unittest.TestCase):
 
         with mock.patch("librosa.effects.split", side_effect=_boom):
             with self.assertRaises(SetupError):
-                audio.split(max_bytes=2_048, silence_aware=True)
+                audio.split(max_bytes=2_048, silence_aware=True, silence_backend="librosa")
 
     def test_silence_aware_translates_lazy_runtime_errors_to_setup_error(self):
         # Regression: previously librosa.effects.split was looked up lazily
@@ -262,22 +345,24 @@ class TestAudioDataSplit(unittest.TestCase):
             {"librosa": fake_librosa, "librosa.effects": fake_effects},
         ):
             with self.assertRaises(SetupError):
-                audio.split(max_bytes=2_048, silence_aware=True)
+                audio.split(max_bytes=2_048, silence_aware=True, silence_backend="librosa")
 
 
 class TestAudioDataSplitSilenceAware(unittest.TestCase):
+    silence_backend = "numpy"
+
     def setUp(self):
-        # Probe the exact callable used at runtime so this also skips when
-        # librosa is installed but its numba-backed initialization fails
-        # (e.g., read-only cache directory).
         try:
             import numpy  # noqa: F401
-            from librosa.effects import split as _librosa_split  # noqa: F401
-        except Exception as exc:
-            raise unittest.SkipTest(
-                "silence-aware split tests require a functional librosa "
-                f"and numpy: {exc}"
-            )
+        except ImportError:
+            raise unittest.SkipTest("silence-aware split tests require numpy")
+
+    def split(self, audio, max_bytes):
+        return audio.split(
+            max_bytes=max_bytes,
+            silence_aware=True,
+            silence_backend=self.silence_backend,
+        )
 
     def test_to_float_ndarray_normalizes_each_sample_width(self):
         import numpy as np
@@ -351,7 +436,7 @@ class TestAudioDataSplitSilenceAware(unittest.TestCase):
         max_bytes = (
             int(target_seconds * sample_rate * 2) + sr.AudioData._WAV_HEADER_OVERHEAD
         )
-        chunks = audio.split(max_bytes=max_bytes, silence_aware=True)
+        chunks = self.split(audio, max_bytes)
 
         self.assertGreater(len(chunks), 1)
         # First chunk boundary must land on a silence sample (not mid-tone).
@@ -380,7 +465,7 @@ class TestAudioDataSplitSilenceAware(unittest.TestCase):
         )
 
         max_bytes = 200
-        chunks = audio.split(max_bytes=max_bytes, silence_aware=True)
+        chunks = self.split(audio, max_bytes)
 
         for chunk in chunks:
             self.assertLessEqual(len(chunk.get_wav_data()), max_bytes)
@@ -416,7 +501,7 @@ class TestAudioDataSplitSilenceAware(unittest.TestCase):
             int(target_seconds * sample_rate * sample_width)
             + sr.AudioData._WAV_HEADER_OVERHEAD
         )
-        chunks = audio.split(max_bytes=max_bytes, silence_aware=True)
+        chunks = self.split(audio, max_bytes)
         for chunk in chunks:
             self.assertLessEqual(len(chunk.get_wav_data()), max_bytes)
 
@@ -449,7 +534,7 @@ class TestAudioDataSplitSilenceAware(unittest.TestCase):
         max_bytes = (
             int(target_seconds * sample_rate * 2) + sr.AudioData._WAV_HEADER_OVERHEAD
         )
-        chunks = audio.split(max_bytes=max_bytes, silence_aware=True)
+        chunks = self.split(audio, max_bytes)
 
         self.assertGreater(len(chunks), 1)
         # The first chunk should end inside the silence region (sample range
@@ -478,12 +563,255 @@ class TestAudioDataSplitSilenceAware(unittest.TestCase):
         max_bytes = (
             int(target_seconds * sample_rate * 2) + sr.AudioData._WAV_HEADER_OVERHEAD
         )
-        chunks = audio.split(max_bytes=max_bytes, silence_aware=True)
+        chunks = self.split(audio, max_bytes)
 
         self.assertGreater(len(chunks), 1)
         joined = b"".join(c.frame_data for c in chunks)
         self.assertEqual(joined, pcm)
 
+    def test_frame_levels_do_not_depend_on_block_size(self):
+        import numpy as np
+
+        from speech_recognition import audio as audio_module
+
+        rng = np.random.default_rng(0)
+        pcm = (rng.standard_normal(16000 * 3 + 123) * 3000).astype("<i2").tobytes()
+        audio = sr.AudioData(pcm, sample_rate=16000, sample_width=2)
+
+        levels = audio._frame_levels_db(np)
+        with mock.patch.object(audio_module, "_SILENCE_BLOCK_HOPS", 3):
+            np.testing.assert_allclose(audio._frame_levels_db(np), levels)
+
+        # the same levels as measuring each zero-padded frame on its own
+        samples = np.pad(audio._to_float_ndarray(np).astype(np.float64), 1024)
+        expected = [
+            10 * np.log10(np.mean(samples[i * 512:i * 512 + 2048] ** 2))
+            for i in range(len(levels))
+        ]
+        np.testing.assert_allclose(levels, expected, rtol=1e-6)
+
+
+class TestAudioDataSplitSilenceAwareLibrosa(TestAudioDataSplitSilenceAware):
+    silence_backend = "librosa"
+
+    def setUp(self):
+        # Probe the exact callable used at runtime so this also skips when
+        # librosa is installed but its numba-backed initialization fails
+        # (e.g., read-only cache directory).
+        try:
+            import numpy  # noqa: F401
+            from librosa.effects import split as _librosa_split  # noqa: F401
+        except Exception as exc:
+            raise unittest.SkipTest(
+                "silence-aware split tests require a functional librosa "
+                f"and numpy: {exc}"
+            )
+
+
+class TestAudioDataViews(unittest.TestCase):
+    def test_segment_and_split_are_views(self):
+        buffer = bytearray(b"\x01\x00\x02\x00\x03\x00\x04\x00")
+        audio = sr.AudioData(buffer, sample_rate=1000, sample_width=2)
+
+        segment = audio.get_segment(1, 3)
+        chunks = audio.split(max_bytes=44 + 4)
+        buffer[2] = 0x7F
+
+        self.assertIsInstance(segment.frame_data, memoryview)
+        self.assertEqual(segment.get_raw_data(), b"\x7f\x00\x03\x00")
+        self.assertEqual([c.get_raw_data() for c in chunks], [b"\x01\x00\x7f\x00", b"\x03\x00\x04\x00"])
+
+    def test_bytes_backed_segment_and_split_return_bytes(self):
+        audio = sr.AudioData(b"\x01\x00\x02\x00\x03\x00", sample_rate=1000, sample_width=2)
+
+        segment = audio.get_segment(1)
+        chunks = audio.split(max_bytes=44 + 4)
+
+        self.assertIsInstance(segment.frame_data, bytes)
+        self.assertEqual(segment.frame_data, b"\x02\x00\x03\x00")
+        self.assertTrue(segment.frame_data.startswith(b"\x02"))
+        self.assertEqual([c.frame_data for c in chunks], [b"\x01\x00\x02\x00", b"\x03\x00"])
+        self.assertEqual(chunks[0].frame_data + chunks[1].frame_data, audio.frame_data)
+        self.assertIsInstance(segment.get_raw_data(), bytes)
+        self.assertIsInstance(segment.get_wav_data(), bytes)
+
+    def test_pickles_views_as_bytes(self):
+        import pickle
+
+        audio = sr.AudioData(bytearray(b"\x01\x00\x02\x00"), sample_rate=1000, sample_width=2).get_segment(1)
+
+        restored = pickle.loads(pickle.dumps(audio))
+
+        self.assertEqual(restored.frame_data, b"\x02\x00")
+        self.assertEqual((restored.sample_rate, restored.sample_width), (1000, 2))
+
+    def test_array_backed(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise unittest.SkipTest("requires numpy")
+
+        samples = np.array([1, -2, 3, -4], dtype="<i2")
+        audio = sr.AudioData(samples, sample_rate=1000, sample_width=2)
+
+        self.assertEqual(audio.get_raw_data(), samples.tobytes())
+        self.assertTrue(np.shares_memory(audio.as_array(), samples))
+        self.assertTrue(np.shares_memory(audio.get_segment(2).as_array(), samples))
+        np.testing.assert_array_equal(audio.get_segment(2).as_array(), [3, -4])
+
+    def test_as_array_widens_24_bit_samples(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise unittest.SkipTest("requires numpy")
+
+        values = [0, 1, -1, (1 << 23) - 1, -(1 << 23)]
+        payload = b"".join(v.to_bytes(3, "little", signed=True) for v in values)
+
+        actual = sr.AudioData(payload, sample_rate=1000, sample_width=3).as_array()
+
+        self.assertEqual(actual.dtype, np.dtype("<i4"))
+        np.testing.assert_array_equal(actual, values)
+
+
+class TestAudioDataConversionCache(unittest.TestCase):
+    def setUp(self):
+        self.audio = sr.AudioData(b"\x01\x00\x02\x00" * 1000, sample_rate=8000, sample_width=2)
+        patcher = mock.patch("speech_recognition.audio.resample_raw", wraps=sr.audio.resample_raw)
+        self.resample = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_repeated_conversion_is_cached(self):
+        first = self.audio.get_raw_data(convert_rate=16000)
+        second = self.audio.get_raw_data(convert_rate=16000)
+        self.audio.get_wav_data(convert_rate=16000)  # reuses the cached raw data
+        self.audio.get_wav_data(convert_rate=16000)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.resample.call_count, 1)
+
+    def test_different_conversions_are_cached_separately(self):
+        raw_16k = self.audio.get_raw_data(convert_rate=16000)
+        raw_16k_8_bit = self.audio.get_raw_data(convert_rate=16000, convert_width=1)
+
+        self.assertNotEqual(raw_16k, raw_16k_8_bit)
+        self.assertEqual(self.resample.call_count, 2)
+
+    def test_concurrent_conversions_run_once(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: self.audio.get_wav_data(convert_rate=16000), range(32)))
+
+        self.assertEqual(len(set(map(id, results))), 1)
+        self.assertEqual(self.resample.call_count, 1)
+
+    def test_clear_conversion_cache(self):
+        self.audio.get_raw_data(convert_rate=16000)
+        self.audio.clear_conversion_cache()
+        self.audio.get_raw_data(convert_rate=16000)
+
+        self.assertEqual(self.resample.call_count, 2)
+
+    def test_results_over_budget_are_not_cached(self):
+        self.audio.conversion_cache_max_bytes = 1000
+
+        self.audio.get_raw_data(convert_rate=16000)
+        self.audio.get_raw_data(convert_rate=16000)
+
+        self.assertEqual(self.resample.call_count, 2)
+
+    def test_least_recently_used_conversions_are_evicted(self):
+        self.audio.conversion_cache_max_bytes = 3200
+
+        self.audio.get_raw_data(convert_rate=4000)  # 2000 bytes
+        self.audio.get_raw_data(convert_rate=4000, convert_width=1)  # 1000 bytes
+        self.audio.get_raw_data(convert_rate=4000)
+        self.audio.get_raw_data(convert_rate=2000, convert_width=1)  # 500 bytes, evicts the 4000 Hz 8-bit conversion
+        self.audio.get_raw_data(convert_rate=4000)
+        self.assertEqual(self.resample.call_count, 3)
+
+        self.audio.get_raw_data(convert_rate=4000, convert_width=1)
+        self.assertEqual(self.resample.call_count, 4)
+
+    def test_pickling_drops_the_cache(self):
+        import pickle
+
+        self.audio.get_raw_data(convert_rate=16000)
+        restored = pickle.loads(pickle.dumps(self.audio))
+        restored.get_raw_data(convert_rate=16000)
+
+        self.assertEqual(self.resample.call_count, 2)
+
+
+class TestStreamWavData(unittest.TestCase):
+    def chunks_of(self, audio, chunk_size=4096):
+        frame_data = bytes(audio.frame_data)
+        step = chunk_size * audio.sample_width
+        return [sr.AudioData(frame_data[i:i + step], audio.sample_rate, audio.sample_width) for i in range(0, len(frame_data), step)]
+
+    def read_wav(self, wav_data):
+        with wave.open(io.BytesIO(wav_data), "rb") as wav_reader:
+            return wav_reader.getframerate(), wav_reader.getsampwidth(), wav_reader.readframes(len(wav_data))
+
+    def test_matches_get_wav_data(self):
+        for sample_width in (1, 2, 3, 4):
+            audio = sr.AudioData.from_file(path.join(path.dirname(path.realpath(__file__)), "audio-mono-{}-bit-44100Hz.wav".format(sample_width * 8)))
+            for convert_rate, convert_width in ((None, None), (None, 1), (16000, 2)):
+                with self.subTest(sample_width=sample_width, convert_rate=convert_rate, convert_width=convert_width):
+                    actual = self.read_wav(b"".join(sr.audio.stream_wav_data(self.chunks_of(audio), convert_rate, convert_width)))
+                    expected = self.read_wav(audio.get_wav_data(convert_rate, convert_width))
+
+                    self.assertEqual(actual[:2], expected[:2])
+                    if convert_rate is None:
+                        self.assertEqual(actual[2], expected[2])
+                    else:  # rounding may differ slightly at chunk boundaries
+                        self.assertEqual(len(actual[2]), len(expected[2]))
+                        differences = [abs(a - b) for a, b in zip(memoryview(actual[2]).cast("h"), memoryview(expected[2]).cast("h"))]
+                        self.assertLessEqual(max(differences), 1)
+
+    def test_yields_each_chunk_as_it_is_produced(self):
+        produced = []
+
+        def chunks():
+            for i in range(3):
+                produced.append(i)
+                yield sr.AudioData(bytes([i]) * 320, 16000, 2)
+
+        wav_data = sr.audio.stream_wav_data(chunks())
+        self.assertEqual(len(next(wav_data)), 44)  # the header
+        self.assertEqual(produced, [0])
+        self.assertEqual(next(wav_data), bytes([0]) * 320)
+        self.assertEqual(next(wav_data), bytes([1]) * 320)
+        self.assertEqual(produced, [0, 1])
+
+
+class TestAudioDataFloatArray(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("float array tests require numpy")
+
+    def test_matches_decoded_wav_data(self):
+        import numpy as np
+
+        for sample_width in (1, 2, 3, 4):
+            audio = sr.AudioData.from_file(path.join(path.dirname(path.realpath(__file__)), "audio-mono-{}-bit-44100Hz.wav".format(sample_width * 8)))
+            expected = np.frombuffer(audio.get_raw_data(16000, 4), dtype="<i4") / float(1 << 31)
+            actual = audio.get_float_array(convert_rate=16000)
+            self.assertEqual(actual.dtype, np.float32)
+            self.assertTrue(actual.flags["C_CONTIGUOUS"])
+            self.assertEqual(len(actual), len(expected))
+            np.testing.assert_allclose(actual, expected, atol=1e-2)
+
+    def test_no_conversion_at_native_rate(self):
+        import numpy as np
+
+        audio = sr.AudioData(bytes([0, 128, 255]), sample_rate=16000, sample_width=1)
+
+        np.testing.assert_array_equal(audio.get_float_array(convert_rate=16000), np.array([-1.0, 0.0, 127 / 128], dtype=np.float32))
+
 
 if __name__ == "__main__":
     unittest.main()
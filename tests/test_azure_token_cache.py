@@ -0,0 +1,113 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+import speech_recognition as sr
+from speech_recognition.exceptions import RequestError
+
+
+class TestAzureTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = sr.AzureTokenCache()
+
+    def test_tokens_are_cached_by_key_and_location(self):
+        fetched = []
+
+        def fetch_token(name):
+            return lambda: fetched.append(name) or name
+
+        self.assertEqual(self.cache.get("key", "westus", fetch_token("first")), "first")
+        self.assertEqual(self.cache.get("key", "westus", fetch_token("second")), "first")
+        self.assertEqual(self.cache.get("key", "eastus", fetch_token("third")), "third")
+        self.assertEqual(self.cache.get("other key", "westus", fetch_token("fourth")), "fourth")
+        self.assertEqual(fetched, ["first", "third", "fourth"])
+
+        self.cache.clear()
+        self.assertIsNone(self.cache.peek("key", "westus", fetch_token("fifth")))
+
+    def test_concurrent_requests_share_one_fetch(self):
+        fetched = []
+
+        def fetch_token():
+            fetched.append(None)
+            time.sleep(0.1)
+            return "token"
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get("key", "westus", fetch_token))) for _ in range(10)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+
+        self.assertEqual(results, ["token"] * 10)
+        self.assertEqual(len(fetched), 1)
+
+    def test_expired_tokens_are_fetched_again(self):
+        self.cache.get("key", "westus", lambda: "old")
+        self.cache._tokens[("key", "westus")].fetched_at -= sr.AzureTokenCache.TOKEN_LIFETIME
+
+        self.assertEqual(self.cache.get("key", "westus", lambda: "new"), "new")
+
+    def test_refreshes_in_the_background(self):
+        cache = sr.AzureTokenCache(refresh_after=0)
+        cache.get("key", "westus", lambda: "old")
+        release, refreshes = threading.Event(), []
+
+        def fetch_token():
+            refreshes.append(None)
+            release.wait(5)
+            return "new"
+
+        self.assertEqual(cache.get("key", "westus", fetch_token), "old")
+        self.assertEqual(cache.get("key", "westus", fetch_token), "old")  # doesn't wait for the refresh, or start another one
+        release.set()
+        for _ in range(100):
+            if cache._tokens[("key", "westus")].token == "new": break
+            time.sleep(0.01)
+        self.assertEqual(cache._tokens[("key", "westus")].token, "new")
+        self.assertEqual(len(refreshes), 1)
+
+    def test_failed_refresh_keeps_the_old_token(self):
+        cache = sr.AzureTokenCache(refresh_after=0)
+        cache.get("key", "westus", lambda: "old")
+        attempted = threading.Event()
+
+        def fetch_token():
+            attempted.set()
+            raise RequestError("credential connection failed")
+
+        self.assertEqual(cache.get("key", "westus", fetch_token), "old")
+        self.assertTrue(attempted.wait(5))
+        for _ in range(100):  # the failed refresh allows another one
+            if not cache._tokens[("key", "westus")].refreshing: break
+            time.sleep(0.01)
+        self.assertEqual(cache.get("key", "westus", lambda: "new"), "old")
+
+    def test_failed_fetch_raises(self):
+        def fetch_token():
+            raise RequestError("credential request failed: Unauthorized")
+
+        with self.assertRaises(RequestError):
+            self.cache.get("key", "westus", fetch_token)
+        self.assertEqual(self.cache.get("key", "westus", lambda: "token"), "token")
+
+    def test_shared_by_recognizers(self):
+        sr.azure_token_cache.clear()
+        self.addCleanup(sr.azure_token_cache.clear)
+        fetched = []
+
+        def azure_token_fetcher(recognizer, key, location):
+            return lambda: fetched.append(recognizer) or "token"
+
+        first, second = sr.Recognizer(), sr.Recognizer()
+        with mock.patch.object(sr.Recognizer, "_azure_token_fetcher", azure_token_fetcher), mock.patch.object(sr.Recognizer, "_azure_result", lambda *args: "result"):
+            for recognizer in (first, second):
+                recognizer.http_transport = mock.Mock(**{"send.return_value": b"{}"})
+                recognizer.recognize_azure(sr.AudioData(b"\0\0" * 1600, 16000, 2), key="key")
+
+        self.assertEqual(fetched, [first])
+        self.assertEqual(second.http_transport.send.call_args.args[0].get_header("Authorization"), "Bearer token")
+
+
+if __name__ == "__main__":
+    unittest.main()
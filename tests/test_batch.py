@@ -0,0 +1,166 @@
+import collections
+import multiprocessing
+import os
+import threading
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest import mock
+
+import speech_recognition as sr
+
+
+def audio_with_length(length):
+    return sr.AudioData(bytes(length), 16000, 1)
+
+
+def recognize_in_child(recognizer, audio_data, suffix=""):
+    return "{} bytes{}".format(len(audio_data.frame_data), suffix), os.getpid()
+
+
+class TestRecognizeBatch(unittest.TestCase):
+    def setUp(self):
+        self.recognizer = sr.Recognizer()
+
+    def test_ordered_results_with_exceptions(self):
+        def recognize_google(audio_data, language="en-US"):
+            length = len(audio_data.frame_data)
+            time.sleep(0.05 * (5 - length))  # later items finish first
+            if length == 2: raise sr.UnknownValueError()
+            return "{} {}".format(language, length)
+
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=recognize_google):
+            results = list(self.recognizer.recognize_batch([audio_with_length(i) for i in range(5)], "google", max_workers=5, language="fr-FR"))
+
+        self.assertEqual(results[:2] + results[3:], ["fr-FR 0", "fr-FR 1", "fr-FR 3", "fr-FR 4"])
+        self.assertIsInstance(results[2], sr.UnknownValueError)
+
+    def test_network_engines_run_concurrently_in_threads(self):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def recognize_wit(audio_data, key):
+            barrier.wait()  # only passes if four items are being recognized at the same time
+            return threading.current_thread()
+
+        with mock.patch.object(self.recognizer, "recognize_wit", side_effect=recognize_wit):
+            threads = list(self.recognizer.recognize_batch([audio_with_length(1)] * 8, "wit", max_workers=4, key="key"))
+
+        self.assertEqual(len(set(threads)), 4)
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_reads_items_as_results_are_consumed(self):
+        read = []
+
+        def audio_datas():
+            for i in range(100):
+                read.append(i)
+                yield audio_with_length(i)
+
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=lambda audio_data: len(audio_data.frame_data)):
+            results = self.recognizer.recognize_batch(audio_datas(), "google", max_workers=2)
+            self.assertEqual(read, [])
+            self.assertEqual([next(results) for _ in range(3)], [0, 1, 2])
+            self.assertLessEqual(len(read), 3 + 4)
+            results.close()
+
+    def test_local_engines_run_in_processes(self):
+        with mock.patch("speech_recognition.ProcessPoolExecutor", side_effect=ThreadPoolExecutor) as pool, mock.patch.object(sr.Recognizer, "recognize_vosk", recognize_in_child, create=True):
+            results = list(self.recognizer.recognize_batch([audio_with_length(1), audio_with_length(2)], "vosk", max_workers=3, suffix="!"))
+
+        pool.assert_called_once_with(3)
+        self.assertEqual([text for text, _ in results], ["1 bytes!", "2 bytes!"])
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "the patched engine is only inherited by forked processes")
+    def test_given_executor(self):
+        executor = ProcessPoolExecutor(2, mp_context=multiprocessing.get_context("fork"))
+        self.addCleanup(executor.shutdown)
+        with mock.patch.object(sr.Recognizer, "recognize_vosk", recognize_in_child, create=True):
+            for _ in range(2):  # the executor is left running for the next batch
+                results = list(self.recognizer.recognize_batch((audio_with_length(i) for i in range(4)), "vosk", executor=executor))
+
+                self.assertEqual([text for text, _ in results], ["0 bytes", "1 bytes", "2 bytes", "3 bytes"])
+                self.assertNotIn(os.getpid(), [pid for _, pid in results])
+
+    def test_unknown_engine(self):
+        with self.assertRaises(AssertionError):
+            self.recognizer.recognize_batch([], "nonexistent")
+
+
+class TestTranscribeLong(unittest.TestCase):
+    def setUp(self):
+        self.recognizer = sr.Recognizer()
+        # 4 seconds of 8-bit audio, in chunks of 1 second
+        self.audio_data = sr.AudioData(b"".join(bytes([i]) * 16000 for i in range(4)), 16000, 1)
+        self.max_bytes = 16000 + 44
+
+    def transcribe_long(self, **options):
+        return self.recognizer.transcribe_long(self.audio_data, "google", max_bytes=self.max_bytes, silence_aware=False, **options)
+
+    def test_chunks_are_recognized_concurrently_and_joined_in_order(self):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def recognize_google(audio_data, language="en-US"):
+            barrier.wait()  # only passes if all four chunks are being recognized at the same time
+            return " chunk {} ".format(audio_data.frame_data[0])
+
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=recognize_google):
+            self.assertEqual(self.transcribe_long(max_workers=4, language="fr-FR"), "chunk 0 chunk 1 chunk 2 chunk 3")
+            self.assertEqual(self.transcribe_long(max_workers=4, separator=""), "chunk 0chunk 1chunk 2chunk 3")
+
+    def test_chunks_without_speech_are_left_out(self):
+        def recognize_google(audio_data):
+            if audio_data.frame_data[0] % 2: raise sr.UnknownValueError()
+            return "chunk {}".format(audio_data.frame_data[0])
+
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=recognize_google):
+            self.assertEqual(self.transcribe_long(), "chunk 0 chunk 2")
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=sr.UnknownValueError()) as recognize_google:
+            with self.assertRaises(sr.UnknownValueError):
+                self.transcribe_long()
+        self.assertEqual(recognize_google.call_count, 4)  # not retried
+
+    def test_failed_chunks_are_retried(self):
+        attempts = collections.Counter()
+
+        def recognize_google(audio_data):
+            chunk = audio_data.frame_data[0]
+            attempts[chunk] += 1
+            if attempts[chunk] <= chunk: raise sr.RequestError("recognition connection failed")
+            return "chunk {}".format(chunk)
+
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=recognize_google):
+            self.assertEqual(self.transcribe_long(retries=3, retry_delay=0), "chunk 0 chunk 1 chunk 2 chunk 3")
+        self.assertEqual(attempts, {0: 1, 1: 2, 2: 3, 3: 4})
+
+        attempts.clear()
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=recognize_google):
+            with self.assertRaises(sr.RequestError):
+                self.transcribe_long(retries=1, retry_delay=0)
+        self.assertEqual(attempts, {0: 1, 1: 2, 2: 2, 3: 2})
+
+    def test_timestamps_are_shifted(self):
+        Word = collections.namedtuple("Word", ["word", "start", "end"])
+
+        def recognize_google(audio_data):
+            chunk = audio_data.frame_data[0]
+            return {
+                "text": " chunk {}".format(chunk),
+                "segments": [{"start": 0.5, "end": 0.75, "text": "chunk", "words": [Word("chunk", 0.5, 0.75)]}],
+                "language": "en",
+            }
+
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=recognize_google):
+            result = self.transcribe_long()
+
+        self.assertEqual(result["text"], "chunk 0 chunk 1 chunk 2 chunk 3")
+        self.assertEqual(result["language"], "en")
+        self.assertEqual([(segment["start"], segment["end"]) for segment in result["segments"]], [(0.5, 0.75), (1.5, 1.75), (2.5, 2.75), (3.5, 3.75)])
+        self.assertEqual([segment["words"] for segment in result["segments"]][1], [Word("chunk", 1.5, 1.75)])
+
+    def test_other_results_are_returned_with_offsets(self):
+        with mock.patch.object(self.recognizer, "recognize_google", side_effect=lambda audio_data: (audio_data.frame_data[0], 0.9)):
+            self.assertEqual(self.transcribe_long(), [(0.0, (0, 0.9)), (1.0, (1, 0.9)), (2.0, (2, 0.9)), (3.0, (3, 0.9))])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+import speech_recognition as sr
+from speech_recognition.clients import ClientRegistry, get_registry, shared_registry
+
+
+class TestClientRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = ClientRegistry()
+
+    def test_clients_are_reused_by_key(self):
+        created = []
+
+        def create(name):
+            return lambda: created.append(name) or name
+
+        self.assertEqual(self.registry.get("openai", create("first"), credentials="key"), "first")
+        self.assertEqual(self.registry.get("openai", create("second"), credentials="key"), "first")
+        self.assertEqual(self.registry.get("openai", create("third"), credentials="other key"), "third")
+        self.assertEqual(self.registry.get("openai", create("fourth"), credentials="key", base_url="http://localhost:8000/v1"), "fourth")
+        self.assertEqual(self.registry.get("aws-s3", create("fifth"), credentials=("id", "secret"), region="us-east-1"), "fifth")
+        self.assertEqual(self.registry.get("aws-s3", create("sixth"), credentials=("id", "secret"), region="eu-west-1"), "sixth")
+        self.assertEqual(self.registry.get("groq", create("seventh"), credentials="key"), "seventh")
+        self.assertEqual(created, ["first", "third", "fourth", "fifth", "sixth", "seventh"])
+
+    def test_concurrent_requests_share_one_client(self):
+        created = []
+
+        def create():
+            created.append(None)
+            time.sleep(0.1)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.registry.get("cohere", create))) for _ in range(10)]
+        for thread in threads: thread.start()
+        for thread in threads: thread.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual(len(set(map(id, results))), 1)
+
+    def test_slow_creation_does_not_block_other_clients(self):
+        cached = self.registry.get("openai", lambda: "cached")
+        creating, release = threading.Event(), threading.Event()
+
+        def create():
+            creating.set()
+            release.wait(5)
+            return "slow"
+
+        thread = threading.Thread(target=lambda: self.registry.get("cohere", create))
+        thread.start()
+        try:
+            self.assertTrue(creating.wait(5))
+            start = time.monotonic()
+            self.assertEqual(self.registry.get("openai", lambda: "new"), cached)
+            self.assertEqual(self.registry.get("groq", lambda: "other"), "other")
+            self.assertLess(time.monotonic() - start, 1)
+        finally:
+            release.set()
+            thread.join()
+        self.assertEqual(self.registry.get("cohere", lambda: "new"), "slow")
+        self.assertEqual(self.registry._create_locks, {})
+
+    def test_failed_creation_leaves_no_lock_behind(self):
+        def create():
+            raise RuntimeError("no credentials")
+
+        self.assertRaises(RuntimeError, self.registry.get, "openai", create)
+        self.assertEqual(self.registry._create_locks, {})
+        self.assertEqual(self.registry.get("openai", lambda: "created"), "created")
+
+    def test_close_after_creation(self):
+        class ClosedBeforeRead(dict):
+            def __getitem__(self, key):  # as if ``close()`` ran in another thread just before the client is read
+                self.clear()
+                return super().__getitem__(key)
+
+        self.registry._clients = ClosedBeforeRead()
+        self.assertEqual(self.registry.get("openai", lambda: "created"), "created")
+
+    def test_close(self):
+        closable, exitable = mock.Mock(spec=["close"]), mock.MagicMock(spec=["__exit__"])
+        self.registry.get("openai", lambda: closable)
+        self.registry.get("google-cloud-speech", lambda: exitable)
+
+        self.registry.close()
+
+        closable.close.assert_called_once_with()
+        exitable.__exit__.assert_called_once_with(None, None, None)
+        self.assertEqual(self.registry.get("openai", lambda: "new"), "new")
+
+    def test_asynchronous_clients_are_kept_per_event_loop(self):
+        async def get():
+            first = self.registry.get("openai", lambda: object(), asynchronous=True)
+            self.assertIs(self.registry.get("openai", lambda: object(), asynchronous=True), first)
+            return first
+
+        first, second = asyncio.run(get()), asyncio.run(get())
+        self.assertIsNot(first, second)
+        with self.assertRaises(RuntimeError):  # there's no running event loop
+            self.registry.get("openai", lambda: object(), asynchronous=True)
+
+    def test_httpx_client(self):
+        self.assertIsNone(self.registry.httpx_client())
+        try:
+            import httpx
+        except ImportError:
+            self.skipTest("requires httpx")
+
+        registry = ClientRegistry(max_connections=3)
+        client, async_client = registry.httpx_client(), registry.httpx_client(asynchronous=True)
+        self.addCleanup(client.close)
+        self.assertIsInstance(client, httpx.Client)
+        self.assertIsInstance(async_client, httpx.AsyncClient)
+        self.assertEqual(client._transport._pool._max_connections, 3)
+
+    def test_get_registry(self):
+        first, second = sr.Recognizer(), sr.Recognizer()
+        self.assertIs(get_registry(first), shared_registry)
+        self.assertIs(get_registry(None), shared_registry)
+
+        second.client_registry = ClientRegistry(max_connections=16)
+        self.assertIs(get_registry(second), second.client_registry)
+
+    def test_aws_clients(self):
+        try:
+            import boto3  # noqa: F401
+        except ImportError:
+            self.skipTest("requires boto3")
+
+        recognizer = sr.Recognizer()
+        recognizer.client_registry = ClientRegistry(max_connections=8)
+        client = recognizer._aws_client("s3", "id", "secret", "us-east-1")
+
+        self.assertIs(recognizer._aws_client("s3", "id", "secret", "us-east-1"), client)
+        self.assertIsNot(recognizer._aws_client("s3", "id", "secret", "eu-west-1"), client)
+        self.assertEqual(client.meta.config.max_pool_connections, 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
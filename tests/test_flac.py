@@ -0,0 +1,190 @@
+import io
+import sys
+import unittest
+from os import path
+from unittest import mock
+
+import speech_recognition as sr
+from speech_recognition import flac
+from speech_recognition.audio import get_flac_converter
+
+PCM_16_BIT = b"".join(v.to_bytes(2, "little", signed=True) for v in (0, 1, -1, 32767, -32768, 1000))
+
+
+class TestEncoders(unittest.TestCase):
+    def decode(self, flac_data):
+        soundfile = self.soundfile
+        samples, sample_rate = soundfile.read(io.BytesIO(flac_data), dtype="int32")
+        return (samples >> 16).tolist(), sample_rate
+
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+            import soundfile
+        except ImportError:
+            raise unittest.SkipTest("FLAC encoder tests require numpy and soundfile to check the output")
+        self.soundfile = soundfile
+
+    def test_encoders_round_trip(self):
+        for encoder in (flac.encode_with_soundfile, flac.encode_with_subprocess):
+            for compression_level in (0, 8):
+                flac_data = encoder(PCM_16_BIT, 16000, 2, compression_level)
+
+                self.assertEqual(self.decode(flac_data), ([0, 1, -1, 32767, -32768, 1000], 16000))
+
+    def test_soundfile_encoder_handles_8_and_24_bit_samples(self):
+        eight_bit = bytes([128, 129, 127, 255, 0])  # unsigned, as in WAV files
+        twenty_four_bit = b"".join(v.to_bytes(3, "little", signed=True) for v in (0, 256, -256, 8388607))
+
+        samples, _ = self.soundfile.read(io.BytesIO(flac.encode_with_soundfile(eight_bit, 8000, 1)), dtype="int32")
+        self.assertEqual((samples >> 24).tolist(), [0, 1, -1, 127, -128])
+        samples, _ = self.soundfile.read(io.BytesIO(flac.encode_with_soundfile(twenty_four_bit, 8000, 3)), dtype="int32")
+        self.assertEqual((samples >> 8).tolist(), [0, 256, -256, 8388607])
+
+
+class TestSubprocessEncoder(unittest.TestCase):
+    @mock.patch("speech_recognition.flac.subprocess.Popen")
+    def test_passes_compression_level(self, Popen):
+        Popen.return_value.communicate.return_value = (b"flac data", b"")
+
+        actual = flac.encode_with_subprocess(PCM_16_BIT, 16000, 2, 3)
+
+        self.assertEqual(actual, b"flac data")
+        self.assertEqual(Popen.call_args[0][0][1:], ["--stdout", "--totally-silent", "-3", "-"])
+        wav_data = Popen.return_value.communicate.call_args[0][0]
+        self.assertTrue(wav_data.startswith(b"RIFF"))
+        self.assertTrue(wav_data.endswith(PCM_16_BIT))
+
+
+class TestDefaultEncoder(unittest.TestCase):
+    def setUp(self):
+        flac.get_default_encoder.cache_clear()
+        self.addCleanup(flac.get_default_encoder.cache_clear)
+
+    def test_falls_back_to_subprocess_without_soundfile(self):
+        with mock.patch.dict(sys.modules, {"soundfile": None}):
+            self.assertIs(flac.get_default_encoder(), flac.encode_with_subprocess)
+
+
+class TestGetFlacData(unittest.TestCase):
+    def test_uses_configured_encoder_and_compression_level(self):
+        audio = sr.AudioData(PCM_16_BIT, 16000, 2)
+        audio.flac_encoder = mock.Mock(return_value=b"flac data")
+        audio.flac_compression_level = 5
+
+        self.assertEqual(audio.get_flac_data(convert_rate=8000), b"flac data")
+        audio.flac_encoder.assert_called_once_with(audio.get_raw_data(convert_rate=8000), 8000, 2, 5)
+
+    def test_encoder_set_on_the_class(self):
+        calls = []
+
+        def encoder(raw_data, sample_rate, sample_width, compression_level=flac.DEFAULT_COMPRESSION_LEVEL):
+            calls.append((raw_data, sample_rate, sample_width, compression_level))
+            return b"flac data"
+
+        with mock.patch.object(sr.AudioData, "flac_encoder", encoder):
+            audio = sr.AudioData(PCM_16_BIT, 16000, 2)
+            self.assertEqual(audio.get_flac_data(), b"flac data")
+        self.assertEqual(calls, [(PCM_16_BIT, 16000, 2, flac.DEFAULT_COMPRESSION_LEVEL)])
+
+    def test_limits_sample_width_to_24_bit(self):
+        audio = sr.AudioData(b"\x00\x00\x01\x00", 16000, 4)
+        audio.flac_encoder = mock.Mock(return_value=b"flac data")
+
+        audio.get_flac_data()
+
+        audio.flac_encoder.assert_called_once_with(b"\x00\x01\x00", 16000, 3, 8)
+
+    def test_compression_level_is_part_of_the_cache_key(self):
+        audio = sr.AudioData(PCM_16_BIT, 16000, 2)
+        audio.flac_encoder = mock.Mock(side_effect=[b"level 8", b"level 0"])
+
+        audio.get_flac_data()
+        audio.flac_compression_level = 0
+
+        self.assertEqual(audio.get_flac_data(), b"level 0")
+        self.assertEqual(audio.get_flac_data(), b"level 0")
+        self.assertEqual(audio.flac_encoder.call_count, 2)
+
+
+class TestGetFlacConverter(unittest.TestCase):
+    def setUp(self):
+        get_flac_converter.cache_clear()
+        self.addCleanup(get_flac_converter.cache_clear)
+
+    @mock.patch("speech_recognition.audio.shutil_which", return_value="/usr/bin/flac")
+    def test_looks_up_converter_once(self, shutil_which):
+        self.assertEqual(get_flac_converter(), "/usr/bin/flac")
+        self.assertEqual(get_flac_converter(), "/usr/bin/flac")
+
+        shutil_which.assert_called_once_with("flac")
+
+
+def fixture(filename):
+    return path.join(path.dirname(path.realpath(__file__)), filename)
+
+
+class TestFlacReader(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy  # noqa: F401
+            import soundfile  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("in-process FLAC decoding requires numpy and soundfile")
+
+    def test_decodes_incrementally(self):
+        reader = flac.open_reader(fixture("audio-stereo-24-bit-44100Hz.flac"))
+        self.addCleanup(reader.close)
+
+        self.assertEqual((reader.getnchannels(), reader.getsampwidth(), reader.getframerate()), (2, 3, 44100))
+        first = reader.readframes(1000)
+        self.assertEqual(len(first), 1000 * 2 * 3)
+        self.assertEqual(reader.sound_file.tell(), 1000)
+        rest = reader.readframes(reader.getnframes())
+        self.assertEqual(len(first + rest), reader.getnframes() * 2 * 3)
+
+    def test_matches_subprocess_decoder(self):
+        for filename in ("audio-mono-16-bit-44100Hz.flac", "audio-stereo-24-bit-44100Hz.flac"):
+            in_process = sr.AudioData.from_file(fixture(filename))
+            with mock.patch.dict(sys.modules, {"soundfile": None}):
+                with sr.AudioFile(fixture(filename)) as source:
+                    self.assertNotIsInstance(source.audio_reader, flac.FlacReader)
+                    subprocess_decoded = sr.Recognizer().record(source)
+
+            self.assertEqual(in_process.frame_data, subprocess_decoded.frame_data)
+
+    def test_reads_file_like_objects(self):
+        with open(fixture("audio-mono-16-bit-44100Hz.flac"), "rb") as f:
+            fileobject = io.BytesIO(f.read())
+
+        with sr.AudioFile(fileobject) as source:
+            self.assertIsInstance(source.audio_reader, flac.FlacReader)
+            actual = sr.Recognizer().record(source)
+
+        self.assertEqual(actual.frame_data, sr.AudioData.from_file(fixture("audio-mono-16-bit-44100Hz.flac")).frame_data)
+
+    def test_returns_unsigned_8_bit_samples(self):
+        import numpy as np
+        import soundfile
+
+        flac_file = io.BytesIO()
+        with soundfile.SoundFile(flac_file, "w", samplerate=8000, channels=1, subtype="PCM_S8", format="FLAC") as writer:
+            writer.write(np.array([0, 1, -1, 127, -128], dtype=np.int32) << 24)
+        flac_file.seek(0)
+
+        with sr.AudioFile(flac_file) as source:
+            actual = sr.Recognizer().record(source)
+
+        self.assertEqual(actual.frame_data, bytes([128, 129, 127, 255, 0]))
+
+    def test_leaves_other_files_untouched(self):
+        with open(fixture("audio-mono-16-bit-44100Hz.wav"), "rb") as f:
+            fileobject = io.BytesIO(f.read())
+        fileobject.seek(10)
+
+        self.assertIsNone(flac.open_reader(fileobject))
+        self.assertEqual(fileobject.tell(), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+import io
+import os
+import struct
+import sys
+import tempfile
+import threading
+import unittest
+import wave
+from unittest import mock
+
+import speech_recognition as sr
+
+SAMPLE_RATE = 16000
+
+
+def tone_and_silence(*sections):
+    """Returns 16-bit mono frames made of ``(seconds, amplitude)`` sections of a square wave (silence for amplitude 0)."""
+    samples = []
+    for seconds, amplitude in sections:
+        samples.extend(amplitude if i % 2 else -amplitude for i in range(int(seconds * SAMPLE_RATE)))
+    return struct.pack("<{}h".format(len(samples)), *samples)
+
+
+class StreamSource(sr.AudioSource):
+    """An ``AudioSource`` that can't seek, like a microphone."""
+
+    class Stream(object):
+        def __init__(self, frames):
+            self.file = io.BytesIO(frames)
+
+        def read(self, size):
+            return self.file.read(size * 2)
+
+    def __init__(self, frames, chunk_size):
+        self.stream = StreamSource.Stream(frames)
+        self.SAMPLE_RATE, self.SAMPLE_WIDTH, self.CHUNK = SAMPLE_RATE, 2, chunk_size
+
+
+class TestListenFrameDuration(unittest.TestCase):
+    def setUp(self):
+        self.frames = tone_and_silence((1, 0), (1, 1000), (2, 0), (1, 2000), (1.5, 0))
+        handle, self.filename = tempfile.mkstemp(suffix=".wav")
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+        with wave.open(self.filename, "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(SAMPLE_RATE)
+            writer.writeframes(self.frames)
+
+        self.recognizer = sr.Recognizer()
+        self.recognizer.dynamic_energy_threshold = False
+        self.recognizer.frame_duration = 0.02
+
+    def assertPhrase(self, audio, start, end):
+        self.assertEqual(audio.get_raw_data(), self.frames[int(start * SAMPLE_RATE) * 2:int(end * SAMPLE_RATE) * 2])
+
+    def test_detection_is_finer_than_reads(self):
+        with sr.AudioFile(self.filename, chunk_size=SAMPLE_RATE) as source:
+            first = self.recognizer.listen(source)
+            # the rest of the last chunk read is given back to the file
+            self.assertEqual(source.stream.tell(), int((2 + 0.82) * SAMPLE_RATE))
+            second = self.recognizer.listen(source)
+
+        # phrases are kept with about ``non_speaking_duration`` seconds of silence on either side
+        self.assertPhrase(first, 0.52, 2.5)
+        self.assertPhrase(second, 3.52, 5.5)
+
+    def test_unseekable_sources_keep_unused_audio(self):
+        source = StreamSource(self.frames, SAMPLE_RATE)
+        first = self.recognizer.listen(source)
+        second = self.recognizer.listen(source)
+
+        self.assertPhrase(first, 0.52, 2.5)
+        self.assertPhrase(second, 3.52, 5.5)
+
+    def test_byte_addressed_seekable_sources_keep_unused_audio(self):
+        source = StreamSource(self.frames, SAMPLE_RATE)
+        source.stream.seek, source.stream.tell = source.stream.file.seek, source.stream.file.tell  # counts bytes, not frames
+        first = self.recognizer.listen(source)
+        second = self.recognizer.listen(source)
+
+        self.assertPhrase(first, 0.52, 2.5)
+        self.assertPhrase(second, 3.52, 5.5)
+
+    def test_defaults_to_chunks(self):
+        self.recognizer.frame_duration = None
+        with sr.AudioFile(self.filename, chunk_size=SAMPLE_RATE // 2) as source:
+            audio = self.recognizer.listen(source)
+            self.assertEqual(source.stream.tell(), int(3.5 * SAMPLE_RATE))
+
+        self.assertPhrase(audio, 1, 2.5)
+
+
+class TestSegment(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise unittest.SkipTest("the test audio is generated with numpy")
+        # noise with bursts of louder noise: a phrase, a click too short to be a phrase, two phrases close together, and a phrase running to the end
+        rng = np.random.default_rng(0)
+        samples = rng.normal(0, 50, 12 * SAMPLE_RATE)
+        for start, end in ((1, 2.5), (4, 4.05), (5, 6), (6.6, 7.5), (10, 12)):
+            samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] *= 40
+        self.frames = samples.astype("<i2").tobytes()
+        handle, self.filename = tempfile.mkstemp(suffix=".wav")
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+        with wave.open(self.filename, "wb") as writer:
+            writer.setnchannels(1)
+            writer.setsampwidth(2)
+            writer.setframerate(SAMPLE_RATE)
+            writer.writeframes(self.frames)
+
+    def listen_to_all(self, recognizer, chunk_size):
+        phrases = []
+        with sr.AudioFile(self.filename, chunk_size=chunk_size) as source:
+            while source.stream.tell() < source.FRAME_COUNT:
+                frame_data = recognizer.listen(source).get_raw_data()
+                start = self.frames.find(frame_data) // 2
+                phrases.append((start / SAMPLE_RATE, (start + len(frame_data) // 2) / SAMPLE_RATE))
+        return phrases
+
+    def test_matches_listen(self):
+        for dynamic_energy_threshold in (False, True):
+            for frame_duration, chunk_size in ((None, 4096), (0.02, 4096), (0.03, 320)):
+                with self.subTest(dynamic_energy_threshold=dynamic_energy_threshold, frame_duration=frame_duration):
+                    recognizer = sr.Recognizer()
+                    recognizer.dynamic_energy_threshold = dynamic_energy_threshold
+                    recognizer.frame_duration = frame_duration
+                    phrases = recognizer.segment(sr.AudioData(self.frames, SAMPLE_RATE, 2))
+
+                    self.assertEqual(recognizer.energy_threshold, 300)
+                    # at the end of the audio, ``listen`` also returns what's left even if there's no phrase in it
+                    listened = self.listen_to_all(recognizer, chunk_size)
+                    self.assertEqual(phrases, listened[:len(phrases)])
+                    self.assertLessEqual(len(listened), len(phrases) + 1)
+                    if not dynamic_energy_threshold:
+                        self.assertEqual(len(phrases), 3)  # the click is ignored, and the two phrases close together are one
+
+    def test_without_numpy(self):
+        audio = sr.AudioData(self.frames, SAMPLE_RATE, 2)
+        recognizer = sr.Recognizer()
+        recognizer.frame_duration = 0.02
+        phrases = recognizer.segment(audio)
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            self.assertEqual(recognizer.segment(audio), phrases)
+
+    def test_silence(self):
+        self.assertEqual(sr.Recognizer().segment(sr.AudioData(bytes(SAMPLE_RATE), SAMPLE_RATE, 2)), [])
+        self.assertEqual(sr.Recognizer().segment(sr.AudioData(b"", SAMPLE_RATE, 2)), [])
+
+
+class TestListenInBackground(unittest.TestCase):
+    class Source(sr.AudioSource):
+        def __init__(self):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_value, traceback):
+            pass
+
+    def setUp(self):
+        self.recognizer = sr.Recognizer()
+        self.phrases = [sr.AudioData(bytes([i] * 2), SAMPLE_RATE, 2) for i in range(1, 6)]
+        self.all_captured = threading.Event()
+        self.first_phrase_taken = None  # if set, the other phrases are only captured once this is set
+
+        def listen(source, timeout=None, phrase_time_limit=None):
+            if self.first_phrase_taken is not None and len(self.phrases) < 5:
+                self.first_phrase_taken.wait(5)
+            if self.phrases:
+                return self.phrases.pop(0)
+            self.all_captured.set()
+            raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+
+        patcher = mock.patch.object(self.recognizer, "listen", side_effect=listen)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def listen_with_blocked_callback(self, **kwargs):
+        """Captures all the phrases while the first call to the callback waits, then returns the phrases the callback received."""
+        received, first_call, release = [], threading.Event(), threading.Event()
+        self.first_phrase_taken = first_call
+
+        def callback(recognizer, audio):
+            received.append(audio.get_raw_data()[0])
+            first_call.set()
+            release.wait()
+
+        listener = self.recognizer.listen_in_background(self.Source(), callback, **kwargs)
+        self.addCleanup(listener, False)
+        self.assertTrue(self.all_captured.wait(5))
+        depth = listener.queue_depth
+        release.set()
+        while listener.queue_depth or len(received) < depth + 1:
+            self.assertTrue(listener.worker_threads[0].is_alive())
+            threading.Event().wait(0.01)
+        listener(wait_for_stop=True)
+        return listener, received
+
+    def test_drop_oldest(self):
+        listener, received = self.listen_with_blocked_callback(max_queue_size=2)
+
+        self.assertEqual(received, [1, 4, 5])
+        self.assertEqual((listener.phrases_captured, listener.phrases_dropped), (5, 2))
+
+    def test_drop_newest(self):
+        listener, received = self.listen_with_blocked_callback(max_queue_size=2, overflow="drop_newest")
+
+        self.assertEqual(received, [1, 2, 3])
+        self.assertEqual((listener.phrases_captured, listener.phrases_dropped), (5, 2))
+
+    def test_block(self):
+        received, release = [], threading.Event()
+
+        def callback(recognizer, audio):
+            release.wait()
+            received.append(audio.get_raw_data()[0])
+
+        listener = self.recognizer.listen_in_background(self.Source(), callback, max_queue_size=1, overflow="block")
+        self.addCleanup(listener, False)
+        threading.Event().wait(0.3)
+        self.assertFalse(self.all_captured.is_set())  # capturing waits for the callback
+        release.set()
+        self.assertTrue(self.all_captured.wait(5))
+        while len(received) < 5:
+            threading.Event().wait(0.01)
+        listener(wait_for_stop=True)
+
+        self.assertEqual(received, [1, 2, 3, 4, 5])
+        self.assertEqual((listener.phrases_captured, listener.phrases_dropped), (5, 0))
+
+    def test_workers_run_concurrently(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def callback(recognizer, audio):
+            if audio.get_raw_data()[0] <= 3:
+                barrier.wait()  # only passes if three phrases are in the callback at the same time
+
+        listener = self.recognizer.listen_in_background(self.Source(), callback, workers=3)
+        self.addCleanup(listener, False)
+        self.assertTrue(self.all_captured.wait(5))
+        while listener.queue_depth:
+            threading.Event().wait(0.01)
+        listener(wait_for_stop=True)
+
+        self.assertFalse(barrier.broken)
+        self.assertEqual(listener.callback_errors, 0)
+
+    def test_callback_errors_are_counted(self):
+        def callback(recognizer, audio):
+            raise ValueError("callback failed")
+
+        with mock.patch("traceback.print_exc") as print_exc:
+            listener = self.recognizer.listen_in_background(self.Source(), callback)
+            self.addCleanup(listener, False)
+            self.assertTrue(self.all_captured.wait(5))
+            while listener.queue_depth or listener.callback_errors < 5:
+                threading.Event().wait(0.01)
+            listener(wait_for_stop=True)
+
+        self.assertEqual(print_exc.call_count, 5)
+        self.assertTrue(listener.worker_threads[0].daemon)
+
+    def test_stop(self):
+        listener = self.recognizer.listen_in_background(self.Source(), lambda recognizer, audio: None, workers=2)
+        listener(wait_for_stop=True)
+
+        self.assertFalse(listener.capture_thread.is_alive())
+        self.assertFalse(any(thread.is_alive() for thread in listener.worker_threads))
+
+
+if __name__ == "__main__":
+    unittest.main()
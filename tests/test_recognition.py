@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import asyncio
 import importlib.util
+import io
+import json
 import os
 import sys
+import time
 import unittest
+import wave
 
 import speech_recognition as sr
 
@@ -70,5 +75,179 @@ class TestRecognition(unittest.TestCase):
         self.assertEqual(r.recognize_ibm(audio, username=os.environ["IBM_USERNAME"], password=os.environ["IBM_PASSWORD"], language="zh-CN"), u"砸 自己 的 脚 ")
 
 
+class FakeTransport(object):
+    """An ``HTTPTransport`` that returns canned response bodies."""
+
+    def __init__(self, responses):
+        self.responses, self.requests = list(responses), []
+
+    def send(self, request, timeout=None):
+        self.requests.append((request, timeout))
+        return self.responses.pop(0)
+
+
+class FakeAsyncTransport(FakeTransport):
+    """An ``AsyncHTTPTransport`` that returns canned response bodies, after ``delay`` seconds."""
+
+    def __init__(self, responses, delay=0):
+        super().__init__(responses)
+        self.delay = delay
+
+    async def send(self, request, timeout=None):
+        self.requests.append((request, timeout))
+        await asyncio.sleep(self.delay)
+        return self.responses.pop(0)
+
+
+class TestAsyncRecognition(unittest.TestCase):
+    def setUp(self):
+        self.audio = sr.AudioData.from_file(os.path.join(os.path.dirname(os.path.realpath(__file__)), "english.wav"))
+        self.addCleanup(sr.azure_token_cache.clear)
+
+    def recognize_both(self, name, responses, token=None, **kwargs):
+        """Returns the results of ``recognize_NAME`` and ``recognize_NAME_async`` given the same responses (after the access ``token``, if given), and the requests that each of them sent to recognize."""
+        sr.azure_token_cache.clear()
+        recognizer = sr.Recognizer()
+        recognizer.operation_timeout = 5
+        recognizer.http_transport = sync_transport = FakeTransport(([token] if token else []) + responses)
+        result = getattr(recognizer, "recognize_" + name)(self.audio, **kwargs)
+        requests = [request for request, _ in sync_transport.requests[1 if token else 0:]]
+
+        sr.azure_token_cache.clear()
+        recognizer = sr.Recognizer()
+        recognizer.operation_timeout = 5
+        recognizer.http_transport = FakeTransport([token])
+        recognizer.async_transport = FakeAsyncTransport(responses)
+        async_result = asyncio.run(getattr(recognizer, "recognize_{}_async".format(name))(self.audio, **kwargs))
+        async_requests = [request for request, _ in recognizer.async_transport.requests]
+        self.assertEqual([timeout for _, timeout in recognizer.async_transport.requests], [timeout for _, timeout in sync_transport.requests[1 if token else 0:]])
+        return result, async_result, requests, async_requests
+
+    def assertSameRequests(self, requests, async_requests):
+        self.assertEqual([request.full_url for request in async_requests], [request.full_url for request in requests])
+        self.assertEqual([request.get_method() for request in async_requests], [request.get_method() for request in requests])
+
+    def test_wit(self):
+        result, async_result, requests, async_requests = self.recognize_both("wit", [b'{"_text": "one two three"}'], key="key")
+
+        self.assertEqual(async_result, "one two three")
+        self.assertEqual(async_result, result)
+        self.assertSameRequests(requests, async_requests)
+        self.assertEqual(async_requests[0].data, requests[0].data)
+
+    def test_azure(self):
+        response = json.dumps({"RecognitionStatus": "Success", "NBest": [{"Display": "One two three.", "Confidence": 0.9}]}).encode("utf-8")
+        result, async_result, requests, async_requests = self.recognize_both("azure", [response], token=b"token", key="key")
+
+        self.assertEqual(async_result, ("One two three.", 0.9))
+        self.assertEqual(async_result, result)
+        self.assertSameRequests(requests, async_requests)
+        self.assertEqual(async_requests[0].get_header("Authorization"), "Bearer token")
+
+    def test_houndify(self):
+        response = json.dumps({"Disambiguation": {"ChoiceData": [{"Transcription": "one two three", "ConfidenceScore": 0.8}]}}).encode("utf-8")
+        result, async_result, requests, async_requests = self.recognize_both("houndify", [response], client_id="id", client_key="a2V5")
+
+        self.assertEqual(async_result, ("one two three", 0.8))
+        self.assertEqual(async_result, result)
+        self.assertSameRequests(requests, async_requests)
+
+    def test_ibm(self):
+        response = json.dumps({"results": [{"alternatives": [{"transcript": "one two three ", "confidence": 0.7}]}]}).encode("utf-8")
+        result, async_result, requests, async_requests = self.recognize_both("ibm", [response], key="key")
+
+        self.assertEqual(async_result, ("one two three ", 0.7))
+        self.assertEqual(async_result, result)
+        self.assertSameRequests(requests, async_requests)
+        self.assertEqual(async_requests[0].data, requests[0].data)
+
+    def test_unknown_value(self):
+        recognizer = sr.Recognizer()
+        recognizer.async_transport = FakeAsyncTransport([b'{"_text": null}'])
+        with self.assertRaises(sr.UnknownValueError):
+            asyncio.run(recognizer.recognize_wit_async(self.audio, key="key"))
+
+    def test_requests_run_concurrently(self):
+        recognizer = sr.Recognizer()
+        recognizer.async_transport = FakeAsyncTransport([b'{"_text": "one two three"}'] * 20, delay=0.2)
+
+        async def recognize_all():
+            return await asyncio.gather(*(recognizer.recognize_wit_async(self.audio, key="key") for _ in range(20)))
+
+        start = time.monotonic()
+        self.assertEqual(asyncio.run(recognize_all()), ["one two three"] * 20)
+        self.assertLess(time.monotonic() - start, 2)
+
+
+class TestStreamingUpload(unittest.TestCase):
+    def setUp(self):
+        self.audio = sr.AudioData.from_file(os.path.join(os.path.dirname(os.path.realpath(__file__)), "english.wav"))
+        self.addCleanup(sr.azure_token_cache.clear)
+        self.produced = 0
+
+    def chunks(self, chunk_size=4096):
+        """Yields the audio in chunks, like ``recognizer_instance.listen(source, stream=True)`` yields a phrase."""
+        frame_data = self.audio.frame_data
+        for i in range(0, len(frame_data), chunk_size * 2):
+            self.produced += 1
+            yield sr.AudioData(frame_data[i:i + chunk_size * 2], self.audio.sample_rate, 2)
+
+    def recognize_streamed(self, name, response, **kwargs):
+        """Returns the result of ``recognize_NAME`` on the chunks of the audio, the request body that was sent, and the number of chunks that had been produced when the request started being sent."""
+        test = self
+
+        class StreamingTransport(FakeTransport):
+            def send(self, request, timeout=None):
+                self.produced_when_sent = test.produced
+                self.body = b"".join(request.data)  # the chunks are produced as the body is sent
+                return super().send(request, timeout)
+
+        sr.azure_token_cache.clear()
+        sr.azure_token_cache.get("key", "westus", lambda: "token")
+        recognizer = sr.Recognizer()
+        recognizer.http_transport = StreamingTransport([response])
+        result = getattr(recognizer, "recognize_" + name)(self.chunks(), **kwargs)
+        return result, recognizer.http_transport.body, recognizer.http_transport.produced_when_sent
+
+    def assertStreamedLike(self, body, wav_data):
+        with wave.open(io.BytesIO(body), "rb") as streamed, wave.open(io.BytesIO(wav_data), "rb") as expected:
+            self.assertEqual((streamed.getframerate(), streamed.getsampwidth()), (expected.getframerate(), expected.getsampwidth()))
+            streamed_frames, expected_frames = streamed.readframes(len(body)), expected.readframes(expected.getnframes())
+        self.assertEqual(len(streamed_frames), len(expected_frames))
+        self.assertLessEqual(max(abs(a - b) for a, b in zip(memoryview(streamed_frames).cast("h"), memoryview(expected_frames).cast("h"))), 1)
+
+    def test_wit(self):
+        result, body, produced_when_sent = self.recognize_streamed("wit", b'{"_text": "one two three"}', key="key")
+
+        self.assertEqual(result, "one two three")
+        self.assertEqual(produced_when_sent, 1)
+        self.assertStreamedLike(body, sr.Recognizer._wit_request(self.audio, "key").data)
+
+    def test_azure(self):
+        response = json.dumps({"RecognitionStatus": "Success", "NBest": [{"Display": "One two three.", "Confidence": 0.9}]}).encode("utf-8")
+        result, body, produced_when_sent = self.recognize_streamed("azure", response, key="key")
+
+        self.assertEqual(result, ("One two three.", 0.9))
+        self.assertEqual(produced_when_sent, 1)
+        self.assertStreamedLike(body, sr.Recognizer._azure_request(self.audio, "token", "en-US", "masked", "westus").data.read())
+
+    def test_houndify(self):
+        response = json.dumps({"Disambiguation": {"ChoiceData": [{"Transcription": "one two three", "ConfidenceScore": 0.8}]}}).encode("utf-8")
+        result, body, produced_when_sent = self.recognize_streamed("houndify", response, client_id="id", client_key="a2V5")
+
+        self.assertEqual(result, ("one two three", 0.8))
+        self.assertEqual(produced_when_sent, 1)
+        self.assertStreamedLike(body, sr.Recognizer._houndify_request(self.audio, "id", "a2V5").data)
+
+    def test_requests_are_chunked(self):
+        for request in (sr.Recognizer._wit_request(self.chunks(), "key"), sr.Recognizer._azure_request(self.chunks(), "token", "en-US", "masked", "westus"), sr.Recognizer._houndify_request(self.chunks(), "id", "a2V5")):
+            self.assertEqual(request.get_header("Transfer-encoding"), "chunked")
+            self.assertNotIsInstance(request.data, bytes)
+
+    def test_async_versions_take_audio_data_only(self):
+        with self.assertRaises(AssertionError):
+            asyncio.run(sr.Recognizer().recognize_wit_async(self.chunks(), key="key"))
+
+
 if __name__ == "__main__":
     unittest.main()
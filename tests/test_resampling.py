@@ -0,0 +1,110 @@
+import sys
+import unittest
+from unittest import mock
+
+from speech_recognition import resampling
+
+
+class TestResampleRaw(unittest.TestCase):
+    def test_falls_back_to_ratecv_without_numpy(self):
+        raw_data = b"\x00\x01\x00\x02\x00\x03\x00\x04"
+
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            actual = resampling.resample_raw(raw_data, 2, 16000, 8000)
+
+        self.assertEqual(actual, resampling.audioop.ratecv(raw_data, 2, 1, 16000, 8000, None)[0])
+
+    def test_falls_back_to_ratecv_for_large_conversion_factors(self):
+        with mock.patch.object(resampling.audioop, "ratecv", return_value=(b"", None)) as ratecv:
+            resampling.resample_raw(b"\x00\x00" * 100, 2, 44100, 44101)
+
+        ratecv.assert_called_once_with(b"\x00\x00" * 100, 2, 1, 44100, 44101, None)
+
+    def test_same_rate_returns_bytes(self):
+        self.assertEqual(resampling.resample_raw(memoryview(b"\x01\x02"), 2, 16000, 16000), b"\x01\x02")
+
+    def test_chunks_match_one_shot(self):
+        raw_data = bytes(range(256)) * 40
+        for numpy_module in ({}, {"numpy": None}):
+            with self.subTest(numpy=not numpy_module), mock.patch.dict(sys.modules, numpy_module):
+                expected = resampling.resample_raw(raw_data, 2, 44100, 16000)
+
+                resampler = resampling.RawResampler(2, 44100, 16000)
+                chunks = [resampler.process(raw_data[start:end]) for start, end in ((0, 2), (2, 4000), (4000, 10240))]
+                chunks.append(resampler.process(b"", final=True))
+
+                self.assertEqual(len(b"".join(chunks)), len(expected))
+                self.assertLessEqual(max(abs(a - b) for a, b in zip(memoryview(b"".join(chunks)).cast("h"), memoryview(expected).cast("h"))), 1)
+
+
+class TestPolyphaseResampler(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise unittest.SkipTest("resampler tests require numpy")
+        self.np = np
+
+    def tone(self, frequency, sample_rate, seconds=1.0):
+        np = self.np
+        return 10000 * np.sin(2 * np.pi * frequency * np.arange(int(sample_rate * seconds)) / sample_rate)
+
+    def test_preserves_tones_below_the_cutoff(self):
+        np = self.np
+        for from_rate, to_rate in ((44100, 16000), (48000, 16000), (8000, 16000), (16000, 44100)):
+            actual = resampling.PolyphaseResampler(from_rate, to_rate).resample(self.tone(440, from_rate))
+
+            self.assertEqual(len(actual), to_rate)
+            expected = self.tone(440, to_rate)
+            self.assertLess(np.abs(actual - expected)[100:-100].max(), 20)
+
+    def test_suppresses_aliasing(self):
+        np = self.np
+        actual = resampling.PolyphaseResampler(44100, 8000).resample(self.tone(5000, 44100))  # above the 4 kHz Nyquist frequency of the output
+
+        self.assertLess(np.sqrt(np.mean(actual[100:-100] ** 2)), 50)
+
+    def test_streaming_matches_one_shot(self):
+        np = self.np
+        samples = np.random.default_rng(0).standard_normal(20000) * 1000
+        for from_rate, to_rate in ((44100, 16000), (48000, 16000), (8000, 16000)):
+            expected = resampling.PolyphaseResampler(from_rate, to_rate).resample(samples)
+
+            resampler = resampling.PolyphaseResampler(from_rate, to_rate)
+            chunks = []
+            for start, end in ((0, 1), (1, 5000), (5000, 5001), (5001, 20000)):
+                chunks.append(resampler.process(samples[start:end]))
+            chunks.append(resampler.process(samples[:0], final=True))
+
+            np.testing.assert_allclose(np.concatenate(chunks), expected, atol=1e-6)
+
+    def test_single_precision_matches_double_precision(self):
+        np = self.np
+        samples = np.random.default_rng(0).standard_normal(20000) * 1000
+
+        single = resampling.PolyphaseResampler(48000, 16000, "float32").resample(samples)
+        double = resampling.PolyphaseResampler(48000, 16000).resample(samples)
+
+        self.assertEqual(single.dtype, np.float32)
+        np.testing.assert_allclose(single, double, atol=1e-2)
+
+    def test_filter_banks_are_cached_per_conversion_factor(self):
+        self.assertIs(
+            resampling.PolyphaseResampler(44100, 16000)._bank,
+            resampling.PolyphaseResampler(88200, 32000)._bank,
+        )
+
+    def test_round_trips_every_sample_width(self):
+        np = self.np
+        for sample_width in (1, 2, 3, 4):
+            limit = 1 << (8 * sample_width - 1)
+            samples = np.array([0, 1, -1, limit - 1, -limit])
+
+            raw_data = resampling.encode_samples(np, samples, sample_width)
+
+            self.assertEqual(len(raw_data), len(samples) * sample_width)
+            np.testing.assert_array_equal(resampling.decode_samples(np, raw_data, sample_width), samples)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import struct
+import sys
+import unittest
+from unittest import mock
+
+import speech_recognition as sr
+from speech_recognition import vad
+from speech_recognition.exceptions import SetupError
+
+SAMPLE_RATE = 16000
+
+
+def constant_frame(amplitude, samples=320):
+    """Returns a 16-bit square wave frame with an RMS energy of ``amplitude``."""
+    return struct.pack("<{}h".format(samples), *(amplitude if i % 2 else -amplitude for i in range(samples)))
+
+
+class TestEnergyDetector(unittest.TestCase):
+    def test_hysteresis(self):
+        detector = vad.EnergyDetector(start_threshold=300, stop_threshold=100, dynamic=False)
+
+        self.assertFalse(detector.is_speech(constant_frame(200), 2, SAMPLE_RATE, False))
+        self.assertTrue(detector.is_speech(constant_frame(400), 2, SAMPLE_RATE, False))
+        self.assertTrue(detector.is_speech(constant_frame(200), 2, SAMPLE_RATE, True))
+        self.assertFalse(detector.is_speech(constant_frame(50), 2, SAMPLE_RATE, True))
+
+    def test_dynamic_thresholds_keep_their_ratio(self):
+        detector = vad.EnergyDetector(start_threshold=300, stop_threshold=150)
+        for _ in range(500):
+            self.assertFalse(detector.is_speech(constant_frame(100), 2, SAMPLE_RATE, False))
+
+        self.assertAlmostEqual(detector.start_threshold, 150, delta=1)  # 1.5 times the noise energy
+        self.assertAlmostEqual(detector.stop_threshold, detector.start_threshold / 2)
+
+        detector.is_speech(constant_frame(50), 2, SAMPLE_RATE, True)
+        self.assertAlmostEqual(detector.stop_threshold, detector.start_threshold / 2)  # not adapted within phrases
+
+    def test_adjust_for_ambient_noise(self):
+        detector = vad.EnergyDetector(dynamic=False)
+        for _ in range(500):
+            detector.adjust_for_ambient_noise(constant_frame(1000), 2, SAMPLE_RATE)
+
+        self.assertAlmostEqual(detector.start_threshold, 1500, delta=1)
+
+    def test_unsigned_8_bit_samples(self):
+        detector = vad.EnergyDetector(start_threshold=10, dynamic=False)
+
+        self.assertFalse(detector.is_speech(bytes([128] * 320), 1, SAMPLE_RATE, False))
+        self.assertTrue(detector.is_speech(bytes([108, 148] * 160), 1, SAMPLE_RATE, False))
+
+
+class TestSpectralDetector(unittest.TestCase):
+    def setUp(self):
+        try:
+            import numpy as np
+        except ImportError:
+            raise unittest.SkipTest("the spectral detector requires numpy")
+
+        # quiet noise, with speech-like sound (a voiced sound with a varying pitch, in syllables), a burst of hiss, more speech, and hum
+        rng = np.random.default_rng(1)
+        samples = rng.normal(0, 30, 20 * SAMPLE_RATE)
+        for start, end in ((2, 4), (10, 12.5)):
+            t = np.arange(int((end - start) * SAMPLE_RATE)) / SAMPLE_RATE
+            phase = 2 * np.pi * np.cumsum(140 + 30 * np.sin(2 * np.pi * 1.3 * t)) / SAMPLE_RATE
+            voiced = sum(np.sin(harmonic * phase) / harmonic for harmonic in range(1, 20))
+            samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)] += 3000 * voiced * np.sqrt(np.clip(np.sin(2 * np.pi * 4 * t), 0, None))
+        samples[6 * SAMPLE_RATE:8 * SAMPLE_RATE] += rng.normal(0, 3000, 2 * SAMPLE_RATE)
+        t = np.arange(3 * SAMPLE_RATE) / SAMPLE_RATE
+        samples[14 * SAMPLE_RATE:17 * SAMPLE_RATE] += 3000 * np.sin(2 * np.pi * 60 * t) + 1500 * np.sin(2 * np.pi * 120 * t)
+        self.audio = sr.AudioData(np.clip(samples, -32768, 32767).astype("<i2").tobytes(), SAMPLE_RATE, 2)
+
+        self.recognizer = sr.Recognizer()
+        self.recognizer.frame_duration = 0.02
+
+    def assertPhrasesAround(self, phrases, sections):
+        self.assertEqual(len(phrases), len(sections), phrases)
+        for (start, end), (section_start, section_end) in zip(phrases, sections):
+            self.assertLessEqual(start, section_start)
+            self.assertGreaterEqual(end, section_end - 0.3)
+
+    def test_rejects_noise_that_energy_detection_accepts(self):
+        self.assertPhrasesAround(self.recognizer.segment(self.audio), [(2, 4), (6, 7), (10, 12.5), (14, 15)])
+
+        self.recognizer.voice_activity_detector = vad.SpectralDetector()
+        self.assertPhrasesAround(self.recognizer.segment(self.audio), [(2, 4), (10, 12.5)])
+
+    def test_listen(self):
+        self.recognizer.voice_activity_detector = vad.SpectralDetector()
+        source = mock.Mock(spec=sr.AudioSource, SAMPLE_RATE=SAMPLE_RATE, SAMPLE_WIDTH=2, CHUNK=4096)
+        source.stream = mock.Mock(spec=["read"])
+        source.stream.read.side_effect = [self.audio.frame_data[i:i + 8192] for i in range(0, len(self.audio.frame_data), 8192)] + [b""]
+
+        first, second = self.recognizer.listen(source), self.recognizer.listen(source)
+        for audio, (section_start, section_end) in ((first, (2, 4)), (second, (10, 12.5))):
+            start = self.audio.frame_data.find(audio.frame_data) / 2 / SAMPLE_RATE
+            self.assertLessEqual(start, section_start)
+            self.assertGreaterEqual(start + len(audio.frame_data) / 2 / SAMPLE_RATE, section_end - 0.3)
+
+    def test_requires_numpy(self):
+        with mock.patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaises(SetupError):
+                vad.SpectralDetector()
+
+
+class TestRecognizerUsesDetector(unittest.TestCase):
+    def test_adjust_for_ambient_noise(self):
+        recognizer = sr.Recognizer()
+        recognizer.voice_activity_detector = mock.Mock()
+        source = mock.Mock(spec=sr.AudioSource, SAMPLE_RATE=SAMPLE_RATE, SAMPLE_WIDTH=2, CHUNK=1600)
+        source.stream = mock.Mock(spec=["read"])
+        source.stream.read.return_value = constant_frame(100, 1600)
+
+        recognizer.adjust_for_ambient_noise(source, duration=0.5)
+
+        self.assertEqual(recognizer.voice_activity_detector.adjust_for_ambient_noise.call_args_list, [mock.call(constant_frame(100, 1600), 2, SAMPLE_RATE)] * 5)
+        self.assertEqual(recognizer.energy_threshold, 300)
+
+    def test_listen_passes_phrase_state(self):
+        recognizer = sr.Recognizer()
+        recognizer.pause_threshold = recognizer.non_speaking_duration = recognizer.phrase_threshold = 0.1
+        detector = recognizer.voice_activity_detector = mock.Mock()
+        detector.is_speech.side_effect = [False, True, True, False, False]
+        source = mock.Mock(spec=sr.AudioSource, SAMPLE_RATE=SAMPLE_RATE, SAMPLE_WIDTH=2, CHUNK=1600)
+        source.stream = mock.Mock(spec=["read"])
+        source.stream.read.side_effect = [constant_frame(i, 1600) for i in range(5)]
+
+        audio = recognizer.listen(source)
+
+        self.assertEqual([c.args[3] for c in detector.is_speech.call_args_list], [False, False, True, True, True])
+        self.assertEqual(audio.frame_data, b"".join(constant_frame(i, 1600) for i in range(1, 4)))  # one buffer kept on either side
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import struct
+import tempfile
+import unittest
+import wave
+from os import path
+
+import speech_recognition as sr
+from speech_recognition import wavfile
+
+
+class TestMappedWavReader(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix=".wav")
+        os.close(handle)
+        self.addCleanup(os.remove, self.filename)
+
+    def write_wav(self, frames, sample_width=2, channels=1, sample_rate=1000):
+        writer = wave.open(self.filename, "wb")
+        writer.setnchannels(channels)
+        writer.setsampwidth(sample_width)
+        writer.setframerate(sample_rate)
+        writer.writeframes(frames)
+        writer.close()
+
+    def open(self):
+        reader = wavfile.MappedWavReader(self.filename)
+        self.addCleanup(reader.close)
+        return reader
+
+    def test_matches_wave_module(self):
+        for name in ("audio-mono-8-bit-44100Hz.wav", "audio-stereo-24-bit-44100Hz.wav", "audio-mono-32-bit-44100Hz.wav"):
+            filename = path.join(path.dirname(path.realpath(__file__)), name)
+            with wave.open(filename, "rb") as expected:
+                reader = wavfile.MappedWavReader(filename)
+                try:
+                    self.assertEqual(
+                        (reader.getnchannels(), reader.getsampwidth(), reader.getframerate(), reader.getnframes()),
+                        (expected.getnchannels(), expected.getsampwidth(), expected.getframerate(), expected.getnframes()),
+                    )
+                    self.assertEqual(bytes(reader.readframes(1000)), expected.readframes(1000))
+                    self.assertEqual(bytes(reader.readframes(-1)), expected.readframes(expected.getnframes()))
+                    self.assertEqual(len(reader.readframes(1000)), 0)
+                finally:
+                    reader.close()
+
+    def test_readframes_returns_views(self):
+        self.write_wav(bytes(range(20)))
+        reader = self.open()
+
+        frames = reader.readframes(3)
+        self.assertIsInstance(frames, memoryview)
+        self.assertEqual(bytes(frames), bytes(range(6)))
+        self.assertEqual(reader.tell(), 3)
+
+    def test_seek_and_get_segment(self):
+        self.write_wav(b"".join(struct.pack("<h", i) for i in range(2000)))  # 2 seconds at 1000 Hz
+        reader = self.open()
+
+        reader.seek_seconds(1.5)
+        self.assertEqual(reader.tell(), 1500)
+        self.assertEqual(struct.unpack("<h", reader.readframes(1))[0], 1500)
+        reader.seek_seconds(10)
+        self.assertEqual(reader.tell(), 2000)
+
+        segment = reader.get_segment(250, 260)
+        self.assertIsInstance(segment, sr.AudioData)
+        self.assertIsInstance(segment.frame_data, memoryview)
+        self.assertEqual(segment.get_raw_data(), b"".join(struct.pack("<h", i) for i in range(250, 260)))
+        self.assertEqual(reader.tell(), 2000)  # not affected by ``get_segment``
+
+    def test_get_segment_downmixes_stereo(self):
+        self.write_wav(struct.pack("<4h", 100, 300, -100, -300), channels=2)
+
+        self.assertEqual(self.open().get_segment().get_raw_data(), struct.pack("<2h", 400, -400))  # channels are summed, as in ``AudioFile``
+
+    def test_close_with_views_in_use(self):
+        self.write_wav(bytes(range(20)))
+        reader = wavfile.MappedWavReader(self.filename)
+        frames = reader.readframes(2)
+        segment = reader.get_segment()
+
+        reader.close()
+        reader.close()
+        self.assertEqual(bytes(frames), bytes(range(4)))
+        self.assertEqual(segment.get_raw_data(), bytes(range(20)))
+
+    def test_extensible_format_and_unset_data_size(self):
+        fmt = struct.pack("<HHIIHHHHIH14s", wavfile.WAVE_FORMAT_EXTENSIBLE, 1, 8000, 16000, 2, 16, 22, 16, 4, wavfile.WAVE_FORMAT_PCM, b"\x00\x00\x00\x00\x10\x00\x80\x00\x00\xaa\x00\x38\x9b\x71")
+        frames = struct.pack("<3h", 1, 2, 3)
+        with open(self.filename, "wb") as f:
+            f.write(b"RIFF" + struct.pack("<I", 0) + b"WAVE")
+            f.write(b"fmt " + struct.pack("<I", len(fmt)) + fmt)
+            f.write(b"data" + struct.pack("<I", 0xFFFFFFFF) + frames)
+        reader = self.open()
+
+        self.assertEqual((reader.getframerate(), reader.getsampwidth(), reader.getnframes()), (8000, 2, 3))
+        self.assertEqual(bytes(reader.readframes(-1)), frames)
+
+    def test_open_reader_rejects_other_files(self):
+        for contents in (b"", b"FORM\x00\x00\x00\x04AIFF", b"RIFF\x04\x00\x00\x00WAVE"):
+            with open(self.filename, "wb") as f:
+                f.write(contents)
+            self.assertIsNone(wavfile.open_reader(self.filename))
+
+
+class TestAudioFileMappedWav(unittest.TestCase):
+    def test_wav_paths_are_memory_mapped(self):
+        filename = path.join(path.dirname(path.realpath(__file__)), "audio-stereo-16-bit-44100Hz.wav")
+        with sr.AudioFile(filename) as source:
+            self.assertIsInstance(source.audio_reader, wavfile.MappedWavReader)
+            audio = sr.Recognizer().record(source)
+        with open(filename, "rb") as f, sr.AudioFile(f) as source:
+            self.assertIsInstance(source.audio_reader, wave.Wave_read)
+            self.assertEqual(sr.Recognizer().record(source).get_raw_data(), audio.get_raw_data())
+
+
+if __name__ == "__main__":
+    unittest.main()